@@ -18,6 +18,10 @@
 """Pytest configuration."""
 import importlib
 
+BENCHMARK_FIXTURE_LOCATIONS = [
+    "tests.benchmarks.fixtures.benchmark_projects",
+]
+
 CLI_FIXTURE_LOCATIONS = [
     "tests.cli.fixtures.cli_gateway",
     "tests.cli.fixtures.cli_kg",
@@ -58,7 +62,13 @@ SERVICE_FIXTURE_LOCATIONS = [
     "tests.service.fixtures.service_scheduler",
 ]
 
-INCLUDE_FIXTURES = GLOBAL_FIXTURE_LOCATIONS + CORE_FIXTURE_LOCATIONS + CLI_FIXTURE_LOCATIONS + SERVICE_FIXTURE_LOCATIONS
+INCLUDE_FIXTURES = (
+    GLOBAL_FIXTURE_LOCATIONS
+    + CORE_FIXTURE_LOCATIONS
+    + CLI_FIXTURE_LOCATIONS
+    + SERVICE_FIXTURE_LOCATIONS
+    + BENCHMARK_FIXTURE_LOCATIONS
+)
 
 
 for _fixture in INCLUDE_FIXTURES:
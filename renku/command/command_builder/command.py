@@ -26,6 +26,7 @@ from typing import Any, Callable, Dict, List, Optional
 import click
 import inject
 
+from renku.command.command_builder.profiler import CommandProfiler, measure
 from renku.core import errors
 from renku.core.util.communication import CommunicationCallback
 from renku.core.util.git import default_path
@@ -153,6 +154,21 @@ def update_injected_client(new_client, update_database: bool = True):
         injector._bindings[Database] = lambda: database
 
 
+def _invalidate_repository_status(context: dict):
+    """Discard the working tree status snapshot of the current client's repository.
+
+    Args:
+        context(dict): Current context dictionary.
+    """
+    try:
+        repository = context["client_dispatcher"].current_client.repository
+    except (KeyError, errors.ConfigurationError):
+        return
+
+    if repository is not None:
+        repository.invalidate_status()
+
+
 class Command:
     """Base renku command builder."""
 
@@ -239,64 +255,80 @@ class Command:
         It then calls the wrapped `operation`. The result of the operation then gets pass to all the `post_hooks`,
         but in descending `order`. It then returns the result or error if there was one.
 
+        If a profile directory is set with ``renku --profile`` or the ``RENKU_PROFILE`` environment variable, the
+        duration of each hook and of the operation and a ``cProfile`` profile of the execution are written to files
+        named after the operation in that directory.
+
         Returns:
             CommandResult: Result of execution of command.
         """
         if not self.finalized:
             raise errors.CommandNotFinalizedError("Call `build()` before executing a command")
 
-        context: Dict[str, Any] = {}
-        if any(self.injection_pre_hooks):
-            order = sorted(self.injection_pre_hooks.keys())
-
-            for o in order:
-                for hook in self.injection_pre_hooks[o]:
-                    hook(self, context, *args, **kwargs)
-
-        def _bind(binder):
-            for key, value in context["bindings"].items():
-                binder.bind(key, value)
-            for key, value in context["constructor_bindings"].items():
-                binder.bind_to_constructor(key, value)
-
-            return binder
-
-        inject.configure(_bind, bind_in_runtime=False)
-
-        if any(self.pre_hooks):
-            order = sorted(self.pre_hooks.keys())
-
-            for o in order:
-                for hook in self.pre_hooks[o]:
-                    try:
-                        hook(self, context, *args, **kwargs)
-                    except (Exception, BaseException):
-                        # don't leak injections from failed hook
-                        remove_injector()
-                        raise
-
-        output = None
-        error = None
-
-        try:
-            with context["stack"]:
-                output = context["click_context"].invoke(self._operation, *args, **kwargs)
-        except errors.RenkuException as e:
-            error = e
-        except (Exception, BaseException):
-            remove_injector()
-            raise
+        profiler = CommandProfiler.from_settings(self._operation)
+
+        with profiler or contextlib.nullcontext():
+            context: Dict[str, Any] = {}
+            if any(self.injection_pre_hooks):
+                order = sorted(self.injection_pre_hooks.keys())
+
+                for o in order:
+                    for hook in self.injection_pre_hooks[o]:
+                        with measure(profiler, "injection", hook):
+                            hook(self, context, *args, **kwargs)
 
-        result = CommandResult(output, error, CommandResult.FAILURE if error else CommandResult.SUCCESS)
+            def _bind(binder):
+                for key, value in context["bindings"].items():
+                    binder.bind(key, value)
+                for key, value in context["constructor_bindings"].items():
+                    binder.bind_to_constructor(key, value)
 
-        if any(self.post_hooks):
-            order = sorted(self.post_hooks.keys(), reverse=True)
+                return binder
 
-            for o in order:
-                for hook in self.post_hooks[o]:
-                    hook(self, context, result, *args, **kwargs)
+            with measure(profiler, "injection", "inject.configure"):
+                inject.configure(_bind, bind_in_runtime=False)
 
-        return result
+            if any(self.pre_hooks):
+                order = sorted(self.pre_hooks.keys())
+
+                for o in order:
+                    for hook in self.pre_hooks[o]:
+                        try:
+                            with measure(profiler, "pre-hooks", hook):
+                                hook(self, context, *args, **kwargs)
+                        except (Exception, BaseException):
+                            # don't leak injections from failed hook
+                            remove_injector()
+                            raise
+
+            output = None
+            error = None
+
+            # NOTE: Pre-hooks share a snapshot of the working tree status which is invalid once the operation runs
+            _invalidate_repository_status(context)
+
+            try:
+                with context["stack"], measure(profiler, "operation", self._operation):
+                    output = context["click_context"].invoke(self._operation, *args, **kwargs)
+            except errors.RenkuException as e:
+                error = e
+            except (Exception, BaseException):
+                remove_injector()
+                raise
+
+            _invalidate_repository_status(context)
+
+            result = CommandResult(output, error, CommandResult.FAILURE if error else CommandResult.SUCCESS)
+
+            if any(self.post_hooks):
+                order = sorted(self.post_hooks.keys(), reverse=True)
+
+                for o in order:
+                    for hook in self.post_hooks[o]:
+                        with measure(profiler, "post-hooks", hook):
+                            hook(self, context, result, *args, **kwargs)
+
+            return result
 
     @property
     def finalized(self) -> bool:
@@ -468,17 +500,21 @@ class Command:
         return Communicator(self, communicator)
 
     @check_finalized
-    def with_database(self, write: bool = False, path: str = None, create: bool = False) -> "Command":
+    def with_database(
+        self, write: bool = False, path: str = None, create: bool = False, revision: str = None
+    ) -> "Command":
         """Provide an object database connection.
 
         Args:
             write(bool, optional): Whether or not to persist changes to the database (Default value = False).
             path(str, optional): Location of the database (Default value = None).
             create(bool, optional): Whether the database should be created if it doesn't exist (Default value = False).
+            revision(str, optional): Open a read-only database with the state of a git revision instead of the
+                working tree (Default value = None).
         """
         from renku.command.command_builder.database import DatabaseCommand
 
-        return DatabaseCommand(self, write, path, create)
+        return DatabaseCommand(self, write, path, create, revision)
 
 
 class CommandResult:
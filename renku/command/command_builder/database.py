@@ -17,6 +17,8 @@
 # limitations under the License.
 """Command builder for local object database."""
 
+import json
+import os
 
 from renku.command.command_builder.command import Command, CommandResult, check_finalized
 from renku.command.command_builder.database_dispatcher import DatabaseDispatcher
@@ -26,12 +28,17 @@ from renku.core.interface.database_gateway import IDatabaseGateway
 from renku.core.interface.dataset_gateway import IDatasetGateway
 from renku.core.interface.plan_gateway import IPlanGateway
 from renku.core.interface.project_gateway import IProjectGateway
+from renku.core.util import communication
+from renku.infrastructure.database import Statistics
 from renku.infrastructure.gateway.activity_gateway import ActivityGateway
 from renku.infrastructure.gateway.database_gateway import DatabaseGateway
 from renku.infrastructure.gateway.dataset_gateway import DatasetGateway
 from renku.infrastructure.gateway.plan_gateway import PlanGateway
 from renku.infrastructure.gateway.project_gateway import ProjectGateway
 
+DATABASE_STATISTICS_ENVIRONMENT_VARIABLE = "RENKU_DATABASE_STATS"
+DATABASE_STATISTICS_META_KEY = "renku.database_statistics"
+
 
 class DatabaseCommand(Command):
     """Builder to get a database connection."""
@@ -39,11 +46,14 @@ class DatabaseCommand(Command):
     PRE_ORDER = 4
     POST_ORDER = 5
 
-    def __init__(self, builder: Command, write: bool = False, path: str = None, create: bool = False) -> None:
+    def __init__(
+        self, builder: Command, write: bool = False, path: str = None, create: bool = False, revision: str = None
+    ) -> None:
         self._builder = builder
         self._write = write
         self._path = path
         self._create = create
+        self._revision = revision
 
     def _injection_pre_hook(self, builder: Command, context: dict, *args, **kwargs) -> None:
         """Create a Database singleton."""
@@ -53,7 +63,12 @@ class DatabaseCommand(Command):
         client = context["client_dispatcher"].current_client
 
         self.dispatcher = DatabaseDispatcher()
-        self.dispatcher.push_database_to_stack(path=self._path or client.database_path, commit=self._write)
+        self.dispatcher.push_database_to_stack(
+            path=self._path or client.database_path,
+            commit=self._write,
+            revision=self._revision,
+            repository=client.repository if self._revision else None,
+        )
 
         context["bindings"][IDatabaseDispatcher] = self.dispatcher
 
@@ -64,8 +79,20 @@ class DatabaseCommand(Command):
         context["constructor_bindings"][IProjectGateway] = lambda: ProjectGateway()
 
     def _post_hook(self, builder: Command, context: dict, result: CommandResult, *args, **kwargs) -> None:
+        databases = [database for database, _ in self.dispatcher.database_stack]
+
         self.dispatcher.finalize_dispatcher()
 
+        # NOTE: Set for a single CLI invocation by the ``--stats`` option
+        report_format = context["click_context"].meta.get(DATABASE_STATISTICS_META_KEY) or os.environ.get(
+            DATABASE_STATISTICS_ENVIRONMENT_VARIABLE
+        )
+        if report_format:
+            statistics = Statistics()
+            for database in databases:
+                statistics.update(database.statistics)
+            _report_statistics(statistics, report_format)
+
     @check_finalized
     def build(self) -> Command:
         """Build the command."""
@@ -73,3 +100,16 @@ class DatabaseCommand(Command):
         self._builder.add_post_hook(self.POST_ORDER, self._post_hook)
 
         return self._builder.build()
+
+
+def _report_statistics(statistics: Statistics, report_format: str):
+    """Write database statistics to the error stream so that they don't mix with a command's output.
+
+    Args:
+        statistics(Statistics): The statistics to write.
+        report_format(str): Write statistics as JSON if ``json``, otherwise as text.
+    """
+    if report_format.lower() == "json":
+        communication.echo(json.dumps(statistics.as_dict()), err=True)
+    else:
+        communication.echo(f"Database statistics:\n{statistics.format()}", err=True)
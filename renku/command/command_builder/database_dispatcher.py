@@ -17,12 +17,15 @@
 # limitations under the License.
 """Renku database dispatcher."""
 from pathlib import Path
-from typing import Union
+from typing import TYPE_CHECKING, Optional, Union
 
 from renku.core import errors
 from renku.core.interface.database_dispatcher import IDatabaseDispatcher
 from renku.infrastructure.database import Database
 
+if TYPE_CHECKING:
+    from renku.infrastructure.repository import Repository
+
 
 class DatabaseDispatcher(IDatabaseDispatcher):
     """Interface for the DatabaseDispatcher.
@@ -41,9 +44,22 @@ class DatabaseDispatcher(IDatabaseDispatcher):
 
         return self.database_stack[-1][0]
 
-    def push_database_to_stack(self, path: Union[Path, str], commit: bool = False) -> None:
+    def push_database_to_stack(
+        self,
+        path: Union[Path, str],
+        commit: bool = False,
+        revision: Optional[str] = None,
+        repository: Optional["Repository"] = None,
+    ) -> None:
         """Create and push a new client to the stack."""
-        new_database = Database.from_path(path)
+        if revision is None:
+            new_database = Database.from_path(path)
+        else:
+            if commit:
+                raise errors.OperationError("Cannot write to the database of a git revision.")
+            assert repository is not None, "A repository is needed to open a database from a revision."
+            new_database = Database.from_revision(path, repository=repository, revision=revision)
+
         self.database_stack.append((new_database, commit))
 
     def pop_database(self) -> None:
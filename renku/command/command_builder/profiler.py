@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018-2022 - Swiss Data Science Center (SDSC)
+# A partnership between École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Profiling of command executions."""
+
+import contextlib
+import cProfile
+import json
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import click
+
+PROFILE_ENVIRONMENT_VARIABLE = "RENKU_PROFILE"
+PROFILE_META_KEY = "renku.profile"
+
+_LOCAL = threading.local()
+
+
+class CommandProfiler:
+    """Collect timings of the phases of a command execution and a ``cProfile`` profile of the whole execution.
+
+    Only the outermost command of a thread is profiled with ``cProfile`` since profilers cannot be nested; timings are
+    collected for nested commands as well.
+    """
+
+    def __init__(self, name: str, output_directory: Path) -> None:
+        self.name: str = re.sub(r"[^\w.-]", "", name).strip("_") or "command"
+        self.output_directory: Path = output_directory
+        self.timings: List[Dict[str, Any]] = []
+        self._profile: Optional[cProfile.Profile] = None
+        self._start: float = 0.0
+
+    @classmethod
+    def from_settings(cls, operation: Optional[Callable]) -> Optional["CommandProfiler"]:
+        """Return a profiler if profiling is enabled for the current CLI invocation or through ``RENKU_PROFILE``.
+
+        Args:
+            operation(Optional[Callable]): The operation of the command, its name is used for the output files.
+
+        Returns:
+            Optional[CommandProfiler]: A profiler writing to the configured directory or None if profiling is disabled.
+        """
+        # NOTE: Set for a single CLI invocation by the ``--profile`` option
+        ctx = click.get_current_context(silent=True)
+        output_directory = (ctx.meta.get(PROFILE_META_KEY) if ctx else None) or os.environ.get(
+            PROFILE_ENVIRONMENT_VARIABLE
+        )
+        if not output_directory:
+            return None
+
+        return cls(name=getattr(operation, "__name__", ""), output_directory=Path(output_directory))
+
+    def __enter__(self) -> "CommandProfiler":
+        if not getattr(_LOCAL, "profiling", False):
+            _LOCAL.profiling = True
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+
+        self._start = time.perf_counter()
+
+        return self
+
+    def __exit__(self, *_) -> None:
+        total = time.perf_counter() - self._start
+
+        if self._profile is not None:
+            self._profile.disable()
+            _LOCAL.profiling = False
+
+        self._write(total)
+
+    @contextlib.contextmanager
+    def measure(self, phase: str, hook: Union[Callable, str]):
+        """Record the duration of a step of the command execution.
+
+        Args:
+            phase(str): The phase that the step belongs to.
+            hook(Union[Callable, str]): The hook or operation that is executed or a description of the step.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings.append(
+                {
+                    "phase": phase,
+                    "name": hook if isinstance(hook, str) else getattr(hook, "__qualname__", repr(hook)),
+                    "duration": time.perf_counter() - start,
+                }
+            )
+
+    def _write(self, total: float) -> None:
+        """Write the timings and the profile to the output directory."""
+        self.output_directory.mkdir(parents=True, exist_ok=True)
+        prefix = self.output_directory / f"{self.name}-{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}"
+
+        phases: Dict[str, float] = defaultdict(float)
+        for timing in self.timings:
+            phases[timing["phase"]] += timing["duration"]
+
+        report = {"command": self.name, "duration": total, "phases": phases, "steps": self.timings}
+        Path(f"{prefix}.json").write_text(json.dumps(report, indent=2))
+
+        if self._profile is not None:
+            self._profile.dump_stats(f"{prefix}.prof")
+
+
+def measure(profiler: Optional[CommandProfiler], phase: str, hook: Union[Callable, str]):
+    """Return a context manager that records the duration of a step if profiling is enabled.
+
+    Args:
+        profiler(Optional[CommandProfiler]): The profiler of the command or None if profiling is disabled.
+        phase(str): The phase that the step belongs to.
+        hook(Union[Callable, str]): The hook or operation that is executed or a description of the step.
+
+    Returns:
+        A context manager that measures the duration of its body.
+    """
+    if profiler is None:
+        return contextlib.nullcontext()
+
+    return profiler.measure(phase, hook)
@@ -18,7 +18,7 @@
 """Knowledge graph building."""
 
 import json
-from typing import Dict, List, Set, Union
+from typing import Dict, List, Optional, Set, Union
 
 from renku.command.command_builder.command import Command, inject
 from renku.command.schema.activity import ActivitySchema
@@ -34,6 +34,7 @@ from renku.core.interface.database_gateway import IDatabaseGateway
 from renku.core.interface.dataset_gateway import IDatasetGateway
 from renku.core.interface.plan_gateway import IPlanGateway
 from renku.core.interface.project_gateway import IProjectGateway
+from renku.core.management.repository import DATABASE_METADATA_PATH
 from renku.core.util.shacl import validate_graph
 from renku.core.util.urls import get_host
 from renku.domain_model.dataset import Dataset, DatasetTag
@@ -41,6 +42,13 @@ from renku.domain_model.project import Project
 from renku.domain_model.provenance.activity import Activity
 from renku.domain_model.workflow.composite_plan import CompositePlan
 from renku.domain_model.workflow.plan import AbstractPlan, Plan
+from renku.infrastructure.database import (
+    collect_garbage,
+    convert_storage,
+    pack_storage,
+    train_storage_dictionary,
+    unpack_storage,
+)
 
 try:
     import importlib_resources
@@ -48,9 +56,43 @@ except ImportError:
     import importlib.resources as importlib_resources  # type: ignore
 
 
-def export_graph_command():
-    """Return a command for exporting graph data."""
-    return Command().command(_export_graph).with_database(write=False).require_migration()
+def export_graph_command(revision_or_range: Optional[str] = None):
+    """Return a command for exporting graph data.
+
+    Args:
+        revision_or_range(Optional[str]): Revision or range of revisions to export for. Metadata is read from the
+            database of the revision (or of the end of the range) instead of the working tree (Default value = None).
+    """
+    revision = None
+    if revision_or_range:
+        # NOTE: ``A..B`` and ``A...B`` both end at ``B``; an open range like ``A..`` ends at ``HEAD``
+        revision = revision_or_range.split("..")[-1].lstrip(".") or "HEAD"
+
+    return Command().command(_export_graph).with_database(write=False, revision=revision).require_migration()
+
+
+def pack_graph_command():
+    """Return a command for converting metadata storage to/from a packed format."""
+    command = Command().command(_pack_graph).lock_project().require_migration().require_clean().with_database()
+    return command.with_commit(commit_only=DATABASE_METADATA_PATH)
+
+
+def convert_graph_command():
+    """Return a command for re-encoding metadata storage with a different codec."""
+    command = Command().command(_convert_graph).lock_project().require_migration().require_clean().with_database()
+    return command.with_commit(commit_only=DATABASE_METADATA_PATH)
+
+
+def compress_graph_command():
+    """Return a command for compressing metadata storage with a trained dictionary."""
+    command = Command().command(_compress_graph).lock_project().require_migration().require_clean().with_database()
+    return command.with_commit(commit_only=DATABASE_METADATA_PATH)
+
+
+def gc_graph_command():
+    """Return a command for removing unreachable metadata objects."""
+    command = Command().command(_gc_graph).lock_project().require_migration().require_clean().with_database()
+    return command.with_commit(commit_only=DATABASE_METADATA_PATH)
 
 
 @inject.autoparams("client_dispatcher")
@@ -91,6 +133,25 @@ def _export_graph(
     return GraphViewModel(graph)
 
 
+@inject.autoparams("client_dispatcher")
+def _pack_graph(client_dispatcher: IClientDispatcher, unpack: bool = False) -> int:
+    """Move metadata objects into a single pack file or back into separate files.
+
+    Args:
+        client_dispatcher(IClientDispatcher): Injected client dispatcher.
+        unpack(bool, optional): Whether to convert a packed storage back to separate files (Default value = False).
+
+    Returns:
+        Number of converted objects.
+    """
+    database_path = client_dispatcher.current_client.database_path
+
+    if unpack:
+        return unpack_storage(database_path)
+
+    return pack_storage(database_path)
+
+
 def update_nested_node_host(node: Dict, host: str) -> None:
     """Update all @id in a node to include host if necessary.
 
@@ -160,7 +221,9 @@ def _get_graph_for_all_objects(
         List of JSON-LD metadata.
     """
     project = project_gateway.get_project()
-    objects: List[Union[Project, Dataset, DatasetTag, Activity, AbstractPlan]] = activity_gateway.get_all_activities()
+    objects: List[Union[Project, Dataset, DatasetTag, Activity, AbstractPlan]] = activity_gateway.get_all_activities(
+        pin=False
+    )
 
     processed_plans = set()
 
@@ -215,8 +278,9 @@ def _convert_entities_to_graph(
     for entity in entities:
         if entity.id in processed_plans:
             continue
-        if isinstance(entity, (Dataset, Activity, AbstractPlan)):
-            # NOTE: Since the database is read-only, it's OK to modify objects; they won't be written back
+        if isinstance(entity, (Dataset, Activity, AbstractPlan)) and getattr(entity, "project_id", None) != project_id:
+            # NOTE: Since the database is read-only, it's OK to modify objects; they won't be written back. Modified
+            # objects cannot be evicted from the database cache, so only modify them if needed.
             entity.unfreeze()
             entity.project_id = project_id
         schema = next(s for t, s in schemas.items() if isinstance(entity, t))
@@ -261,3 +325,51 @@ def _validate_graph(rdf_graph, format):
 
     if not r:
         raise errors.SHACLValidationError(f"{t}\nCouldn't export: Invalid Knowledge Graph data")
+
+
+@inject.autoparams("client_dispatcher")
+def _convert_graph(client_dispatcher: IClientDispatcher, codec: str) -> int:
+    """Re-encode metadata objects with a codec and use it for new metadata.
+
+    Args:
+        client_dispatcher(IClientDispatcher): Injected client dispatcher.
+        codec(str): Name of the codec to use.
+
+    Returns:
+        Number of converted objects.
+    """
+    return convert_storage(client_dispatcher.current_client.database_path, codec=codec)
+
+
+@inject.autoparams("client_dispatcher")
+def _compress_graph(client_dispatcher: IClientDispatcher, dictionary_size: Optional[int] = None) -> int:
+    """Train a compression dictionary on metadata objects and recompress them with it.
+
+    Args:
+        client_dispatcher(IClientDispatcher): Injected client dispatcher.
+        dictionary_size(Optional[int]): Maximum size of the dictionary in bytes (Default value = None).
+
+    Returns:
+        Number of recompressed objects.
+    """
+    database_path = client_dispatcher.current_client.database_path
+
+    if dictionary_size:
+        return train_storage_dictionary(database_path, dictionary_size=dictionary_size)
+
+    return train_storage_dictionary(database_path)
+
+
+@inject.autoparams("client_dispatcher")
+def _gc_graph(client_dispatcher: IClientDispatcher, dry_run: bool = False, repack: bool = False) -> List[str]:
+    """Remove metadata objects that are not reachable from the metadata root.
+
+    Args:
+        client_dispatcher(IClientDispatcher): Injected client dispatcher.
+        dry_run(bool): Only list unreachable objects without removing them (Default value = False).
+        repack(bool): Rewrite the pack file of packed metadata after removing objects (Default value = False).
+
+    Returns:
+        Names of unreachable objects.
+    """
+    return collect_garbage(client_dispatcher.current_client.database_path, dry_run=dry_run, repack=repack)
@@ -19,7 +19,6 @@
 
 import os
 import sys
-from subprocess import call
 
 import click
 
@@ -32,6 +31,7 @@ from renku.core.interface.client_dispatcher import IClientDispatcher
 from renku.core.interface.plan_gateway import IPlanGateway
 from renku.core.management.git import get_mapped_std_streams
 from renku.core.util.datetime8601 import local_now
+from renku.core.util.os import call_with_resource_usage
 from renku.core.util.urls import get_slug
 from renku.core.workflow.plan_factory import PlanFactory
 from renku.domain_model.provenance.activity import Activity
@@ -173,7 +173,7 @@ def _run_command(
             started_at_time = local_now()
 
             try:
-                return_code = call(
+                return_code, cpu_time, peak_memory = call_with_resource_usage(
                     factory.command_line, cwd=os.getcwd(), **{key: getattr(sys, key) for key in mapped_std.keys()}
                 )
             except FileNotFoundError:
@@ -197,7 +197,13 @@ def _run_command(
 
         plan = tool.to_plan(name=name, description=description, keywords=keyword)
         activity = Activity.from_plan(
-            plan=plan, started_at_time=started_at_time, ended_at_time=ended_at_time, annotations=tool.annotations
+            plan=plan,
+            started_at_time=started_at_time,
+            ended_at_time=ended_at_time,
+            annotations=tool.annotations,
+            exit_code=return_code,
+            cpu_time=cpu_time,
+            peak_memory=peak_memory,
         )
         activity_gateway.add(activity)
 
@@ -48,7 +48,7 @@ def _save_and_push(
     if not paths:
         paths = client.dirty_paths
     else:
-        staged_changes = client.repository.staged_changes
+        staged_changes = client.repository.get_status().staged_changes
         if staged_changes:
             staged_paths = {c.a_path for c in staged_changes}
             not_passed = staged_paths - set(paths)
@@ -147,7 +147,9 @@ class ActivitySchema(JsonLDSchema):
     agents = Nested(prov.wasAssociatedWith, [PersonSchema, SoftwareAgentSchema], many=True)
     annotations = Nested(oa.hasTarget, AnnotationSchema, reverse=True, many=True)
     association = Nested(prov.qualifiedAssociation, AssociationSchema)
+    cpu_time = fields.Float(renku.cpuTime, missing=None)
     ended_at_time = fields.DateTime(prov.endedAtTime, add_value_types=True)
+    exit_code = fields.Integer(renku.exitCode, missing=None)
     generations = Nested(prov.activity, GenerationSchema, reverse=True, many=True, missing=None)
     id = fields.Id()
     invalidations = Nested(prov.wasInvalidatedBy, EntitySchema, reverse=True, many=True, missing=None)
@@ -158,6 +160,7 @@ class ActivitySchema(JsonLDSchema):
         missing=None,
     )
     path = fields.String(prov.atLocation)
+    peak_memory = fields.Integer(renku.peakMemory, missing=None)
     project_id = fields.IRI(renku.hasActivity, reverse=True)
     started_at_time = fields.DateTime(prov.startedAtTime, add_value_types=True)
     usages = Nested(prov.qualifiedUsage, UsageSchema, many=True)
@@ -18,13 +18,13 @@
 """Renku ``status`` command."""
 
 from collections import defaultdict
-from typing import Dict, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from renku.command.command_builder import inject
 from renku.command.command_builder.command import Command
 from renku.core.interface.activity_gateway import IActivityGateway
 from renku.core.interface.client_dispatcher import IClientDispatcher
-from renku.core.util.metadata import filter_overridden_activities, get_modified_activities
+from renku.core.util.metadata import get_latest_modified_activities
 from renku.core.util.os import get_relative_path_to_cwd, get_relative_paths
 from renku.domain_model.entity import Entity
 from renku.domain_model.provenance.activity import Activity
@@ -60,7 +60,9 @@ def _get_status(client_dispatcher: IClientDispatcher, activity_gateway: IActivit
     paths = paths or []
     paths = get_relative_paths(base=client.path, paths=paths)
 
-    modified, deleted = _get_modified_paths(activity_gateway=activity_gateway, repository=client.repository)
+    modified, deleted = _get_modified_paths(
+        activity_gateway=activity_gateway, repository=client.repository, paths=paths
+    )
 
     if not modified and not deleted:
         return None, None, None, None
@@ -92,21 +94,23 @@ def _get_status(client_dispatcher: IClientDispatcher, activity_gateway: IActivit
     return stale_outputs, stale_activities, modified_inputs, deleted
 
 
-def _get_modified_paths(activity_gateway, repository) -> Tuple[Set[Tuple[Activity, Entity]], Set[str]]:
+def _get_modified_paths(
+    activity_gateway, repository, paths: Optional[List[str]] = None
+) -> Tuple[Set[Tuple[Activity, Entity]], Set[str]]:
     """Get modified and deleted usages/inputs of a list of activities.
 
     Args:
         activity_gateway: Activity gateway.
         repository: Current ``Repository``.
+        paths(Optional[List[str]]): Only check activities that use or generate these paths and their upstream
+            activities (Default value = None).
 
     Returns:
         Tuple[Set[Tuple[Activity, Entity]], Set[str]]: Tuple of Activities with their modified paths
             and deleted paths.
     """
-    all_activities = activity_gateway.get_all_activities()
-
-    relevant_activities = filter_overridden_activities(all_activities)
-
-    modified, deleted = get_modified_activities(activities=relevant_activities, repository=repository)
+    modified, deleted = get_latest_modified_activities(
+        activity_gateway=activity_gateway, repository=repository, paths=paths
+    )
 
     return modified, {e.path for _, e in deleted}
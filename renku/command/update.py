@@ -17,7 +17,6 @@
 # limitations under the License.
 """Renku ``update`` command."""
 
-from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
@@ -29,12 +28,11 @@ from renku.core.errors import ParameterError
 from renku.core.interface.activity_gateway import IActivityGateway
 from renku.core.interface.client_dispatcher import IClientDispatcher
 from renku.core.interface.plan_gateway import IPlanGateway
-from renku.core.util.metadata import add_activity_if_recent, filter_overridden_activities, get_modified_activities
+from renku.core.util.metadata import add_activity_if_recent, get_latest_modified_activities
 from renku.core.util.os import get_relative_paths
 from renku.core.workflow.activity import sort_activities
 from renku.core.workflow.concrete_execution_graph import ExecutionGraph
 from renku.domain_model.provenance.activity import Activity
-from renku.domain_model.workflow.plan import AbstractPlan
 
 
 def update_command():
@@ -62,7 +60,7 @@ def _update(
     paths = paths or []
     paths = get_relative_paths(base=client.path, paths=paths)
 
-    modified_activities, modified_paths = _get_modified_activities_and_paths(client.repository, activity_gateway)
+    modified_activities, modified_paths = _get_modified_activities_and_paths(client.repository, activity_gateway, paths)
     activities = _get_downstream_activities(modified_activities, activity_gateway, paths)
 
     if len(activities) == 0:
@@ -107,30 +105,25 @@ def _is_activity_valid(activity: Activity, plan_gateway: IPlanGateway, client_di
     if newest_plan is None or newest_plan.invalidated_at is not None:
         return False
 
-    all_plans = plan_gateway.get_all_plans()
+    return plan_gateway.get_latest_descendant(plan).invalidated_at is None
 
-    derived: Optional[AbstractPlan] = plan
-    while derived:
-        plan = derived
-        derived = next((p for p in all_plans if p.derived_from is not None and p.derived_from == plan.id), None)
 
-    return plan.invalidated_at is None
-
-
-def _get_modified_activities_and_paths(repository, activity_gateway) -> Tuple[Set[Activity], Set[str]]:
+def _get_modified_activities_and_paths(
+    repository, activity_gateway, paths: Optional[List[str]] = None
+) -> Tuple[Set[Activity], Set[str]]:
     """Return latest activities that one of their inputs is modified.
 
     Args:
         repository: The current ``Repository``.
         activity_gateway: The injected Activity gateway.
+        paths(Optional[List[str]]): Only check activities that use or generate these paths and their upstream
+            activities (Default value = None).
 
     Returns:
         Tuple[Set[Activity],Set[str]]: Tuple of modified activites and modified paths.
 
     """
-    all_activities = activity_gateway.get_all_activities()
-    relevant_activities = filter_overridden_activities(all_activities)
-    modified, _ = get_modified_activities(activities=list(relevant_activities), repository=repository)
+    modified, _ = get_latest_modified_activities(activity_gateway=activity_gateway, repository=repository, paths=paths)
     return {a for a, _ in modified if _is_activity_valid(a)}, {e.path for _, e in modified}
 
 
@@ -148,11 +141,10 @@ def _get_downstream_activities(
         Set[Activity]: All activites and their downstream activities.
 
     """
-    all_activities: Dict[str, Set[Activity]] = defaultdict(set)
+    all_activities: Dict[Tuple, Activity] = {}
 
     def include_newest_activity(activity):
-        existing_activities = all_activities[activity.association.plan.id]
-        add_activity_if_recent(activity=activity, activities=existing_activities)
+        add_activity_if_recent(activity=activity, activities=all_activities)
 
     def does_activity_generate_any_paths(activity):
         is_same = any(g.entity.path in paths for g in activity.generations)
@@ -181,4 +173,4 @@ def _get_downstream_activities(
                     break
                 include_newest_activity(activity)
 
-    return list({a for activities in all_activities.values() for a in activities})
+    return list(all_activities.values())
@@ -74,6 +74,9 @@ class ActivityDetailsViewModel:
 
     start_time: str
     end_time: str
+    exit_code: Optional[int] = None
+    cpu_time: Optional[float] = None
+    peak_memory: Optional[int] = None
     renku_version: Optional[str] = None
     user: Optional[str] = None
     inputs: Optional[List[Tuple[str, str]]] = None
@@ -137,7 +140,11 @@ class LogViewModel:
         plan = activity.plan_with_values
 
         details = ActivityDetailsViewModel(
-            start_time=activity.started_at_time.isoformat(), end_time=activity.ended_at_time.isoformat()
+            start_time=activity.started_at_time.isoformat(),
+            end_time=activity.ended_at_time.isoformat(),
+            exit_code=activity.exit_code,
+            cpu_time=activity.cpu_time,
+            peak_memory=activity.peak_memory,
         )
 
         user = next((a for a in activity.agents if isinstance(a, Person)), None)
@@ -24,7 +24,7 @@ from collections import defaultdict
 from datetime import datetime
 from functools import reduce
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union, cast
 
 if TYPE_CHECKING:
     from networkx import DiGraph
@@ -38,6 +38,7 @@ from renku.command.view_model.plan import plan_view
 from renku.core import errors
 from renku.core.interface.activity_gateway import IActivityGateway
 from renku.core.interface.client_dispatcher import IClientDispatcher
+from renku.core.interface.database_gateway import IDatabaseGateway
 from renku.core.interface.plan_gateway import IPlanGateway
 from renku.core.interface.project_gateway import IProjectGateway
 from renku.core.plugin.provider import execute
@@ -47,10 +48,12 @@ from renku.core.util.os import are_paths_related, get_relative_paths, safe_read_
 from renku.core.workflow.activity import create_activity_graph, get_activities_until_paths, sort_activities
 from renku.core.workflow.concrete_execution_graph import ExecutionGraph
 from renku.core.workflow.plan_factory import delete_indirect_files_list
+from renku.core.workflow.step_cache import restore_cached_steps
 from renku.core.workflow.value_resolution import CompositePlanValueResolver, ValueResolver
 from renku.domain_model.provenance.activity import Activity, ActivityCollection
 from renku.domain_model.workflow.composite_plan import CompositePlan
 from renku.domain_model.workflow.plan import AbstractPlan, Plan
+from renku.domain_model.workflow.provider import PlanExecution
 
 
 @inject.autoparams()
@@ -573,16 +576,36 @@ def execute_workflow(
 
     started_at_time = local_now()
 
-    execute(dag=dag, basedir=client.path, provider=provider, config=config)
+    to_execute = dag
+    if str(client.get_value("renku", "workflow_cache")).lower() == "true":
+        to_execute = restore_cached_steps(dag)
+
+    if to_execute.number_of_nodes() > 0:
+        execute(dag=to_execute, basedir=client.path, provider=provider, config=config)
 
     ended_at_time = local_now()
 
+    # NOTE: Plans changed the working tree, so outputs' checksums must be calculated from a fresh status
+    client.repository.invalidate_status()
+
     activities = []
 
-    for plan in dag.nodes:
+    # NOTE: Restored steps didn't run, their outputs are still attributed to the earlier activity that generated them
+    for plan in to_execute.nodes:
         # NOTE: Update plans are copies of Plan objects. We need to use the original Plan objects to avoid duplicates.
         original_plan = plan_gateway.get_by_id(plan.id)
-        activity = Activity.from_plan(plan=plan, started_at_time=started_at_time, ended_at_time=ended_at_time)
+        # NOTE: Fall back to the duration of the whole workflow if the provider didn't report the plan's execution
+        execution = PlanExecution.pop(plan) or PlanExecution(
+            started_at_time=started_at_time, ended_at_time=ended_at_time
+        )
+        activity = Activity.from_plan(
+            plan=plan,
+            started_at_time=execution.started_at_time,
+            ended_at_time=execution.ended_at_time,
+            exit_code=execution.exit_code,
+            cpu_time=execution.cpu_time,
+            peak_memory=execution.peak_memory,
+        )
         activity.association.plan = original_plan
         activity_gateway.add(activity)
         activities.append(activity)
@@ -805,29 +828,25 @@ def _validate_iterate_parameters(
     return iter_params
 
 
-def _build_iterations(
-    workflow: AbstractPlan, workflow_params: Dict[str, Any], iter_params: Dict[str, Any], index_pattern: re.Pattern
-) -> Tuple[List[AbstractPlan], List[Dict]]:
-    """Instantiate the workflows for each iteration.
+def _iterate_values(
+    workflow_params: Dict[str, Any], iter_params: Dict[str, Any], index_pattern: re.Pattern
+) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """Lazily generate the parameter values of each iteration.
 
     Args:
-        workflow(AbstractPlan): The base workflow to use as a template.
         workflow_params(Dict[str, Any]): The plain parameters to use.
         iter_params(Dict[str, Any]): The iterative parameters to use.
         index_pattern(re.Pattern): The pattern for the index placeholder.
 
     Returns:
-        Tuple of ``(plans, itervalues)`` with ``plans`` being a list of all
-        plans for each iteration and ``itervalues`` being a list of all values
-        for each iteration.
+        Iterator of ``(plan_params, itervalues)`` with ``plan_params`` being all
+        parameters of an iteration and ``itervalues`` being only the values that
+        change between iterations.
     """
     import copy
 
     from deepmerge import always_merger
 
-    plans = []
-    execute_plan = []
-
     columns = list(iter_params["params"].keys())
     tagged_values = []
     for tag in iter_params["tagged"].values():
@@ -843,26 +862,45 @@ def _build_iterations(
                 yield i
 
     for i, values in enumerate(itertools.product(*iter_params["params"].values(), *tagged_values)):
-        plan_params = copy.deepcopy(workflow_params)
         iteration_values = {}
         for k, v in iter_params["indexed"].items():
-            value = index_pattern.sub(str(i), v)
-            set_param = reduce(lambda x, y: {y: x}, reversed(k.split(".")), value)  # type: ignore
-            plan_params = always_merger.merge(plan_params, set_param)
-            iteration_values[k] = value
+            iteration_values[k] = index_pattern.sub(str(i), v)
 
         for param_key, param_value in zip(columns, _flatten(values)):
+            iteration_values[param_key] = param_value
+
+        # NOTE: Merging modifies the destination in place, so only the user-provided parameters need to be copied
+        plan_params = copy.deepcopy(workflow_params)
+        for param_key, param_value in iteration_values.items():
             set_param = reduce(lambda x, y: {y: x}, reversed(param_key.split(".")), param_value)  # type: ignore
             plan_params = always_merger.merge(plan_params, set_param)
-            iteration_values[param_key] = param_value
 
-        execute_plan.append(iteration_values)
-        rv = ValueResolver.get(copy.deepcopy(workflow), plan_params)
-        plans.append(rv.apply())
+        yield plan_params, iteration_values
+
+
+def _build_iterations(
+    workflow: AbstractPlan, workflow_params: Dict[str, Any], iter_params: Dict[str, Any], index_pattern: re.Pattern
+) -> Iterator[Tuple[AbstractPlan, Dict[str, Any]]]:
+    """Lazily instantiate the workflows for each iteration.
 
-    return plans, execute_plan
+    Args:
+        workflow(AbstractPlan): The base workflow to use as a template.
+        workflow_params(Dict[str, Any]): The plain parameters to use.
+        iter_params(Dict[str, Any]): The iterative parameters to use.
+        index_pattern(re.Pattern): The pattern for the index placeholder.
 
+    Returns:
+        Iterator of ``(plan, itervalues)`` with ``plan`` being the plan of an
+        iteration and ``itervalues`` being the values of the iteration.
+    """
+    import copy
+
+    for plan_params, iteration_values in _iterate_values(workflow_params, iter_params, index_pattern):
+        rv = ValueResolver.get(copy.deepcopy(workflow), plan_params)
+        yield rv.apply(), iteration_values
 
+
+@inject.autoparams("client_dispatcher", "database_gateway")
 def _iterate_workflow(
     name_or_id: str,
     mapping_path: str,
@@ -870,6 +908,9 @@ def _iterate_workflow(
     dry_run: bool,
     provider: str,
     config: Optional[str],
+    client_dispatcher: IClientDispatcher,
+    database_gateway: IDatabaseGateway,
+    batch_size: Optional[int] = None,
 ):
     import ast
 
@@ -931,12 +972,33 @@ def _iterate_workflow(
     if iter_params is None:
         return
 
-    plans, execute_plan = _build_iterations(workflow, workflow_params, iter_params, index_pattern)
+    if dry_run:
+        execute_plan = [v for _, v in _iterate_values(workflow_params, iter_params, index_pattern)]
+        communication.echo(f"\n\n{tabulate(execute_plan, execute_plan[0].keys())}")
+        return
 
-    communication.echo(f"\n\n{tabulate(execute_plan, execute_plan[0].keys())}")
-    if not dry_run:
+    if batch_size is not None and batch_size < 1:
+        raise errors.ParameterError("Batch size must be a positive integer.")
+
+    client = client_dispatcher.current_client
+
+    # NOTE: Iterations are generated and executed one batch at a time, so only one batch of plans is kept in memory
+    iterations = _build_iterations(workflow, workflow_params, iter_params, index_pattern)
+    while True:
+        batch = list(itertools.islice(iterations, batch_size))
+        if not batch:
+            break
+
+        plans = [p for p, _ in batch]
+        execute_plan = [v for _, v in batch]
+
+        communication.echo(f"\n\n{tabulate(execute_plan, execute_plan[0].keys())}")
         graph = ExecutionGraph(workflows=plans, virtual_links=True)
-        execute_workflow(dag=graph.workflow_graph, provider=provider, config=config)
+
+        # NOTE: Commit each batch so that its activities can be evicted from memory and are kept if a later batch fails
+        with client.commit(commit_empty=False):
+            execute_workflow(dag=graph.workflow_graph, provider=provider, config=config)
+            database_gateway.commit()
 
 
 def iterate_workflow_command():
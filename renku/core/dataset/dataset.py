@@ -1047,6 +1047,7 @@ def update_dataset_git_files(
                 updated_files.append(file)
     finally:
         communication.finalize_progress(progress_text)
+        client.repository.invalidate_status()
 
     if not updated_files and (not delete or not deleted_files):
         # Nothing to commit or update
@@ -135,7 +135,7 @@ def add_data_to_dataset(
             # Force-add to include possible ignored files
             client.repository.add(*files_to_commit, renku_pointers_path(client), force=True)
 
-            n_staged_changes = len(client.repository.staged_changes)
+            n_staged_changes = len(client.repository.get_status().staged_changes)
             if n_staged_changes == 0:
                 communication.warn("No new file was added to project")
 
@@ -320,6 +320,8 @@ def move_files_to_dataset(client: "LocalClient", files: List[Dict]):
         else:
             raise errors.OperationError(f"Invalid action {action}")
 
+    client.repository.invalidate_status()
+
 
 def _generate_dataset_files(
     client: "LocalClient", dataset: Dataset, files: List[Dict], clear_files_before: bool = False
@@ -19,7 +19,7 @@
 
 from abc import ABC
 from pathlib import Path
-from typing import List, Optional, Set, Tuple, Union
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 from renku.domain_model.provenance.activity import Activity, ActivityCollection
 
@@ -39,10 +39,22 @@ class IActivityGateway(ABC):
         """Return the list of all activities that generate a path."""
         raise NotImplementedError
 
+    def get_activities_by_usage(self, path: Union[Path, str]) -> List[Activity]:
+        """Return the list of all activities that use a path."""
+        raise NotImplementedError
+
+    def get_activities_by_related_generation(self, path: Union[Path, str]) -> Set[Activity]:
+        """Return all activities that generate a path, one of its parents, or one of its children."""
+        raise NotImplementedError
+
     def get_downstream_activities(self, activity: Activity, max_depth=None) -> Set[Activity]:
         """Get downstream activities that depend on this activity."""
         raise NotImplementedError
 
+    def get_upstream_activities(self, activity: Activity, max_depth=None) -> Set[Activity]:
+        """Get upstream activities that this activity depends on."""
+        raise NotImplementedError
+
     def get_downstream_activity_chains(self, activity: Activity) -> List[Tuple[Activity, ...]]:
         """Get a list of tuples of all downstream paths of this activity."""
         raise NotImplementedError
@@ -51,10 +63,22 @@ class IActivityGateway(ABC):
         """Get a list of tuples of all upstream paths of this activity."""
         raise NotImplementedError
 
-    def get_all_activities(self) -> List[Activity]:
+    def get_all_activities(self, pin: bool = True) -> List[Activity]:
         """Get all activities in the project."""
         raise NotImplementedError
 
+    def get_latest_activities_by_outputs(self) -> List[Activity]:
+        """Get the latest activity for each distinct set of outputs."""
+        raise NotImplementedError
+
+    def get_usage_checksums(self) -> Dict[str, Set[str]]:
+        """Get checksums of each usage path in the latest activities of each distinct set of outputs."""
+        raise NotImplementedError
+
+    def rebuild_indexes(self) -> None:
+        """Recreate the latest activities and usage checksums indexes from all activities."""
+        raise NotImplementedError
+
     def add(self, activity: Activity) -> None:
         """Add an ``Activity`` to storage."""
         raise NotImplementedError
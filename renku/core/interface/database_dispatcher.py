@@ -19,10 +19,11 @@
 
 from abc import ABC
 from pathlib import Path
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Optional, Union
 
 if TYPE_CHECKING:
     from renku.infrastructure.database import Database
+    from renku.infrastructure.repository import Repository
 
 
 class IDatabaseDispatcher(ABC):
@@ -36,8 +37,14 @@ class IDatabaseDispatcher(ABC):
         """Get the currently active database."""
         raise NotImplementedError
 
-    def push_database_to_stack(self, path: Union[Path, str], commit: bool = False) -> None:
-        """Create and push a new database to the stack."""
+    def push_database_to_stack(
+        self,
+        path: Union[Path, str],
+        commit: bool = False,
+        revision: Optional[str] = None,
+        repository: Optional["Repository"] = None,
+    ) -> None:
+        """Create and push a new database to the stack; a read-only database is opened if ``revision`` is passed."""
         raise NotImplementedError
 
     def pop_database(self) -> None:
@@ -42,6 +42,14 @@ class IPlanGateway(ABC):
         """Return a list of all newest plans with their names."""
         raise NotImplementedError
 
+    def get_derivative(self, id: str) -> Optional[AbstractPlan]:
+        """Get the plan that is directly derived from a plan."""
+        raise NotImplementedError
+
+    def get_latest_descendant(self, plan: AbstractPlan) -> AbstractPlan:
+        """Get the last plan in the chain of plans that are derived from a plan or the plan itself."""
+        raise NotImplementedError
+
     def get_all_plans(self) -> List[AbstractPlan]:
         """Get all plans in project."""
         raise NotImplementedError
@@ -49,3 +57,7 @@ class IPlanGateway(ABC):
     def add(self, plan: AbstractPlan):
         """Add a plan to the database."""
         raise NotImplementedError
+
+    def rebuild_indexes(self) -> None:
+        """Recreate the index of plans by the plan that they are derived from."""
+        raise NotImplementedError
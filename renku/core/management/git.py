@@ -47,14 +47,14 @@ def prepare_commit(
     diff_before = set()
 
     if commit_only == COMMIT_DIFF_STRATEGY:
-        if len(client.repository.staged_changes) > 0 or len(client.repository.unstaged_changes) > 0:
+        status = client.repository.get_status()
+        if len(status.staged_changes) > 0 or len(status.unstaged_changes) > 0:
             client.repository.reset()
+            status = client.repository.get_status()
 
         # Exclude files created by pipes.
         diff_before = {
-            file
-            for file in client.repository.untracked_files
-            if STARTED_AT - int(Path(file).stat().st_ctime * 1e3) >= 1e3
+            file for file in status.untracked_files if STARTED_AT - int(Path(file).stat().st_ctime * 1e3) >= 1e3
         }
 
     if isinstance(commit_only, list) and not skip_dirty_checks:
@@ -80,19 +80,20 @@ def finalize_commit(
 
     committer = Actor(name=f"renku {__version__}", email=version_url)
 
-    change_types = {item.a_path: item.change_type for item in client.repository.unstaged_changes}
+    status = client.repository.get_status()
+    change_types = {item.a_path: item.change_type for item in status.unstaged_changes}
 
     if commit_only == COMMIT_DIFF_STRATEGY:
         # Get diff generated in command.
         staged_after = set(change_types.keys())
 
-        modified_after_change_types = {item.a_path: item.change_type for item in client.repository.staged_changes}
+        modified_after_change_types = {item.a_path: item.change_type for item in status.staged_changes}
 
         modified_after = set(modified_after_change_types.keys())
 
         change_types.update(modified_after_change_types)
 
-        diff_after = set(client.repository.untracked_files).union(staged_after).union(modified_after)
+        diff_after = set(status.untracked_files).union(staged_after).union(modified_after)
 
         # Remove files not touched in command.
         commit_only = list(diff_after - diff_before)
@@ -107,7 +108,7 @@ def finalize_commit(
         client.repository.add(all=True)
 
     try:
-        diffs = [d.a_path for d in client.repository.staged_changes]
+        diffs = [d.a_path for d in client.repository.get_status().staged_changes]
     except errors.GitError:
         diffs = []
 
@@ -295,16 +296,15 @@ class GitCore:
     @property
     def modified_paths(self):
         """Return paths of modified files."""
-        return [item.b_path for item in self.repository.unstaged_changes if item.b_path]
+        return [item.b_path for item in self.repository.get_status().unstaged_changes if item.b_path]
 
     @property
     def dirty_paths(self):
         """Get paths of dirty files in the repository."""
         repo_path = self.repository.path
-        staged_files = [d.a_path for d in self.repository.staged_changes] if self.repository.head.is_valid() else []
-        return {
-            os.path.join(repo_path, p) for p in self.repository.untracked_files + self.modified_paths + staged_files
-        }
+        status = self.repository.get_status()
+        staged_files = [d.a_path for d in status.staged_changes] if self.repository.head.is_valid() else []
+        return {os.path.join(repo_path, p) for p in status.untracked_files + self.modified_paths + staged_files}
 
     @property
     def candidate_paths(self):
@@ -334,6 +334,7 @@ class GitCore:
 
     def ensure_clean(self, ignore_std_streams=False):
         """Make sure the repository is clean."""
+        status = self.repository.get_status()
         dirty_paths = self.dirty_paths
         mapped_streams = get_mapped_std_streams(dirty_paths)
 
@@ -342,13 +343,13 @@ class GitCore:
                 _clean_streams(self.repository, mapped_streams)
                 raise errors.DirtyRepository(self.repository)
 
-        elif self.repository.is_dirty():
+        elif status.staged_changes or status.unstaged_changes:
             _clean_streams(self.repository, mapped_streams)
             raise errors.DirtyRepository(self.repository)
 
     def ensure_untracked(self, path):
         """Ensure that path is not part of git untracked files."""
-        untracked = self.repository.untracked_files
+        untracked = self.repository.get_status().untracked_files
 
         for file_path in untracked:
             is_parent = (self.path / file_path).parent == (self.path / path)
@@ -359,7 +360,7 @@ class GitCore:
 
     def ensure_unstaged(self, path):
         """Ensure that path is not part of git staged files."""
-        staged = self.repository.staged_changes
+        staged = self.repository.get_status().staged_changes
 
         for file_path in staged:
             is_parent = str(file_path.a_path).startswith(path)
@@ -387,11 +388,14 @@ class GitCore:
         skip_dirty_checks=False,
     ):
         """Automatic commit."""
+        # NOTE: The working tree may have changed since the status was read
+        self.repository.invalidate_status()
 
         diff_before = prepare_commit(self, commit_only=commit_only, skip_dirty_checks=skip_dirty_checks)
 
         yield
 
+        self.repository.invalidate_status()
         finalize_commit(
             self,
             diff_before,
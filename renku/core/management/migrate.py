@@ -62,7 +62,7 @@ try:
 except ImportError:
     import importlib.resources as importlib_resources  # type: ignore
 
-SUPPORTED_PROJECT_VERSION = 9
+SUPPORTED_PROJECT_VERSION = 11
 
 
 def check_for_migration():
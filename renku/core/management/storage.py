@@ -155,6 +155,8 @@ class StorageApiMixin(RepositoryApiMixin):
                 raise errors.GitLFSError(f"Error executing 'git lfs install: \n {result.stdout}")
         except (KeyboardInterrupt, OSError) as e:
             raise errors.ParameterError(f"Couldn't run 'git lfs':\n{e}")
+        finally:
+            self.repository.invalidate_checksum_cache()
 
     def init_repository(self, force=False, user=None, initial_branch=None):
         """Initialize a local Renku repository."""
@@ -215,6 +217,8 @@ class StorageApiMixin(RepositoryApiMixin):
                     raise errors.GitLFSError(f"Error executing 'git lfs track: \n {result.stdout}")
             except (KeyboardInterrupt, OSError) as e:
                 raise errors.ParameterError(f"Couldn't run 'git lfs':\n{e}")
+            finally:
+                self.repository.invalidate_checksum_cache()
 
         show_message = self.get_value("renku", "show_lfs_message")
         if track_paths and (show_message is None or show_message == "True"):
@@ -238,6 +242,8 @@ class StorageApiMixin(RepositoryApiMixin):
                 raise errors.GitLFSError(f"Error executing 'git lfs untrack: \n {result.stdout}")
         except (KeyboardInterrupt, OSError) as e:
             raise errors.ParameterError(f"Couldn't run 'git lfs':\n{e}")
+        finally:
+            self.repository.invalidate_checksum_cache()
 
     @check_external_storage_wrapper
     def list_tracked_paths(self, client=None):
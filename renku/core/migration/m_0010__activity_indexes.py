@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2017-2022 - Swiss Data Science Center (SDSC)
+# A partnership between École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Add indexes of latest activities by outputs and of usage checksums."""
+
+from renku.command.command_builder import inject
+from renku.core.interface.activity_gateway import IActivityGateway
+from renku.core.interface.database_gateway import IDatabaseGateway
+
+
+def migrate(migration_context):
+    """Migration function."""
+    _create_activity_indexes()
+
+
+@inject.autoparams()
+def _create_activity_indexes(activity_gateway: IActivityGateway, database_gateway: IDatabaseGateway):
+    """Build activity indexes that are used by status and update."""
+    activity_gateway.rebuild_indexes()
+    database_gateway.commit()
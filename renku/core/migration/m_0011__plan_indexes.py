@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2017-2022 - Swiss Data Science Center (SDSC)
+# A partnership between École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Add an index of plans by the plan that they are derived from."""
+
+from renku.command.command_builder import inject
+from renku.core.interface.database_gateway import IDatabaseGateway
+from renku.core.interface.plan_gateway import IPlanGateway
+
+
+def migrate(migration_context):
+    """Migration function."""
+    _create_plan_indexes()
+
+
+@inject.autoparams()
+def _create_plan_indexes(plan_gateway: IPlanGateway, database_gateway: IDatabaseGateway):
+    """Build the index of derived plans that is used to find the latest version of a plan."""
+    plan_gateway.rebuild_indexes()
+    database_gateway.commit()
@@ -22,6 +22,7 @@ from typing import TYPE_CHECKING, List, Type
 from renku.core.session.docker import DockerSessionProvider
 from renku.core.workflow.converters.cwl import CWLExporter
 from renku.core.workflow.providers.cwltool import CWLToolProvider
+from renku.core.workflow.providers.local import LocalProvider
 
 if TYPE_CHECKING:
     from renku.domain_model.session import ISessionProvider
@@ -32,7 +33,7 @@ __all__: List[str] = []
 
 session_providers: "List[Type[ISessionProvider]]" = [DockerSessionProvider]
 workflow_exporters: "List[Type[IWorkflowConverter]]" = [CWLExporter]
-workflow_providers: "List[Type[IWorkflowProvider]]" = [CWLToolProvider]
+workflow_providers: "List[Type[IWorkflowProvider]]" = [CWLToolProvider, LocalProvider]
 
 try:
     from renku.core.workflow.providers.toil import ToilProvider
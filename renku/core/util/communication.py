@@ -26,8 +26,8 @@ class CommunicationCallback:
 
     lock = RLock()
 
-    def echo(self, msg, end="\n"):
-        """Write a message."""
+    def echo(self, msg, end="\n", err=False):
+        """Write a message; to the error stream if ``err`` is set."""
 
     def info(self, msg):
         """Write an info message."""
@@ -109,10 +109,10 @@ class _CommunicationManger(CommunicationCallback):
 
     @lock_communication
     @ensure_communication
-    def echo(self, msg, end="\n"):
+    def echo(self, msg, end="\n", err=False):
         """Write a message."""
         for listener in self._listeners:
-            listener.echo(msg, end=end)
+            listener.echo(msg, end=end, err=err)
 
     @lock_communication
     @ensure_communication
@@ -224,9 +224,9 @@ def unsubscribe(listener):
 
 
 @ensure_manager
-def echo(msg, end="\n"):
+def echo(msg, end="\n", err=False):
     """Write a message to all listeners."""
-    _thread_local.communication_manager.echo(msg, end=end)
+    _thread_local.communication_manager.echo(msg, end=end, err=err)
 
 
 @ensure_manager
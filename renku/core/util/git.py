@@ -437,10 +437,11 @@ def commit_changes(*paths: Union[Path, str], repository: "Repository", message=N
         return []
 
     try:
-        staged_files = {c.a_path for c in repository.staged_changes} if repository.head.is_valid() else set()
+        staged_changes = repository.get_status().staged_changes if repository.head.is_valid() else []
+        staged_files = {c.a_path for c in staged_changes}
         path_to_save = set(paths) - staged_files
         repository.add(*path_to_save)
-        saved_paths = [c.b_path for c in repository.staged_changes]
+        saved_paths = [c.b_path for c in repository.get_status().staged_changes]
 
         if saved_paths:
             if not message:
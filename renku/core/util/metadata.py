@@ -29,6 +29,7 @@ from renku.core import errors
 from renku.core.util.os import is_subpath
 
 if TYPE_CHECKING:
+    from renku.core.interface.activity_gateway import IActivityGateway
     from renku.domain_model.entity import Entity
     from renku.domain_model.provenance.activity import Activity
     from renku.domain_model.provenance.agent import Person
@@ -85,19 +86,31 @@ def construct_creator(creator: Union[dict, str], ignore_email) -> Tuple[Optional
 
 
 def get_modified_activities(
-    activities: List["Activity"], repository
+    activities: List["Activity"], repository, hashes: Optional[Dict[str, Optional[str]]] = None
 ) -> Tuple[Set[Tuple["Activity", "Entity"]], Set[Tuple["Activity", "Entity"]]]:
-    """Get lists of activities that have modified/deleted usage entities."""
+    """Get lists of activities that have modified/deleted usage entities.
+
+    Args:
+        activities(List[Activity]): Activities to check.
+        repository: Current ``Repository``.
+        hashes(Optional[Dict[str, Optional[str]]]): Current checksums of usage paths; they are looked up in
+            ``repository`` if not passed (Default value = None).
+
+    Returns:
+        Tuple[Set[Tuple[Activity, Entity]], Set[Tuple[Activity, Entity]]]: Activities with their modified usage
+            entities and activities with their deleted usage entities.
+    """
     modified = set()
     deleted = set()
 
-    paths = []
+    if hashes is None:
+        paths = []
 
-    for activity in activities:
-        for usage in activity.usages:
-            paths.append(usage.entity.path)
+        for activity in activities:
+            for usage in activity.usages:
+                paths.append(usage.entity.path)
 
-    hashes = repository.get_object_hashes(paths=paths, revision="HEAD")
+        hashes = repository.get_object_hashes(paths=paths, revision="HEAD")
 
     for activity in activities:
         for usage in activity.usages:
@@ -111,6 +124,65 @@ def get_modified_activities(
     return modified, deleted
 
 
+def get_latest_modified_activities(
+    activity_gateway: "IActivityGateway", repository, paths: Optional[List[str]] = None
+) -> Tuple[Set[Tuple["Activity", "Entity"]], Set[Tuple["Activity", "Entity"]]]:
+    """Get latest, not-overridden activities that have modified/deleted usage entities.
+
+    Current checksums of usage paths are compared to the checksums that latest activities of each set of outputs
+    recorded for them. Only if one of them differs, those activities are loaded and checked; this avoids loading any
+    activities when nothing changed. If ``paths`` are passed, only activities that use or generate them and their
+    upstream activities are checked.
+
+    Args:
+        activity_gateway(IActivityGateway): Activity gateway.
+        repository: Current ``Repository``.
+        paths(Optional[List[str]]): Paths relative to the project's root to restrict the search to
+            (Default value = None).
+
+    Returns:
+        Tuple[Set[Tuple[Activity, Entity]], Set[Tuple[Activity, Entity]]]: Activities with their modified usage
+            entities and activities with their deleted usage entities.
+    """
+    if paths:
+        relevant_activities = _get_relevant_activities_for_paths(activity_gateway=activity_gateway, paths=paths)
+        return get_modified_activities(activities=relevant_activities, repository=repository)
+
+    usage_checksums = activity_gateway.get_usage_checksums()
+    hashes = repository.get_object_hashes(paths=list(usage_checksums), revision="HEAD")
+
+    stale_paths = {path for path, checksums in usage_checksums.items() if checksums != {hashes.get(path)}}
+    if not stale_paths:
+        return set(), set()
+
+    relevant_activities = filter_overridden_activities(activity_gateway.get_latest_activities_by_outputs())
+    relevant_activities = [a for a in relevant_activities if any(u.entity.path in stale_paths for u in a.usages)]
+
+    return get_modified_activities(activities=relevant_activities, repository=repository, hashes=hashes)
+
+
+def _get_relevant_activities_for_paths(activity_gateway: "IActivityGateway", paths: List[str]) -> List["Activity"]:
+    """Return not-overridden activities that use or generate ``paths`` along with their upstream activities."""
+    activities: Set["Activity"] = set()
+
+    for path in paths:
+        activities.update(activity_gateway.get_activities_by_usage(path))
+        activities.update(activity_gateway.get_activities_by_related_generation(path))
+
+    for activity in list(activities):
+        activities.update(activity_gateway.get_upstream_activities(activity))
+
+    # NOTE: Only activities that generate some of the same outputs can override an activity
+    candidates = set(activities)
+    for activity in activities:
+        for generation in activity.generations:
+            candidates.update(activity_gateway.get_activities_by_generation(generation.entity.path))
+
+    relevant_activities = filter_overridden_activities(sorted(candidates, key=lambda a: a.ended_at_time))
+
+    return [a for a in relevant_activities if a in activities]
+
+
 def filter_overridden_activities(activities: List["Activity"]) -> List["Activity"]:
     """Filter out overridden activities from a list of activities."""
     relevant_activities: Dict[FrozenSet[str], Activity] = {}
@@ -146,20 +218,18 @@ def filter_overridden_activities(activities: List["Activity"]) -> List["Activity
     return list(relevant_activities.values())
 
 
-def add_activity_if_recent(activity: "Activity", activities: Set["Activity"]):
-    """Add ``activity`` to ``activities`` if it's not in the set or is the latest executed instance."""
-    if activity in activities:
-        return
+def add_activity_if_recent(activity: "Activity", activities: Dict[Tuple, "Activity"]):
+    """Add ``activity`` to ``activities`` if there is no activity with the same plan and signature or it's newer.
 
-    for existing_activity in activities:
-        if activity.has_identical_inputs_and_outputs_as(existing_activity):
-            if activity.ended_at_time > existing_activity.ended_at_time:  # activity is newer
-                activities.remove(existing_activity)
-                activities.add(activity)
-            return
+    Args:
+        activity(Activity): The activity to add.
+        activities(Dict[Tuple, Activity]): Latest executed activities keyed by their plan's id and their signature.
+    """
+    key = (activity.association.plan.id, activity.signature)
+    existing_activity = activities.get(key)
 
-    # NOTE: No similar activity was found
-    activities.add(activity)
+    if existing_activity is None or activity.ended_at_time > existing_activity.ended_at_time:
+        activities[key] = activity
 
 
 def is_external_file(path: Union[Path, str], client_path: Path):
@@ -21,7 +21,7 @@ import hashlib
 import os
 import re
 from pathlib import Path
-from typing import Any, Dict, Generator, List, Optional, Sequence, Union
+from typing import Any, Dict, Generator, List, Optional, Sequence, Tuple, Union
 
 from renku.core import errors
 
@@ -205,3 +205,36 @@ def safe_read_yaml(file: str) -> Dict[str, Any]:
         return yaml.read_yaml(file)
     except Exception as e:
         raise errors.ParameterError(e)
+
+
+def call_with_resource_usage(args: Sequence[Any], **kwargs) -> Tuple[int, Optional[float], Optional[int]]:
+    """Run a command like ``subprocess.call`` and measure its resource usage.
+
+    Args:
+        args(Sequence[Any]): The command line to run.
+        kwargs: Keyword arguments passed to ``subprocess.Popen``.
+
+    Returns:
+        Tuple[int, Optional[float], Optional[int]]: The exit code, CPU time in seconds and peak resident set size in
+            bytes of the command; resource usage is None on platforms that don't report it.
+    """
+    import subprocess
+    import sys
+
+    with subprocess.Popen(args, **kwargs) as process:
+        if not hasattr(os, "wait4"):
+            return process.wait(), None, None
+
+        try:
+            _, status, usage = os.wait4(process.pid, 0)
+        except BaseException:
+            process.kill()
+            raise
+
+        # NOTE: The process is already reaped, so let ``Popen`` know about its exit code
+        process.returncode = -os.WTERMSIG(status) if os.WIFSIGNALED(status) else os.WEXITSTATUS(status)
+
+    # NOTE: ``ru_maxrss`` is in kilobytes on Linux but in bytes on macOS
+    peak_memory = usage.ru_maxrss if sys.platform == "darwin" else usage.ru_maxrss * 1024
+
+    return process.returncode, usage.ru_utime + usage.ru_stime, peak_memory
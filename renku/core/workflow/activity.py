@@ -19,7 +19,7 @@
 
 import itertools
 from collections import defaultdict
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 import networkx
 
@@ -39,11 +39,10 @@ def get_activities_until_paths(
     revision: Optional[str] = None,
 ) -> Set[Activity]:
     """Get all current activities leading to `paths`, from `sources`."""
-    all_activities: Dict[str, Set[Activity]] = defaultdict(set)
+    all_activities: Dict[Tuple, Activity] = {}
 
     def include_newest_activity(activity):
-        existing_activities = all_activities[activity.association.plan.id]
-        add_activity_if_recent(activity=activity, activities=existing_activities)
+        add_activity_if_recent(activity=activity, activities=all_activities)
 
     commit = None
 
@@ -86,7 +85,7 @@ def get_activities_until_paths(
             for activity in chain:
                 include_newest_activity(activity)
 
-    return {a for activities in all_activities.values() for a in activities}
+    return set(all_activities.values())
 
 
 def create_activity_graph(
@@ -600,12 +600,16 @@ class PlanFactory:
             candidates: Set[Tuple[Union[Path, str], Optional[str]]] = set()
 
             if not self.no_output_detection:
+                # NOTE: The command has changed the working tree
+                repository.invalidate_status()
+                status = repository.get_status()
+
                 # Calculate possible output paths.
                 # Capture newly created files through redirects.
-                candidates |= {(file_, None) for file_ in repository.untracked_files}
+                candidates |= {(file_, None) for file_ in status.untracked_files}
 
                 # Capture modified files through redirects.
-                candidates |= {(o.b_path, None) for o in repository.unstaged_changes if not o.deleted}
+                candidates |= {(o.b_path, None) for o in status.unstaged_changes if not o.deleted}
 
                 # Filter out explicit outputs
                 explicit_output_paths = {
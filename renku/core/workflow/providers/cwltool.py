@@ -36,6 +36,11 @@ to run the exported CWL file.
 .. code-block:: console
 
    $ renku workflow execute --config config.yaml --provider cwltool example_workflow
+
+.. note:: cwltool doesn't report the results of individual steps of a
+   workflow. Activities of workflows executed with this provider get the start
+   and end time of the whole workflow and no exit code, CPU time or peak
+   memory. Use the ``local`` or ``toil`` provider to record them per step.
 """
 
 import os
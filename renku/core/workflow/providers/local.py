@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2017-2022 - Swiss Data Science Center (SDSC)
+# A partnership between École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Native local provider.
+
+This implementation executes the workflow DAG directly with subprocesses in the
+project directory, without converting it to another workflow language. Plans
+whose inputs are ready run concurrently on a pool of workers and their outputs
+are written in place.
+
+.. code-block:: console
+
+   $ renku workflow execute --provider local example_workflow
+
+
+.. topic:: Specifying the number of workers (``--config``)
+
+   By default, as many plans as there are CPUs are run at the same time. This
+   can be changed by providing a YAML file with a ``workers`` key for the
+   ``--config`` option.
+
+.. code-block:: console
+
+   $ echo "workers: 8" > config.yaml
+   $ renku workflow execute --config config.yaml --provider local example_workflow
+"""
+
+import itertools
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any, Dict, List, Set
+
+import networkx as nx
+
+from renku.command.echo import progressbar
+from renku.core import errors
+from renku.core.plugin import hookimpl
+from renku.core.plugin.provider import RENKU_ENV_PREFIX
+from renku.core.util.datetime8601 import local_now
+from renku.core.util.os import call_with_resource_usage
+from renku.domain_model.workflow.plan import Plan
+from renku.domain_model.workflow.provider import IWorkflowProvider, PlanExecution
+
+
+def _get_command_line(plan: Plan) -> List[str]:
+    """Build the argument list to execute a ``Plan`` without a shell."""
+    command_line = plan.command.split(" ") if plan.command else []
+
+    arguments = itertools.chain(plan.inputs, plan.outputs, plan.parameters)
+    arguments = filter(lambda x: x.position and not getattr(x, "mapped_to", None), arguments)
+
+    for argument in sorted(arguments, key=lambda x: x.position):
+        value = str(argument.actual_value)
+        if argument.prefix:
+            if argument.prefix.endswith(" "):
+                command_line.append(argument.prefix[:-1])
+            else:
+                value = f"{argument.prefix}{value}"
+        command_line.append(value)
+
+    return command_line
+
+
+def _execute_plan(plan: Plan, basedir: Path) -> List[str]:
+    """Execute a single ``Plan`` in ``basedir`` and return its output paths."""
+    environment = os.environ.copy()
+    mapped_std: Dict[str, str] = {}
+
+    for parameter in itertools.chain(plan.inputs, plan.outputs, plan.parameters):
+        environment[f"{RENKU_ENV_PREFIX}{parameter.name}"] = str(parameter.actual_value)
+
+        mapped_to = getattr(parameter, "mapped_to", None)
+        if mapped_to:
+            mapped_std[mapped_to.stream_type] = str(parameter.actual_value)
+
+    for output in plan.outputs:
+        (basedir / output.actual_value).parent.mkdir(parents=True, exist_ok=True)
+
+    with ExitStack() as stack:
+        streams = {
+            stream: stack.enter_context(open(basedir / path, mode="r" if stream == "stdin" else "w"))
+            for stream, path in mapped_std.items()
+        }
+        started_at_time = local_now()
+        try:
+            return_code, cpu_time, peak_memory = call_with_resource_usage(
+                _get_command_line(plan), cwd=basedir, env=environment, **streams
+            )
+        except OSError as e:
+            raise errors.WorkflowExecuteError(f"Cannot execute '{plan.name}': {e}") from e
+        ended_at_time = local_now()
+
+    if return_code not in (plan.success_codes or {0}):
+        raise errors.InvalidSuccessCode(return_code, success_codes=plan.success_codes)
+
+    PlanExecution(
+        started_at_time=started_at_time,
+        ended_at_time=ended_at_time,
+        exit_code=return_code,
+        cpu_time=cpu_time,
+        peak_memory=peak_memory,
+    ).attach_to(plan)
+
+    return [str(o.actual_value) for o in plan.outputs]
+
+
+class LocalProvider(IWorkflowProvider):
+    """A workflow executor provider that runs plans as local subprocesses."""
+
+    @hookimpl
+    def workflow_provider(self):
+        """Workflow provider name."""
+        return self, "local"
+
+    @hookimpl
+    def workflow_execute(self, dag: nx.DiGraph, basedir: Path, config: Dict[str, Any]):
+        """Executes a given workflow DAG with a pool of local workers."""
+        config = config or {}
+        try:
+            workers = int(config.get("workers", os.cpu_count() or 1))
+        except (TypeError, ValueError):
+            workers = 0
+
+        if workers < 1:
+            raise errors.ConfigurationError("The number of 'workers' must be a positive integer")
+
+        remaining_parents = {plan: dag.in_degree(plan) for plan in dag.nodes}
+        ready = [plan for plan, count in remaining_parents.items() if count == 0]
+        running: Dict[Future, Plan] = {}
+        outputs: List[str] = []
+
+        with ThreadPoolExecutor(max_workers=workers) as executor, progressbar(
+            length=dag.number_of_nodes(), label="Executing plans"
+        ) as bar:
+            try:
+                while ready or running:
+                    for plan in ready:
+                        running[executor.submit(_execute_plan, plan, basedir)] = plan
+                    ready = []
+
+                    done: Set[Future]
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        plan = running.pop(future)
+                        try:
+                            outputs.extend(future.result())
+                        except errors.InvalidSuccessCode as e:
+                            raise errors.WorkflowExecuteError(f"Plan '{plan.name}' failed: {e}") from e
+                        bar.update(1)
+
+                        for child in dag.successors(plan):
+                            remaining_parents[child] -= 1
+                            if remaining_parents[child] == 0:
+                                ready.append(child)
+            finally:
+                # NOTE: Don't start any further plans if one of them failed, but let the running ones finish
+                for future in running:
+                    future.cancel()
+
+        return outputs
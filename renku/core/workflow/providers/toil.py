@@ -24,8 +24,7 @@ import shutil
 import uuid
 from abc import abstractmethod
 from pathlib import Path
-from subprocess import call
-from typing import Any, Callable, Dict, List, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import networkx as nx
 from toil.common import Toil
@@ -41,10 +40,12 @@ from renku.core.errors import WorkflowExecuteError
 from renku.core.management.config import RENKU_HOME
 from renku.core.plugin import hookimpl
 from renku.core.plugin.provider import RENKU_ENV_PREFIX
+from renku.core.util.datetime8601 import local_now
+from renku.core.util.os import call_with_resource_usage
 from renku.core.workflow.plan_factory import RENKU_TMP
 from renku.domain_model.workflow.parameter import CommandParameterBase
 from renku.domain_model.workflow.plan import Plan
-from renku.domain_model.workflow.provider import IWorkflowProvider
+from renku.domain_model.workflow.provider import IWorkflowProvider, PlanExecution
 
 
 class AbstractToilJob(Job):
@@ -58,8 +59,10 @@ class AbstractToilJob(Job):
         self._environment = os.environ.copy()
 
     @abstractmethod
-    def _execute(self, command_line: List[str], mapped_std: Dict[str, str]) -> int:
-        """Executes a given command line."""
+    def _execute(
+        self, command_line: List[str], mapped_std: Dict[str, str]
+    ) -> Tuple[int, Optional[float], Optional[int]]:
+        """Executes a given command line and returns its exit code, CPU time and peak memory usage."""
         raise NotImplementedError
 
     def set_input_files(self, input_files: Dict[str, Any]):
@@ -135,11 +138,24 @@ class AbstractToilJob(Job):
                     v = f"{a.prefix}{v}"
             cmd.append(v)
 
-        return_code = self._execute(cmd, mapped_std)
+        started_at_time = local_now()
+        return_code, cpu_time, peak_memory = self._execute(cmd, mapped_std)
+        ended_at_time = local_now()
         if return_code not in (self.workflow.success_codes or {0}):
             raise errors.InvalidSuccessCode(return_code, success_codes=self.workflow.success_codes)
 
-        return _upload_files(storage.writeGlobalFile, self.workflow.outputs, Path.cwd())
+        execution = PlanExecution(
+            started_at_time=started_at_time,
+            ended_at_time=ended_at_time,
+            exit_code=return_code,
+            cpu_time=cpu_time,
+            peak_memory=peak_memory,
+        )
+
+        return {
+            "outputs": _upload_files(storage.writeGlobalFile, self.workflow.outputs, Path.cwd()),
+            "execution": execution,
+        }
 
 
 class SubprocessToilJob(AbstractToilJob):
@@ -148,9 +164,11 @@ class SubprocessToilJob(AbstractToilJob):
     def __init__(self, workflow: Plan, *args, **kwargs):
         super().__init__(workflow, *args, **kwargs)
 
-    def _execute(self, command_line: List[str], mapped_std: Dict[str, str]) -> int:
+    def _execute(
+        self, command_line: List[str], mapped_std: Dict[str, str]
+    ) -> Tuple[int, Optional[float], Optional[int]]:
         """Executes a given command line."""
-        return call(
+        return call_with_resource_usage(
             command_line,
             cwd=os.getcwd(),
             **{
@@ -168,7 +186,9 @@ class DockerToilJob(AbstractToilJob):
         super().__init__(workflow, *args, **kwargs)
         self._docker_config: Dict[str, Any] = docker_config
 
-    def _execute(self, command_line: List[str], mapped_std: Dict[str, str]) -> int:
+    def _execute(
+        self, command_line: List[str], mapped_std: Dict[str, str]
+    ) -> Tuple[int, Optional[float], Optional[int]]:
         """Executes a given command line."""
         # NOTE: Disable detached mode to block for ``apiDockerCall`` to finish
         self._docker_config.pop("detach", None)
@@ -192,7 +212,8 @@ class DockerToilJob(AbstractToilJob):
             working_dir = self._docker_config.pop("working_dir")
 
         # NOTE: We cannot get the exit code back from the docker container. The Docker API checks for the exit code and
-        # raises an exception if it's not 0, so, Plan.success_codes is ignored when running with Docker.
+        # raises an exception if it's not 0, so, Plan.success_codes is ignored when running with Docker. Resource usage
+        # of the container isn't available either.
         apiDockerCall(
             self,
             parameters=parameters,
@@ -203,7 +224,7 @@ class DockerToilJob(AbstractToilJob):
             **self._docker_config,
         )
 
-        return 0
+        return 0, None, None
 
 
 def _store_location(
@@ -219,15 +240,29 @@ def _store_location(
 
 
 def _upload_files(
-    import_function: Callable[[str], FileID], params: List[CommandParameterBase], basedir: Path
-) -> Dict[str, FileID]:
+    import_function: Callable[[str], FileID],
+    params: List[CommandParameterBase],
+    basedir: Path,
+    uploaded: Optional[Dict[str, Union[FileID, Dict[str, Any]]]] = None,
+) -> Dict[str, Union[FileID, Dict[str, Any]]]:
+    """Import files of the given parameters into the file store.
+
+    If ``uploaded`` is passed, it is used to reuse file IDs of paths that were already imported instead of importing
+    them again.
+    """
+    if uploaded is None:
+        uploaded = {}
+
     file_locations = dict()
     for p in params:
-        location = basedir / p.actual_value
-        if not location.exists():
-            continue
+        if p.actual_value not in uploaded:
+            location = basedir / p.actual_value
+            if not location.exists():
+                continue
+
+            uploaded[p.actual_value] = _store_location(import_function, basedir, location)
 
-        file_locations[p.actual_value] = _store_location(import_function, basedir, location)
+        file_locations[p.actual_value] = uploaded[p.actual_value]
 
     return file_locations
 
@@ -238,28 +273,13 @@ def import_file_wrapper(storage: AbstractFileStore, file_path: str) -> FileID:
     return storage.importFile(file_uri)
 
 
-def process_children(
-    parent: AbstractToilJob,
-    dag: nx.DiGraph,
-    jobs: Dict[int, AbstractToilJob],
-    basedir: Path,
-    storage: AbstractFileStore,
-):
-    """Recursively process children of a workflow."""
-    outputs = list()
-    import_function = functools.partial(import_file_wrapper, storage)
-    for child in nx.neighbors(dag, parent.workflow):
-        child_job = jobs[id(child)]
-        file_metadata = _upload_files(import_function, child.inputs, basedir)
-        child_job.set_input_files(file_metadata)
-        child_job.add_input_promise(parent.rv())
-        outputs.append(parent.addFollowOn(child_job).rv())
-        outputs += process_children(child_job, dag, jobs, basedir, storage)
-    return outputs
-
-
 def initialize_jobs(job, basedir, dag, docker_config):
-    """Creates the Toil execution plan for the given workflow DAG."""
+    """Creates the Toil execution plan for the given workflow DAG.
+
+    Each plan becomes exactly one job that is a child of the jobs of all plans it depends on, so Toil runs it once
+    after all of them finished. Inputs that are generated by a parent are passed through the parent's promise; the
+    remaining inputs are imported into the file store once per path.
+    """
     job.fileStore.logToMaster("executing renku DAG")
     outputs = list()
     if docker_config:
@@ -268,13 +288,27 @@ def initialize_jobs(job, basedir, dag, docker_config):
     else:
         jobs = {id(n): SubprocessToilJob(n) for n in dag.nodes}
     import_function = functools.partial(import_file_wrapper, job.fileStore)
-    children = next(nx.topological_generations(dag))
-    for workflow in children:
-        child_job = jobs[id(workflow)]
-        file_metadata = _upload_files(import_function, workflow.inputs, basedir)
-        child_job.set_input_files(file_metadata)
-        outputs.append(job.addChild(child_job).rv())
-        outputs += process_children(child_job, dag, jobs, basedir, job.fileStore)
+    uploaded: Dict[str, Union[FileID, Dict[str, Any]]] = {}
+    index = {id(n): i for i, n in enumerate(dag.nodes)}
+
+    for workflow in nx.topological_sort(dag):
+        workflow_job = jobs[id(workflow)]
+        parents = list(dag.predecessors(workflow))
+
+        generated = {o.actual_value for p in parents for o in p.outputs}
+        inputs = [i for i in workflow.inputs if i.actual_value not in generated]
+        workflow_job.set_input_files(_upload_files(import_function, inputs, basedir, uploaded))
+
+        if not parents:
+            job.addChild(workflow_job)
+
+        for parent in parents:
+            parent_job = jobs[id(parent)]
+            workflow_job.add_input_promise(parent_job.rv("outputs"))
+            parent_job.addChild(workflow_job)
+
+        # NOTE: Return the index of each plan in the DAG to map results back to plans
+        outputs.append((index[id(workflow)], workflow_job.rv()))
 
     return outputs
 
@@ -312,10 +346,14 @@ class ToilProvider(IWorkflowProvider):
                 root_job = Job.wrapJobFn(initialize_jobs, basedir, dag, docker_config)
                 job_outputs = toil.start(root_job)
 
-                num_outputs = sum(map(lambda x: len(x.values()), job_outputs))
+                plans = list(dag.nodes)
+                for index, result in job_outputs:
+                    result["execution"].attach_to(plans[index])
+
+                num_outputs = sum(map(lambda x: len(x[1]["outputs"]), job_outputs))
                 with progressbar(length=num_outputs, label="Moving outputs") as bar:
-                    for collection in job_outputs:
-                        for name, fid in collection.items():
+                    for _, result in job_outputs:
+                        for name, fid in result["outputs"].items():
                             if isinstance(fid, dict):
                                 directory = basedir / name
                                 if directory.exists():
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2017-2022 - Swiss Data Science Center (SDSC)
+# A partnership between École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Reuse results of previous executions of workflow steps."""
+
+import hashlib
+import itertools
+import json
+from typing import Dict, List, Optional, Set
+
+import networkx
+
+from renku.command.command_builder import inject
+from renku.core import errors
+from renku.core.interface.activity_gateway import IActivityGateway
+from renku.core.interface.client_dispatcher import IClientDispatcher
+from renku.core.util import communication
+from renku.core.util.git import get_entity_from_revision
+from renku.domain_model.entity import Collection
+from renku.domain_model.provenance.activity import NON_EXISTING_ENTITY_CHECKSUM, Activity
+from renku.domain_model.workflow.plan import Plan
+
+
+def get_step_key(plan: Plan, input_checksums: Dict[str, str]) -> str:
+    """Return a key that identifies an execution of a plan with its parameter values and input contents.
+
+    Two executions with the same key run the same command line and environment on the same input files, so they are
+    expected to generate the same outputs.
+    """
+    arguments = itertools.chain(plan.inputs, plan.outputs, plan.parameters)
+    values = sorted(
+        (
+            a.name,
+            a.prefix or "",
+            a.position or 0,
+            str(a.actual_value),
+            getattr(getattr(a, "mapped_to", None), "stream_type", "") or "",
+        )
+        for a in arguments
+    )
+    checksums = sorted((str(i.actual_value), input_checksums.get(str(i.actual_value), "")) for i in plan.inputs)
+
+    content = json.dumps([plan.command, sorted(plan.success_codes or []), values, checksums])
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+@inject.autoparams()
+def restore_cached_steps(
+    dag: networkx.DiGraph, client_dispatcher: IClientDispatcher, activity_gateway: IActivityGateway
+) -> networkx.DiGraph:
+    """Restore outputs of plans that were executed before with the same parameter values and inputs.
+
+    Plans are visited in topological order so that outputs of restored plans are in place when their children are
+    checked. A plan that must be executed invalidates all its descendants since their inputs aren't known before the
+    execution. Outputs are restored from git's object database.
+
+    Args:
+        dag(networkx.DiGraph): The workflow graph to execute.
+        client_dispatcher(IClientDispatcher): The client dispatcher.
+        activity_gateway(IActivityGateway): The activity gateway.
+
+    Returns:
+        networkx.DiGraph: The sub-graph of plans that still need to be executed.
+    """
+    repository = client_dispatcher.current_client.repository
+
+    to_execute: Set[Plan] = set()
+    restored = 0
+
+    for plan in networkx.topological_sort(dag):
+        if any(parent in to_execute for parent in dag.predecessors(plan)):
+            to_execute.add(plan)
+            continue
+
+        activity = _find_cached_activity(plan, repository, activity_gateway)
+        if activity is None or not _restore_outputs(activity, repository):
+            to_execute.add(plan)
+            continue
+
+        restored += 1
+
+    if restored:
+        communication.echo(f"Restored outputs of {restored} unchanged step(s) from previous executions.")
+
+    return dag.subgraph(to_execute).copy()
+
+
+def _get_checksums(repository, paths) -> Optional[Dict[str, str]]:
+    """Return checksums of files in the working tree or None if any of them doesn't exist."""
+    checksums = {}
+
+    for path in paths:
+        if not (repository.path / path).exists():
+            return None
+        checksums[path] = get_entity_from_revision(repository=repository, path=path, bypass_cache=True).checksum
+
+    return checksums
+
+
+def _find_cached_activity(plan: Plan, repository, activity_gateway: IActivityGateway) -> Optional[Activity]:
+    """Return the latest activity that executed ``plan`` with the same parameters and inputs."""
+    output_paths = {str(o.actual_value) for o in plan.outputs}
+    if not output_paths:
+        return None
+
+    input_checksums = _get_checksums(repository, {str(i.actual_value) for i in plan.inputs})
+    if input_checksums is None:
+        return None
+
+    key = get_step_key(plan, input_checksums)
+
+    # NOTE: Only activities that generate one of the outputs are candidates; this avoids loading all activities
+    candidates = activity_gateway.get_activities_by_generation(next(iter(output_paths)))
+
+    for activity in sorted(candidates, key=lambda a: a.ended_at_time, reverse=True):
+        if set(activity.signature[1]) != output_paths:
+            continue
+
+        usage_checksums = {u.entity.path: u.entity.checksum for u in activity.usages}
+        if get_step_key(activity.plan_with_values, usage_checksums) == key:
+            return activity
+
+    return None
+
+
+def _restore_outputs(activity: Activity, repository) -> bool:
+    """Write outputs of an activity to the working tree; return False if any of them cannot be restored."""
+    generations = [g.entity for g in activity.generations]
+
+    if any(
+        isinstance(e, Collection) or not e.checksum or e.checksum == NON_EXISTING_ENTITY_CHECKSUM for e in generations
+    ):
+        return False
+
+    current_checksums = _get_checksums(repository, [e.path for e in generations]) or {}
+
+    for entity in generations:
+        if current_checksums.get(entity.path) == entity.checksum:
+            continue
+
+        destination = repository.path / entity.path
+        destination.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            with open(destination, "wb") as output_file:
+                repository.copy_content_to_file(entity.path, checksum=entity.checksum, output_file=output_file)
+        except errors.ExportError:
+            return False
+
+    return True
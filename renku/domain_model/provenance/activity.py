@@ -19,7 +19,7 @@
 
 from datetime import datetime
 from itertools import chain
-from typing import List, Optional, Union, cast
+from typing import List, Optional, Tuple, Union, cast
 from uuid import uuid4
 
 from werkzeug.utils import cached_property
@@ -91,17 +91,24 @@ class Generation(Immutable):
 class Activity(Persistent):
     """Represent an activity in the repository."""
 
+    cpu_time: Optional[float] = None
+    exit_code: Optional[int] = None
+    peak_memory: Optional[int] = None
+
     def __init__(
         self,
         *,
         agents: List[Union[Person, SoftwareAgent]],
         annotations: Optional[List[Annotation]] = None,
         association: Association,
+        cpu_time: Optional[float] = None,
         ended_at_time: datetime,
+        exit_code: Optional[int] = None,
         generations: Optional[List[Generation]] = None,
         id: str,
         invalidations: Optional[List[Entity]] = None,
         parameters: Optional[List[ParameterValue]] = None,
+        peak_memory: Optional[int] = None,
         project_id: Optional[str] = None,
         started_at_time: datetime,
         usages: Optional[List[Usage]] = None,
@@ -109,11 +116,15 @@ class Activity(Persistent):
         self.agents: List[Union[Person, SoftwareAgent]] = agents
         self.annotations: List[Annotation] = annotations or []
         self.association: Association = association
+        # NOTE: CPU time in seconds and peak resident set size in bytes of the executed command, if known
+        self.cpu_time: Optional[float] = cpu_time
         self.ended_at_time: datetime = ended_at_time
+        self.exit_code: Optional[int] = exit_code
         self.generations: List[Generation] = generations or []
         self.id: str = id
         self.invalidations: List[Entity] = invalidations or []
         self.parameters: List[ParameterValue] = parameters or []
+        self.peak_memory: Optional[int] = peak_memory
         self.project_id: Optional[str] = project_id
         self.started_at_time: datetime = started_at_time
         self.usages: List[Usage] = usages or []
@@ -135,6 +146,9 @@ class Activity(Persistent):
         ended_at_time: datetime,
         annotations: List[Annotation] = None,
         update_commits=False,
+        exit_code: Optional[int] = None,
+        cpu_time: Optional[float] = None,
+        peak_memory: Optional[int] = None,
     ):
         """Convert a ``Plan`` to a ``Activity``."""
         from renku.core.plugin.pluginmanager import get_plugin_manager
@@ -201,6 +215,9 @@ class Activity(Persistent):
             started_at_time=started_at_time,
             ended_at_time=ended_at_time,
             annotations=annotations,
+            exit_code=exit_code,
+            cpu_time=cpu_time,
+            peak_memory=peak_memory,
         )
 
         pm = get_plugin_manager()
@@ -229,11 +246,27 @@ class Activity(Persistent):
             uuid = uuid4().hex
         return f"/activities/{uuid}"
 
+    @property
+    def signature(self) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """Sorted input and output paths of the activity.
+
+        Usages and generations of an activity never change, so the signature is computed once and kept in a volatile
+        attribute that isn't stored in the database.
+        """
+        signature = getattr(self, "_v_signature", None)
+
+        if signature is None:
+            signature = (
+                tuple(sorted(u.entity.path for u in self.usages)),
+                tuple(sorted(g.entity.path for g in self.generations)),
+            )
+            self._v_signature = signature
+
+        return signature
+
     def has_identical_inputs_and_outputs_as(self, other: "Activity"):
         """Return true if all input and outputs paths are identical regardless of the order."""
-        return sorted(u.entity.path for u in self.usages) == sorted(u.entity.path for u in other.usages) and sorted(
-            g.entity.path for g in self.generations
-        ) == sorted(g.entity.path for g in other.generations)
+        return self.signature == other.signature
 
     def compare_to(self, other: "Activity") -> int:
         """Compare execution date with another activity; return a positive value if self is executed after the other."""
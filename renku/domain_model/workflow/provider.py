@@ -20,12 +20,47 @@
 from __future__ import annotations
 
 from abc import ABCMeta, abstractmethod
+from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 if TYPE_CHECKING:
     import networkx as nx
 
+    from renku.domain_model.workflow.plan import Plan
+
+
+class PlanExecution:
+    """Timing and resource usage of executing a single ``Plan``, as reported by a workflow provider."""
+
+    def __init__(
+        self,
+        *,
+        started_at_time: datetime,
+        ended_at_time: datetime,
+        exit_code: Optional[int] = None,
+        cpu_time: Optional[float] = None,
+        peak_memory: Optional[int] = None,
+    ):
+        self.started_at_time: datetime = started_at_time
+        self.ended_at_time: datetime = ended_at_time
+        self.exit_code: Optional[int] = exit_code
+        self.cpu_time: Optional[float] = cpu_time
+        self.peak_memory: Optional[int] = peak_memory
+
+    def attach_to(self, plan: "Plan") -> None:
+        """Store the execution on a plan of the executed workflow graph; it isn't persisted with the plan."""
+        plan._v_execution = self
+
+    @staticmethod
+    def pop(plan: "Plan") -> Optional["PlanExecution"]:
+        """Return and remove the execution that a provider stored on a plan, if any."""
+        execution = getattr(plan, "_v_execution", None)
+        if execution is not None:
+            del plan._v_execution
+
+        return execution
+
 
 class IWorkflowProvider(metaclass=ABCMeta):
     """Abstract class for executing ``Plan``."""
@@ -43,6 +78,9 @@ class IWorkflowProvider(metaclass=ABCMeta):
     def workflow_execute(self, dag: "nx.DiGraph", basedir: Path, config: Dict[str, Any]):
         """Executes a given ``AbstractPlan`` using the provider.
 
+        Providers can report timing and resource usage of each plan by attaching a ``PlanExecution`` to the plans of
+        the ``dag``.
+
         Returns:
             A list of output paths that were generated by this workflow.
         """
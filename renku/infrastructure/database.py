@@ -20,14 +20,24 @@
 import datetime
 import hashlib
 import importlib
-import io
 import json
+import mmap
+import os
+import shutil
+import struct
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from enum import Enum
 from pathlib import Path
 from types import BuiltinFunctionType, FunctionType
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union, cast
 from uuid import uuid4
 
+import msgpack
 import persistent
 import zstandard as zstd
 from BTrees.Length import Length
@@ -40,10 +50,14 @@ from zope.interface import implementer
 from zope.interface.interface import InterfaceClass
 
 from renku.core import errors
+from renku.core.util.os import get_absolute_path
 from renku.domain_model.project import Project
 from renku.infrastructure.immutable import Immutable
 from renku.infrastructure.persistent import Persistent
 
+if TYPE_CHECKING:
+    from renku.infrastructure.repository import Repository
+
 OID_TYPE = str
 TYPE_TYPE = "type"
 FUNCTION_TYPE = "function"
@@ -56,6 +70,12 @@ MARKER = object()
 NEW = z64  # NOTE: Do not change this value since this is the default when a Persistent object is created
 PERSISTED = b"1" * 8
 
+DEFAULT_CACHE_SIZE = 20000
+"""Default maximum number of objects that are kept loaded in the database cache."""
+
+DEFAULT_DICTIONARY_SIZE = 112640
+"""Default maximum size of trained zstd dictionaries in bytes."""
+
 
 def _is_module_allowed(module_name: str, type_name: str):
     """Checks whether it is allowed to import from the given module for security purposes.
@@ -154,6 +174,58 @@ class RenkuOOBTree(BTree):
     max_internal_size = 2000
 
 
+class Statistics:
+    """Counters and timers of database operations.
+
+    Timers are accumulated in seconds. Values can be updated concurrently since objects may be loaded in threads.
+    """
+
+    def __init__(self):
+        self._values: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, value: float = 1):
+        """Add a value to a counter.
+
+        Args:
+            name(str): Name of the counter.
+            value(float): Value to add (Default value = 1).
+        """
+        with self._lock:
+            self._values[name] = self._values.get(name, 0) + value
+
+    @contextmanager
+    def measure(self, name: str):
+        """Add time that is spent in a block to a timer.
+
+        Args:
+            name(str): Name of the timer.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.increment(name, time.perf_counter() - start)
+
+    def update(self, other: "Statistics"):
+        """Add all values of another statistics object."""
+        for name, value in other.as_dict().items():
+            self.increment(name, value)
+
+    def as_dict(self) -> Dict[str, float]:
+        """Return all values sorted by name."""
+        with self._lock:
+            return dict(sorted(self._values.items()))
+
+    def format(self) -> str:
+        """Return a human-readable representation of the values."""
+        lines = []
+        for name, value in self.as_dict().items():
+            lines.append(f"{name}: {value:.3f}s" if name.endswith("_time") else f"{name}: {int(value)}")
+
+        return "\n".join(lines)
+
+
 class Database:
     """The Metadata Object Database.
 
@@ -162,10 +234,29 @@ class Database:
     """
 
     ROOT_OID = "root"
+    PREFETCH_BATCH_SIZE = 64
 
-    def __init__(self, storage):
+    def __init__(self, storage, cache_size: Optional[int] = None):
+        """Create a database.
+
+        Args:
+            storage: The storage to load and store objects.
+            cache_size(Optional[int]): Maximum number of loaded objects to keep in the cache; unmodified objects that
+                exceed this limit are turned into ghosts. Defaults to ``RENKU_DATABASE_CACHE_SIZE`` environment
+                variable or ``DEFAULT_CACHE_SIZE``. Zero or a negative value disables eviction (Default value = None).
+        """
+        if cache_size is None:
+            cache_size = int(os.environ.get("RENKU_DATABASE_CACHE_SIZE", DEFAULT_CACHE_SIZE))
+
+        self.statistics: Statistics = Statistics()
+        # NOTE: The storage reports its I/O to the database's statistics
+        storage.statistics = self.statistics
         self._storage: Storage = storage
-        self._cache = Cache()
+        self._cache = Cache(max_size=cache_size if cache_size > 0 else None)
+        # NOTE: Number of objects that are being loaded; the cache is only trimmed when nothing is being loaded
+        self._loading: int = 0
+        # NOTE: Data of objects that is loaded by ``prefetch`` and is used when objects are activated
+        self._prefetched: Dict[OID_TYPE, Dict] = {}
         # The pre-cache is used by get to avoid infinite loops when objects load their state
         self._pre_cache: Dict[OID_TYPE, persistent.Persistent] = {}
         # Objects added explicitly by add() or when serializing other objects. After commit they are moved to _cache.
@@ -177,17 +268,40 @@ class Database:
         self._initialize_root()
 
     @classmethod
-    def from_path(cls, path: Union[Path, str]) -> "Database":
+    def from_path(cls, path: Union[Path, str], cache_size: Optional[int] = None) -> "Database":
         """Create a Storage and Database using the given path.
 
         Args:
             path(Union[pathlib.Path, str]): The path of the database.
+            cache_size(Optional[int]): Maximum number of loaded objects to keep in the cache (Default value = None).
 
         Returns:
             The database object.
         """
-        storage = Storage(path)
-        return Database(storage=storage)
+        storage = open_storage(path)
+        return Database(storage=storage, cache_size=cache_size)
+
+    @classmethod
+    def from_revision(
+        cls,
+        path: Union[Path, str],
+        repository: "Repository",
+        revision: str,
+        cache_size: Optional[int] = None,
+    ) -> "Database":
+        """Create a read-only Database with the state of a git revision without checking it out.
+
+        Args:
+            path(Union[pathlib.Path, str]): The path of the database.
+            repository(Repository): The repository that contains the database.
+            revision(str): The git revision to read the database from.
+            cache_size(Optional[int]): Maximum number of loaded objects to keep in the cache (Default value = None).
+
+        Returns:
+            The database object.
+        """
+        storage = RevisionStorage(path, repository=repository, revision=revision)
+        return Database(storage=storage, cache_size=cache_size)
 
     @staticmethod
     def generate_oid(object: persistent.Persistent) -> OID_TYPE:
@@ -337,22 +451,73 @@ class Database:
             return self._root[oid]
         object = self.get_cached(oid)
         if object is not None:
+            self.statistics.increment("cache_hits")
             return object
 
-        data = self._storage.load(filename=self._get_filename_from_oid(oid))
-        object = self._reader.deserialize(data)
-        object._p_changed = 0
-        object._p_serial = PERSISTED
-        if isinstance(object, Persistent):
-            object.freeze()
-
-        # NOTE: Avoid infinite loop if object tries to load its state before it is added to the cache
-        self._pre_cache[oid] = object
-        self._cache[oid] = object
-        self._pre_cache.pop(oid)
+        self.statistics.increment("cache_misses")
+        self._loading += 1
+        try:
+            data = self._prefetched.pop(oid, None)
+            if data is None:
+                data = self._storage.load(filename=self._get_filename_from_oid(oid))
+            self.statistics.increment("objects_loaded")
+            object = self._reader.deserialize(data)
+            object._p_changed = 0
+            object._p_serial = PERSISTED
+            if isinstance(object, Persistent):
+                object.freeze()
+
+            # NOTE: Avoid infinite loop if object tries to load its state before it is added to the cache
+            self._pre_cache[oid] = object
+            self._cache[oid] = object
+            self._pre_cache.pop(oid)
+        finally:
+            self._loading -= 1
+
+        self._trim_cache()
 
         return object
 
+    def get_many(self, oids: Iterable[OID_TYPE], pin: bool = False) -> List[persistent.Persistent]:
+        """Get multiple objects by their ``oid``.
+
+        Data of objects that aren't loaded yet is read and decoded concurrently in a thread pool like in ``prefetch``.
+
+        Args:
+            oids(Iterable[OID_TYPE]): The oids of the objects to get.
+            pin(bool): Whether to keep the objects loaded as long as the returned list is referenced; otherwise, they
+                can be evicted once the cache is full (Default value = False).
+
+        Returns:
+            List[persistent.Persistent]: The objects in the same order as ``oids``.
+        """
+        oids = list(oids)
+        missing = [oid for oid in dict.fromkeys(oids) if oid not in self._root and self.get_cached(oid) is None]
+        # NOTE: Keep loaded objects since the cache might evict them before all objects are loaded
+        loaded: Dict[OID_TYPE, persistent.Persistent] = {}
+
+        if len(missing) >= self.PREFETCH_BATCH_SIZE:
+
+            def load(oid: OID_TYPE):
+                return self._storage.load(filename=self._get_filename_from_oid(oid))
+
+            with ThreadPoolExecutor() as executor, self._suspend_eviction(pin) as suspend_batch_eviction:
+                for start in range(0, len(missing), self.PREFETCH_BATCH_SIZE):
+                    batch = missing[start : start + self.PREFETCH_BATCH_SIZE]
+                    with suspend_batch_eviction():
+                        for oid, data in zip(batch, executor.map(load, batch)):
+                            self._prefetched[oid] = data
+                            loaded[oid] = self.get(oid)
+                            # NOTE: The object might have been loaded in the meantime and its data wasn't used
+                            self._prefetched.pop(oid, None)
+
+        objects = [loaded[oid] if oid in loaded else self.get(oid) for oid in oids]
+        if pin:
+            objects = self._cache.pin(objects)
+        self._trim_cache()
+
+        return objects
+
     def get_by_id(self, id: str) -> persistent.Persistent:
         """Return an object by its id.
 
@@ -417,20 +582,118 @@ class Database:
         Args:
             object(persistent.Persistent): The object to set the state on.
         """
-        data = self._storage.load(filename=self._get_filename_from_oid(object._p_oid))
-        self._reader.set_ghost_state(object, data)
-        object._p_serial = PERSISTED
-        if isinstance(object, Persistent):
-            object.freeze()
+        self.statistics.increment("objects_loaded")
+        self._loading += 1
+        try:
+            data = self._prefetched.pop(object._p_oid, None)
+            if data is None:
+                data = self._storage.load(filename=self._get_filename_from_oid(object._p_oid))
+            self._reader.set_ghost_state(object, data)
+            object._p_serial = PERSISTED
+            if isinstance(object, Persistent):
+                object.freeze()
+
+            # NOTE: Re-activated objects that were evicted before are tracked by the cache again
+            if self._cache.get(object._p_oid) is object:
+                self._cache[object._p_oid] = object
+        finally:
+            self._loading -= 1
+
+        self._trim_cache()
+
+    def prefetch(self, objects: Iterable[persistent.Persistent], pin: bool = False) -> List[persistent.Persistent]:
+        """Load the state of multiple ghost objects at once.
+
+        Objects' data is read and decoded concurrently in a thread pool, which is considerably faster than loading
+        objects one by one when they are accessed. Unless ``pin`` is set, objects are only kept loaded while their
+        batch is loaded, so that the cache stays within its size limit; objects that are evicted afterwards are
+        reloaded when they are accessed.
+
+        Args:
+            objects(Iterable[persistent.Persistent]): Objects to load; objects that are not ghosts are ignored.
+            pin(bool): Whether to keep the objects loaded as long as the returned list is referenced
+                (Default value = False).
+
+        Returns:
+            List[persistent.Persistent]: List of all passed objects.
+        """
+        objects = list(objects)
+        ghosts = [o for o in objects if o._p_jar is self and o._p_state == GHOST]
+
+        def load(object: persistent.Persistent):
+            return self._storage.load(filename=self._get_filename_from_oid(object._p_oid))
+
+        with self._suspend_eviction(pin) as suspend_batch_eviction:
+            if len(ghosts) < self.PREFETCH_BATCH_SIZE:
+                with suspend_batch_eviction():
+                    for object in ghosts:
+                        object._p_activate()
+            else:
+                with ThreadPoolExecutor() as executor:
+                    for start in range(0, len(ghosts), self.PREFETCH_BATCH_SIZE):
+                        batch = ghosts[start : start + self.PREFETCH_BATCH_SIZE]
+                        with suspend_batch_eviction():
+                            for object, data in zip(batch, executor.map(load, batch)):
+                                if object._p_state != GHOST:
+                                    continue
+                                self._prefetched[object._p_oid] = data
+                                # NOTE: This calls ``setstate`` which uses the prefetched data
+                                object._p_activate()
+
+        if pin:
+            objects = self._cache.pin(objects)
+        self._trim_cache()
+
+        return objects
+
+    @contextmanager
+    def _suspend_eviction(self, all_batches: bool):
+        """Don't evict objects while they are loaded.
+
+        Args:
+            all_batches(bool): Whether to suspend eviction until all batches are loaded or only for each batch.
+
+        Returns:
+            A context manager to suspend eviction while a single batch is loaded.
+        """
+
+        @contextmanager
+        def suspend_batch_eviction():
+            self._loading += 1
+            try:
+                yield
+            finally:
+                self._loading -= 1
+            self._trim_cache()
+
+        if not all_batches:
+            yield suspend_batch_eviction
+            return
+
+        # NOTE: Objects are kept loaded until they are pinned
+        self._loading += 1
+        try:
+            yield suspend_batch_eviction
+        finally:
+            self._loading -= 1
 
     def commit(self):
         """Commit modified and new objects."""
-        while self._objects_to_commit:
-            _, object = self._objects_to_commit.popitem()
-            if object._p_changed or object._p_serial == NEW:
-                self._store_object(object)
+        with self.statistics.measure("commit_time"), self._storage.batch():
+            while self._objects_to_commit:
+                _, object = self._objects_to_commit.popitem()
+                if object._p_changed or object._p_serial == NEW:
+                    self._store_object(object)
+
+        self._trim_cache()
+
+    def _trim_cache(self):
+        """Turn least-recently used objects into ghosts if the cache is full."""
+        if self._loading == 0:
+            self._cache.evict(keep=lambda o: o._p_oid == Database.ROOT_OID or o._p_oid in self._objects_to_commit)
 
     def _store_object(self, object: persistent.Persistent):
+        self.statistics.increment("objects_stored")
         data = self._writer.serialize(object)
         compress = False if isinstance(object, (Catalog, RenkuOOBTree, OOBucket, Project, Index)) else True
         self._storage.store(filename=self._get_filename_from_oid(object._p_oid), data=data, compress=compress)
@@ -471,19 +734,45 @@ class Database:
         raise NotImplementedError
 
 
+class PinnedObjects(list):
+    """A list of objects that the database cache doesn't evict as long as the list is referenced.
+
+    Objects that are added to the list later on are not pinned.
+    """
+
+    def __init__(self, objects: Iterable[persistent.Persistent]):
+        super().__init__(objects)
+        self.oids: Set[OID_TYPE] = {o._p_oid for o in self if getattr(o, "_p_oid", None) is not None}
+
+
 @implementer(IPickleCache)
 class Cache:
-    """Database ``Cache``."""
+    """Database ``Cache``.
 
-    def __init__(self):
-        self._entries = {}
+    If ``max_size`` is set, the cache keeps at most that many objects loaded; least-recently used objects above this
+    limit are turned into ghosts when ``evict`` is called. Evicted objects are only weakly referenced, so they are
+    garbage-collected once nothing else refers to them or are re-activated (i.e. reloaded from storage) when they are
+    accessed again. Objects that are pinned by a live ``PinnedObjects`` list are never evicted and don't count
+    towards the limit.
+    """
+
+    EVICTION_RATIO = 0.9
+
+    def __init__(self, max_size: Optional[int] = None):
+        self.max_size: Optional[int] = max_size
+        self._entries: "OrderedDict[OID_TYPE, persistent.Persistent]" = OrderedDict()
+        self._ghosts: "weakref.WeakValueDictionary[OID_TYPE, persistent.Persistent]" = weakref.WeakValueDictionary()
+        self._pins: "weakref.WeakValueDictionary[int, PinnedObjects]" = weakref.WeakValueDictionary()
 
     def __len__(self):
-        return len(self._entries)
+        return len(self._entries) + len(self._ghosts)
 
     def __getitem__(self, oid):
-        assert isinstance(oid, OID_TYPE), f"Invalid oid type: '{type(oid)}'"
-        return self._entries[oid]
+        object = self.get(oid)
+        if object is None:
+            raise KeyError(oid)
+
+        return object
 
     def __setitem__(self, oid, object):
         assert isinstance(object, persistent.Persistent), f"Cannot cache non-Persistent objects: '{object}'"
@@ -492,20 +781,22 @@ class Cache:
         assert object._p_jar is not None, "Cached object jar missing"
         assert oid == object._p_oid, f"Cache key does not match oid: {oid} != {object._p_oid}"
 
-        if oid in self._entries:
-            existing_data = self.get(oid)
-            if existing_data is not object:
-                raise ValueError(f"The same oid exists: {existing_data} != {object}")
+        existing_data = self.get(oid)
+        if existing_data is not None and existing_data is not object:
+            raise ValueError(f"The same oid exists: {existing_data} != {object}")
 
+        self._ghosts.pop(oid, None)
         self._entries[oid] = object
 
     def __delitem__(self, oid):
         assert isinstance(oid, OID_TYPE), f"Invalid oid type: '{type(oid)}'"
-        self._entries.pop(oid)
+        if self._entries.pop(oid, None) is None:
+            self._ghosts.pop(oid)
 
     def clear(self):
         """Remove all entries."""
         self._entries.clear()
+        self._ghosts.clear()
 
     def pop(self, oid, default=MARKER):
         """Remove and return an object.
@@ -518,7 +809,14 @@ class Cache:
         Returns:
             The removed object or the default value if it doesn't exist.
         """
-        return self._entries.pop(oid) if default is MARKER else self._entries.pop(oid, default)
+        object = self._entries.pop(oid, None)
+        if object is None:
+            object = self._ghosts.pop(oid, None)
+        if object is not None:
+            return object
+        if default is MARKER:
+            raise KeyError(oid)
+        return default
 
     def get(self, oid, default=None):
         """See ``IPickleCache``.
@@ -531,13 +829,18 @@ class Cache:
             The object or default value if the object wasn't found.
         """
         assert isinstance(oid, OID_TYPE), f"Invalid oid type: '{type(oid)}'"
-        return self._entries.get(oid, default)
+        object = self._entries.get(oid)
+        if object is not None:
+            self._entries.move_to_end(oid)
+            return object
+
+        return self._ghosts.get(oid, default)
 
     def new_ghost(self, oid, object):
         """See ``IPickleCache``."""
         assert object._p_oid is None, f"Object already has an oid: {object}"
         assert object._p_jar is not None, f"Object does not have a jar: {object}"
-        assert oid not in self._entries, f"Duplicate oid: {oid}"
+        assert oid not in self._entries and oid not in self._ghosts, f"Duplicate oid: {oid}"
 
         object._p_oid = oid
         if object._p_state != GHOST:
@@ -545,6 +848,68 @@ class Cache:
 
         self[oid] = object
 
+    def pin(self, objects: Iterable[persistent.Persistent]) -> PinnedObjects:
+        """Return a list of objects that aren't evicted as long as the list is referenced.
+
+        Args:
+            objects(Iterable[persistent.Persistent]): Objects to pin.
+
+        Returns:
+            PinnedObjects: A list of the passed objects.
+        """
+        pinned = PinnedObjects(objects)
+        if self.max_size is not None and pinned.oids:
+            self._pins[id(pinned)] = pinned
+
+        return pinned
+
+    def evict(self, keep: Callable[[persistent.Persistent], bool] = None):
+        """Turn least-recently used objects into ghosts if the cache exceeds its size limit.
+
+        Only ghosts and unmodified objects that were loaded from storage are evicted; objects that cannot be weakly
+        referenced are kept. To avoid trimming the cache on every access, objects are evicted until the cache is
+        below ``EVICTION_RATIO`` of its size limit.
+
+        Args:
+            keep(Callable[[persistent.Persistent], bool], optional): A predicate for objects that must not be evicted
+                (Default value = None).
+        """
+        if self.max_size is None or len(self._entries) <= self.max_size:
+            return
+
+        pins = list(self._pins.values())
+        # NOTE: Pinned objects don't count towards the size limit; this avoids scanning the cache on each call
+        if len(self._entries) <= self.max_size + sum(len(p.oids) for p in pins):
+            return
+
+        pinned = set().union(*(p.oids for p in pins))
+        target_size = int(self.max_size * self.EVICTION_RATIO) + len(pinned)
+        # NOTE: Look at each entry at most once; objects that cannot be evicted are moved to the end of the queue
+        for _ in range(len(self._entries)):
+            if len(self._entries) <= target_size:
+                break
+
+            oid, object = next(iter(self._entries.items()))
+
+            if object._p_state != GHOST and (
+                oid in pinned
+                or object._p_changed
+                or object._p_serial != PERSISTED
+                or isinstance(object, Index)
+                or (keep is not None and keep(object))
+            ):
+                self._entries.move_to_end(oid)
+                continue
+
+            try:
+                self._ghosts[oid] = object
+            except TypeError:  # NOTE: Object doesn't support weak references
+                self._entries.move_to_end(oid)
+                continue
+
+            del self._entries[oid]
+            object._p_deactivate()
+
 
 class Index(persistent.Persistent):
     """Database index."""
@@ -708,15 +1073,202 @@ class Index(persistent.Persistent):
         return correct_key
 
 
+class Codec:
+    """Convert serialized object data to bytes and back."""
+
+    NAME = ""
+    MAGIC = b""
+    """Prefix of encoded data that identifies the codec; empty for codecs whose data doesn't have a prefix."""
+
+    def encode(self, data: Union[Dict, List], readable: bool = False) -> bytes:
+        """Encode data.
+
+        Args:
+            data(Union[Dict, List]): The data to encode.
+            readable(bool): Whether to prefer a human-readable output if the codec supports it (Default value = False).
+
+        Returns:
+            bytes: The encoded data.
+        """
+        raise NotImplementedError
+
+    def decode(self, data: bytes) -> Union[Dict, List]:
+        """Decode data.
+
+        Args:
+            data(bytes): The encoded data.
+
+        Returns:
+            Union[Dict, List]: The decoded data.
+        """
+        raise NotImplementedError
+
+
+class JsonCodec(Codec):
+    """Encode data as JSON."""
+
+    NAME = "json"
+
+    def encode(self, data: Union[Dict, List], readable: bool = False) -> bytes:
+        """Encode data as JSON; readable output is indented and has sorted keys."""
+        if readable:
+            return json.dumps(data, ensure_ascii=False, sort_keys=True, indent=2).encode("utf-8")
+
+        return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+    def decode(self, data: bytes) -> Union[Dict, List]:
+        """Decode JSON data."""
+        return json.loads(data)
+
+
+class BinaryCodec(Codec):
+    """Encode data in the compact binary MessagePack format."""
+
+    NAME = "msgpack"
+    # NOTE: 0xc1 is never used in MessagePack and cannot start a JSON document
+    MAGIC = b"\xc1RNK"
+
+    def encode(self, data: Union[Dict, List], readable: bool = False) -> bytes:
+        """Encode data as MessagePack; there is no readable form."""
+        return self.MAGIC + msgpack.packb(data, use_bin_type=True)
+
+    def decode(self, data: bytes) -> Union[Dict, List]:
+        """Decode MessagePack data."""
+        return msgpack.unpackb(memoryview(data)[len(self.MAGIC) :], raw=False, strict_map_key=False)
+
+
+CODECS: Dict[str, Codec] = {codec.NAME: codec for codec in (JsonCodec(), BinaryCodec())}
+DEFAULT_CODEC = JsonCodec.NAME
+
+
+def get_codec(name: str) -> Codec:
+    """Return a codec by its name.
+
+    Args:
+        name(str): Name of the codec.
+
+    Returns:
+        Codec: The codec.
+    """
+    codec = CODECS.get(name)
+    if codec is None:
+        raise errors.ParameterError(f"Invalid metadata codec '{name}', valid codecs are: {', '.join(CODECS)}")
+
+    return codec
+
+
 class Storage:
     """Store Persistent objects on the disk."""
 
     OID_FILENAME_LENGTH = 64
+    CODEC_FILENAME = "codec"
+    DICTIONARY_FILENAME = "dictionary"
+    DICTIONARIES_DIRECTORY = "dictionaries"
 
-    def __init__(self, path: Union[Path, str]):
+    def __init__(self, path: Union[Path, str], codec: Optional[str] = None):
         self.path = Path(path)
-        self.zstd_compressor = zstd.ZstdCompressor()
-        self.zstd_decompressor = zstd.ZstdDecompressor()
+        self.statistics: Statistics = Statistics()
+        self._dictionaries: Dict[int, zstd.ZstdCompressionDict] = {}
+        self._local = threading.local()
+
+        codec_name = self._read_file(self.CODEC_FILENAME)
+        self.codec: Codec = get_codec(codec or (codec_name.decode("utf-8").strip() if codec_name else DEFAULT_CODEC))
+
+        dictionary_id = self._read_file(self.DICTIONARY_FILENAME)
+        dictionary_id = int(dictionary_id) if dictionary_id else 0
+        if dictionary_id:
+            self.zstd_compressor = zstd.ZstdCompressor(dict_data=self.get_dictionary(dictionary_id))
+        else:
+            self.zstd_compressor = zstd.ZstdCompressor()
+
+    @classmethod
+    def get_codec_name(cls, path: Union[Path, str]) -> str:
+        """Return name of the codec that is used to write new objects in the storage at path."""
+        codec_path = Path(path) / cls.CODEC_FILENAME
+        if not codec_path.exists():
+            return DEFAULT_CODEC
+
+        return codec_path.read_text().strip()
+
+    @classmethod
+    def get_dictionary_id(cls, path: Union[Path, str]) -> int:
+        """Return id of the zstd dictionary that is used to compress new objects in the storage at path or 0."""
+        dictionary_path = Path(path) / cls.DICTIONARY_FILENAME
+        if not dictionary_path.exists():
+            return 0
+
+        return int(dictionary_path.read_text().strip())
+
+    def get_dictionary(self, dictionary_id: int) -> zstd.ZstdCompressionDict:
+        """Return a zstd dictionary that is stored in the storage.
+
+        Args:
+            dictionary_id(int): Id of the dictionary.
+
+        Returns:
+            zstd.ZstdCompressionDict: The dictionary.
+        """
+        dictionary = self._dictionaries.get(dictionary_id)
+        if dictionary is None:
+            filename = f"{self.DICTIONARIES_DIRECTORY}/{dictionary_id}"
+            data = self._read_file(filename)
+            if data is None:
+                raise errors.ObjectNotFoundError(filename)
+
+            dictionary = zstd.ZstdCompressionDict(data)
+            self._dictionaries[dictionary_id] = dictionary
+
+        return dictionary
+
+    def add_dictionary(self, dictionary: zstd.ZstdCompressionDict):
+        """Store a zstd dictionary and use it to compress new objects.
+
+        Args:
+            dictionary(zstd.ZstdCompressionDict): The dictionary to add.
+        """
+        dictionary_id = dictionary.dict_id()
+
+        path = self.path / self.DICTIONARIES_DIRECTORY / str(dictionary_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(dictionary.as_bytes())
+        (self.path / self.DICTIONARY_FILENAME).write_text(f"{dictionary_id}\n")
+
+        self._dictionaries[dictionary_id] = dictionary
+        self.zstd_compressor = zstd.ZstdCompressor(dict_data=dictionary)
+
+    def get_zstd_decompressor(self, dictionary_id: int = 0) -> zstd.ZstdDecompressor:
+        """Return a zstd decompressor for the current thread that uses a dictionary.
+
+        Args:
+            dictionary_id(int): Id of the dictionary; 0 means no dictionary (Default value = 0).
+
+        Returns:
+            zstd.ZstdDecompressor: The decompressor.
+        """
+        if dictionary_id == 0:
+            return self.zstd_decompressor
+
+        decompressors = getattr(self._local, "dictionary_decompressors", None)
+        if decompressors is None:
+            decompressors = {}
+            self._local.dictionary_decompressors = decompressors
+
+        decompressor = decompressors.get(dictionary_id)
+        if decompressor is None:
+            decompressor = zstd.ZstdDecompressor(dict_data=self.get_dictionary(dictionary_id))
+            decompressors[dictionary_id] = decompressor
+
+        return decompressor
+
+    @property
+    def zstd_decompressor(self) -> zstd.ZstdDecompressor:
+        """Return a zstd decompressor for the current thread since decompressors are not thread-safe."""
+        decompressor = getattr(self._local, "zstd_decompressor", None)
+        if decompressor is None:
+            decompressor = zstd.ZstdDecompressor()
+            self._local.zstd_decompressor = decompressor
+
+        return decompressor
 
     def store(self, filename: str, data: Union[Dict, List], compress=False):
         """Store object.
@@ -728,21 +1280,13 @@ class Storage:
         """
         assert isinstance(filename, str)
 
-        is_oid_path = len(filename) == Storage.OID_FILENAME_LENGTH
-        if is_oid_path:
-            path = self.path / filename[0:2] / filename[2:4] / filename
-            path.parent.mkdir(parents=True, exist_ok=True)
-        else:
-            path = self.path / filename
-            self.path.mkdir(parents=True, exist_ok=True)
+        with self.statistics.measure("encode_time"):
+            encoded_data = self._encode(data, compress=compress)
 
-        if compress:
-            with open(path, "wb") as f, self.zstd_compressor.stream_writer(f) as compressor:
-                with io.TextIOWrapper(compressor) as out:
-                    json.dump(data, out, ensure_ascii=False)
-        else:
-            with open(path, "wt") as f:  # type: ignore
-                json.dump(data, f, ensure_ascii=False, sort_keys=True, indent=2)  # type: ignore
+        with self.statistics.measure("write_time"):
+            self.store_raw(filename=filename, data=encoded_data)
+
+        self.statistics.increment("bytes_written", len(encoded_data))
 
     def load(self, filename: str):
         """Load data for object with object id oid.
@@ -755,25 +1299,745 @@ class Storage:
         """
         assert isinstance(filename, str)
 
+        with self.statistics.measure("read_time"):
+            data = self.load_raw(filename=filename)
+
+        self.statistics.increment("bytes_read", len(data))
+
+        with self.statistics.measure("decode_time"):
+            return self._decode(data)
+
+    @contextmanager
+    def batch(self):
+        """Group writes of multiple objects, e.g. all objects of a commit; loose-file storages write them directly."""
+        yield
+
+    def store_raw(self, filename: str, data: bytes):
+        """Store already encoded (and possibly compressed) data of an object.
+
+        Args:
+            filename(str): Target file name to store data in.
+            data(bytes): The encoded data to store.
+        """
+        path = self._get_path(filename)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+    def load_raw(self, filename: str) -> bytes:
+        """Load encoded data of an object without decoding it.
+
+        Args:
+            filename(str): The file name of the data to load.
+
+        Returns:
+            bytes: The encoded data.
+        """
+        path = self._get_path(filename)
+
+        if not path.exists():
+            raise errors.ObjectNotFoundError(filename)
+
+        return path.read_bytes()
+
+    def exists(self, filename: str) -> bool:
+        """Return True if filename exists in the storage."""
+        return self._get_path(filename).exists()
+
+    def remove(self, filename: str):
+        """Remove an object from the storage.
+
+        Args:
+            filename(str): The file name of the object to remove.
+        """
+        path = self._get_path(filename)
+        path.unlink()
+
+        # NOTE: Remove empty fan-out directories
+        for parent in list(path.parents)[: len(path.relative_to(self.path).parents) - 1]:
+            if any(parent.iterdir()):
+                break
+            parent.rmdir()
+
+    def filenames(self) -> List[str]:
+        """Return file names of all objects in the storage."""
+        if not self.path.exists():
+            return []
+
+        reserved = (*PackedStorage.FILENAMES, Storage.CODEC_FILENAME, Storage.DICTIONARY_FILENAME)
+        filenames = [f.name for f in self.path.iterdir() if f.is_file() and f.name not in reserved]
+        filenames.extend(f.name for f in self.path.glob("*/*/*") if len(f.name) == Storage.OID_FILENAME_LENGTH)
+
+        return filenames
+
+    def _read_file(self, filename: str) -> Optional[bytes]:
+        """Return content of a file that is not an object (e.g. the codec file) or None if it doesn't exist."""
+        path = self.path / filename
+        if not path.exists():
+            return None
+
+        return path.read_bytes()
+
+    def _get_path(self, filename: str) -> Path:
+        """Return path of an object in the storage; objects with oid-like names are fanned out in subdirectories."""
         is_oid_path = len(filename) == Storage.OID_FILENAME_LENGTH
         if is_oid_path:
-            path = self.path / filename[0:2] / filename[2:4] / filename
-        else:
-            path = self.path / filename
+            return self.path / filename[0:2] / filename[2:4] / filename
 
-        if not path.exists():
+        return self.path / filename
+
+    def _encode(self, data: Union[Dict, List], compress: bool) -> bytes:
+        """Encode data with the storage's codec and optionally compress it."""
+        if compress:
+            return self.zstd_compressor.compress(self.codec.encode(data))
+
+        return self.codec.encode(data, readable=True)
+
+    @staticmethod
+    def _is_compressed(data: bytes) -> bool:
+        return int.from_bytes(data[:4], "little") == zstd.MAGIC_NUMBER
+
+    def _decompress(self, data: bytes) -> bytes:
+        """Decompress data if it's compressed."""
+        if not self._is_compressed(data):
+            return data
+
+        # NOTE: Objects that were compressed with a dictionary record its id in their frame header
+        decompressor = self.get_zstd_decompressor(zstd.get_frame_parameters(data).dict_id)
+        with decompressor.stream_reader(data) as zfile:
+            data = zfile.readall()
+
+        self.statistics.increment("bytes_decompressed", len(data))
+
+        return data
+
+    def _decode(self, data: bytes):
+        """Decompress data if needed and decode it with the codec that it was encoded with."""
+        data = self._decompress(data)
+
+        # NOTE: Objects can be encoded with any codec regardless of the one that is selected for the storage
+        if data[: len(BinaryCodec.MAGIC)] == BinaryCodec.MAGIC:
+            return CODECS[BinaryCodec.NAME].decode(data)
+
+        return CODECS[JsonCodec.NAME].decode(data)
+
+
+class PackedStorage(Storage):
+    """Store Persistent objects in an append-only pack file.
+
+    All objects are appended to a single pack file and their location is recorded in a sidecar index file. Each index
+    entry is a fixed-size record of (filename, offset, length); since the index is append-only as well, later entries
+    for a filename override earlier ones and an entry with zero length marks a removed object. Objects are read from
+    a memory-mapped pack file.
+
+    Writes inside ``batch`` are buffered and appended at once when the batch ends. Since every commit appends new
+    versions of modified objects, the pack is rewritten with only the current data of its objects once outdated data
+    makes up more than ``REPACK_THRESHOLD`` of it.
+    """
+
+    PACK_FILENAME = "objects.pack"
+    INDEX_FILENAME = "objects.idx"
+    FILENAMES = (PACK_FILENAME, INDEX_FILENAME)
+    INDEX_ENTRY = struct.Struct(f"<{Storage.OID_FILENAME_LENGTH}sQQ")
+    REPACK_THRESHOLD = 0.5
+    REPACK_MIN_SIZE = 1024 * 1024
+
+    def __init__(self, path: Union[Path, str], codec: Optional[str] = None):
+        super().__init__(path, codec=codec)
+        self._entries: Optional[Dict[str, Tuple[int, int]]] = None
+        self._pack: Optional[mmap.mmap] = None
+        self._lock = threading.RLock()
+        # NOTE: Buffered writes of the current batch; None data marks a removed object
+        self._pending: Optional[Dict[str, Optional[bytes]]] = None
+
+    @classmethod
+    def is_packed(cls, path: Union[Path, str]) -> bool:
+        """Return True if the storage at path is a packed storage."""
+        return (Path(path) / cls.INDEX_FILENAME).exists()
+
+    @classmethod
+    def parse_index(cls, data: bytes) -> Dict[str, Tuple[int, int]]:
+        """Parse content of an index file.
+
+        Args:
+            data(bytes): Content of an index file.
+
+        Returns:
+            Dict[str, Tuple[int, int]]: Mapping of filenames to their offset and length in the pack file; removed
+                objects are not included.
+        """
+        entries = {}
+        # NOTE: Ignore a partially-written entry at the end of the index
+        end = len(data) - len(data) % cls.INDEX_ENTRY.size
+
+        for key, offset, length in cls.INDEX_ENTRY.iter_unpack(memoryview(data)[:end]):
+            filename = key.rstrip(b"\0").decode("utf-8")
+            if length == 0:
+                entries.pop(filename, None)
+            else:
+                entries[filename] = (offset, length)
+
+        return entries
+
+    @property
+    def pack_path(self) -> Path:
+        """Path of the pack file."""
+        return self.path / self.PACK_FILENAME
+
+    @property
+    def index_path(self) -> Path:
+        """Path of the index file."""
+        return self.path / self.INDEX_FILENAME
+
+    def store_raw(self, filename: str, data: bytes):
+        """Append encoded data of an object to the pack file.
+
+        Args:
+            filename(str): Name of the object.
+            data(bytes): The encoded data to store.
+        """
+        self.store_raw_many([(filename, data)])
+
+    def store_raw_many(self, objects: Iterable[Tuple[str, bytes]]):
+        """Append encoded data of multiple objects to the pack file.
+
+        Args:
+            objects(Iterable[Tuple[str, bytes]]): Pairs of object names and their encoded data.
+        """
+        if self._pending is None:
+            self._write(objects)
+            return
+
+        for filename, data in objects:
+            assert len(data) > 0, f"Cannot store empty object: '{filename}'"
+            self._pending[filename] = data
+
+    @contextmanager
+    def batch(self):
+        """Buffer writes and append them to the pack and index files at once when the batch ends."""
+        if self._pending is not None:
+            yield
+            return
+
+        self._pending = {}
+        try:
+            yield
+        except BaseException:
+            # NOTE: Don't write a partial batch, e.g. when serializing some objects of a commit failed
+            self._pending = None
+            raise
+
+        pending, self._pending = self._pending, None
+        self._write(pending.items())
+
+        self.repack_if_needed()
+
+    def repack_if_needed(self) -> bool:
+        """Rewrite the pack file if outdated and removed data makes up more than ``REPACK_THRESHOLD`` of it.
+
+        Returns:
+            bool: Whether the pack file was rewritten.
+        """
+        if not self.pack_path.exists():
+            return False
+
+        size = self.pack_path.stat().st_size
+        live_size = sum(length for _, length in self._get_entries().values())
+        if size < self.REPACK_MIN_SIZE or size - live_size <= size * self.REPACK_THRESHOLD:
+            return False
+
+        self.repack()
+        return True
+
+    def repack(self) -> int:
+        """Rewrite the pack file so that it only contains the current data of its objects.
+
+        Returns:
+            int: Number of repacked objects.
+        """
+        filenames = sorted(self.filenames())
+
+        # NOTE: Write pack to temporary files first so that an interrupted repack leaves the storage intact
+        temporary = _create_temporary_pack(self.path)
+        temporary.store_raw_many((filename, self.load_raw(filename)) for filename in filenames)
+
+        with self._lock:
+            self.close()
+            temporary.pack_path.replace(self.pack_path)
+            temporary.index_path.replace(self.index_path)
+            temporary.path.rmdir()
+            self._entries = None
+
+        return len(filenames)
+
+    def load_raw(self, filename: str) -> bytes:
+        """Load encoded data of an object from the pack file.
+
+        Args:
+            filename(str): Name of the object to load.
+
+        Returns:
+            bytes: The encoded data.
+        """
+        if self._pending is not None and filename in self._pending:
+            data = self._pending[filename]
+            if data is None:
+                raise errors.ObjectNotFoundError(filename)
+            return data
+
+        entry = self._get_entries().get(filename)
+        if entry is None:
+            raise errors.ObjectNotFoundError(filename)
+
+        offset, length = entry
+        with self._lock:
+            pack = self._get_pack(size=offset + length)
+            return pack[offset : offset + length]
+
+    def exists(self, filename: str) -> bool:
+        """Return True if filename exists in the storage."""
+        if self._pending is not None and filename in self._pending:
+            return self._pending[filename] is not None
+
+        return filename in self._get_entries()
+
+    def remove(self, filename: str):
+        """Mark an object as removed in the index; its data stays in the pack file until it's rewritten.
+
+        Args:
+            filename(str): Name of the object to remove.
+        """
+        if not self.exists(filename):
             raise errors.ObjectNotFoundError(filename)
 
-        with open(path, "rb") as file:
-            header = int.from_bytes(file.read(4), "little")
-            file.seek(0)
-            if header == zstd.MAGIC_NUMBER:
-                with self.zstd_decompressor.stream_reader(file) as zfile:
-                    data = json.load(zfile)
+        if self._pending is not None:
+            self._pending[filename] = None
+        else:
+            self._write([(filename, None)])
+
+    def filenames(self) -> List[str]:
+        """Return names of all objects in the storage."""
+        filenames = dict.fromkeys(self._get_entries().keys())
+
+        for filename, data in (self._pending or {}).items():
+            if data is None:
+                filenames.pop(filename, None)
             else:
-                data = json.load(file)
+                filenames[filename] = None
+
+        return list(filenames)
+
+    def close(self):
+        """Release the memory-mapped pack file."""
+        with self._lock:
+            if self._pack is not None:
+                self._pack.close()
+                self._pack = None
+
+    def _write(self, objects: Iterable[Tuple[str, Optional[bytes]]]):
+        """Append objects to the pack file and their entries to the index; None data removes an object."""
+        entries = self._get_entries()
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        with open(self.pack_path, "ab") as pack, open(self.index_path, "ab") as index:
+            offset = pack.tell()
+            for filename, data in objects:
+                if data is None:
+                    index.write(self._pack_entry(filename, 0, 0))
+                    entries.pop(filename, None)
+                    continue
+
+                assert len(data) > 0, f"Cannot store empty object: '{filename}'"
+
+                pack.write(data)
+                index.write(self._pack_entry(filename, offset, len(data)))
+                entries[filename] = (offset, len(data))
+                offset += len(data)
+
+    def _pack_entry(self, filename: str, offset: int, length: int) -> bytes:
+        key = filename.encode("utf-8")
+        assert len(key) <= Storage.OID_FILENAME_LENGTH, f"Object name is too long: '{filename}'"
+
+        return self.INDEX_ENTRY.pack(key, offset, length)
+
+    def _get_entries(self) -> Dict[str, Tuple[int, int]]:
+        with self._lock:
+            if self._entries is None:
+                self._entries = self.parse_index(self.index_path.read_bytes()) if self.index_path.exists() else {}
+
+            return self._entries
+
+    def _get_pack(self, size: int) -> mmap.mmap:
+        """Return a memory map of the pack file that is at least ``size`` bytes long."""
+        with self._lock:
+            if self._pack is None or len(self._pack) < size:
+                self.close()
+                with open(self.pack_path, "rb") as pack:
+                    self._pack = mmap.mmap(pack.fileno(), 0, access=mmap.ACCESS_READ)
+
+            return self._pack
+
+
+class RevisionStorage(Storage):
+    """Read-only storage that reads objects of a git revision from the repository's object database.
+
+    This allows opening a database at any revision without checking it out or touching the working tree. Objects are
+    read through a long-running ``git cat-file`` process. Both loose-file and packed storages are supported.
+    """
+
+    def __init__(self, path: Union[Path, str], repository: "Repository", revision: str, codec: Optional[str] = None):
+        self.repository = repository
+        self.revision: str = repository.get_commit(revision).hexsha
+        self._relative_path = os.path.relpath(get_absolute_path(path, repository.path), repository.path)
+        self._entries: Optional[Dict[str, Tuple[int, int]]] = None
+        self._packed: Optional[bool] = None
+        self._pack: Optional[bytes] = None
+        self._lock = threading.RLock()
+        super().__init__(path, codec=codec)
+
+    def is_packed(self) -> bool:
+        """Return True if the storage is packed in the revision."""
+        return self._get_entries() is not None
+
+    def store_raw(self, filename: str, data: bytes):
+        """Objects cannot be stored in a git revision."""
+        raise errors.OperationError(f"Cannot modify metadata of a git revision: '{self.revision}'")
+
+    def remove(self, filename: str):
+        """Objects cannot be removed from a git revision."""
+        raise errors.OperationError(f"Cannot modify metadata of a git revision: '{self.revision}'")
+
+    def add_dictionary(self, dictionary: zstd.ZstdCompressionDict):
+        """Dictionaries cannot be added to a git revision."""
+        raise errors.OperationError(f"Cannot modify metadata of a git revision: '{self.revision}'")
+
+    def load_raw(self, filename: str) -> bytes:
+        """Load encoded data of an object from the revision.
+
+        Args:
+            filename(str): The file name of the data to load.
+
+        Returns:
+            bytes: The encoded data.
+        """
+        entries = self._get_entries()
+
+        if entries is None:
+            data = self._read_file(os.path.relpath(self._get_path(filename), self.path))
+        else:
+            entry = entries.get(filename)
+            data = self._get_pack()[entry[0] : entry[0] + entry[1]] if entry else None
+
+        if data is None:
+            raise errors.ObjectNotFoundError(filename)
+
         return data
 
+    def exists(self, filename: str) -> bool:
+        """Return True if filename exists in the revision."""
+        entries = self._get_entries()
+        if entries is not None:
+            return filename in entries
+
+        return self._read_file(os.path.relpath(self._get_path(filename), self.path)) is not None
+
+    def filenames(self) -> List[str]:
+        """Return file names of all objects in the revision."""
+        entries = self._get_entries()
+        if entries is not None:
+            return list(entries.keys())
+
+        try:
+            paths = self.repository.run_git_command(
+                "ls-tree", self.revision, "--", self._relative_path, r=True, name_only=True
+            ).splitlines()
+        except errors.GitCommandError:
+            return []
+
+        reserved = (*PackedStorage.FILENAMES, Storage.CODEC_FILENAME, Storage.DICTIONARY_FILENAME)
+        filenames = []
+        for path in paths:
+            parts = Path(os.path.relpath(path, self._relative_path)).parts
+            if len(parts) == 1 and parts[0] not in reserved:
+                filenames.append(parts[0])
+            elif len(parts) == 3 and len(parts[2]) == Storage.OID_FILENAME_LENGTH:
+                filenames.append(parts[2])
+
+        return filenames
+
+    def _read_file(self, filename: str) -> Optional[bytes]:
+        """Return content of a file in the storage's directory in the revision or None if it doesn't exist."""
+        return self.repository.get_object_content(Path(self._relative_path) / filename, revision=self.revision)
+
+    def _get_entries(self) -> Optional[Dict[str, Tuple[int, int]]]:
+        """Return entries of the pack index in the revision or None if the storage isn't packed."""
+        with self._lock:
+            if self._packed is None:
+                index = self._read_file(PackedStorage.INDEX_FILENAME)
+                self._packed = index is not None
+                self._entries = PackedStorage.parse_index(index) if index is not None else None
+
+            return self._entries
+
+    def _get_pack(self) -> bytes:
+        with self._lock:
+            if self._pack is None:
+                self._pack = self._read_file(PackedStorage.PACK_FILENAME) or b""
+
+            return self._pack
+
+
+def _create_temporary_pack(path: Union[Path, str]) -> PackedStorage:
+    """Create an empty packed storage to write a new pack for the storage in ``path`` to."""
+    temporary_path = Path(path) / ".packing"
+    # NOTE: Discard leftovers of an interrupted run, otherwise their objects would end up in the new pack
+    if temporary_path.exists():
+        shutil.rmtree(temporary_path)
+
+    return PackedStorage(temporary_path)
+
+
+def pack_storage(path: Union[Path, str]) -> int:
+    """Move all objects of a loose-file storage into a pack file.
+
+    Args:
+        path(Union[Path, str]): Path of the storage.
+
+    Returns:
+        int: Number of packed objects.
+    """
+    if PackedStorage.is_packed(path):
+        raise errors.OperationError(f"Metadata storage is already packed: '{path}'")
+
+    loose = Storage(path)
+    filenames = sorted(loose.filenames())
+
+    # NOTE: Write pack to temporary files first so that an interrupted conversion leaves the storage intact
+    temporary = _create_temporary_pack(path)
+    temporary.store_raw_many((filename, loose.load_raw(filename)) for filename in filenames)
+
+    packed = PackedStorage(path)
+    temporary.pack_path.replace(packed.pack_path)
+    # NOTE: Moving the index marks the storage as packed
+    temporary.index_path.replace(packed.index_path)
+    temporary.path.rmdir()
+
+    for filename in filenames:
+        loose.remove(filename)
+
+    return len(filenames)
+
+
+def unpack_storage(path: Union[Path, str]) -> int:
+    """Move all objects of a packed storage into separate files.
+
+    Args:
+        path(Union[Path, str]): Path of the storage.
+
+    Returns:
+        int: Number of unpacked objects.
+    """
+    if not PackedStorage.is_packed(path):
+        raise errors.OperationError(f"Metadata storage is not packed: '{path}'")
+
+    packed = PackedStorage(path)
+    loose = Storage(path)
+    filenames = packed.filenames()
+
+    for filename in filenames:
+        loose.store_raw(filename, packed.load_raw(filename))
+
+    packed.close()
+    # NOTE: Removing the index marks the storage as unpacked
+    packed.index_path.unlink()
+    packed.pack_path.unlink()
+
+    return len(filenames)
+
+
+def convert_storage(path: Union[Path, str], codec: str) -> int:
+    """Re-encode all objects of a storage with a codec and use the codec for new objects.
+
+    Args:
+        path(Union[Path, str]): Path of the storage.
+        codec(str): Name of the codec.
+
+    Returns:
+        int: Number of converted objects.
+    """
+    storage = open_storage(path, codec=codec)
+    filenames = sorted(storage.filenames())
+
+    def convert(filename: str) -> Tuple[str, bytes]:
+        data = storage.load_raw(filename)
+        return filename, storage._encode(storage._decode(data), compress=storage._is_compressed(data))
+
+    _store_raw_many(storage, [convert(filename) for filename in filenames])
+
+    codec_path = Path(path) / Storage.CODEC_FILENAME
+    if codec == DEFAULT_CODEC:
+        if codec_path.exists():
+            codec_path.unlink()
+    else:
+        codec_path.write_text(f"{codec}\n")
+
+    return len(filenames)
+
+
+def train_storage_dictionary(path: Union[Path, str], dictionary_size: int = DEFAULT_DICTIONARY_SIZE) -> int:
+    """Train a zstd dictionary on compressed objects of a storage and recompress them using the dictionary.
+
+    The dictionary is used to compress new objects as well. Previous dictionaries are kept since objects from other
+    branches may still be compressed with them.
+
+    Args:
+        path(Union[Path, str]): Path of the storage.
+        dictionary_size(int): Maximum size of the dictionary in bytes (Default value = DEFAULT_DICTIONARY_SIZE).
+
+    Returns:
+        int: Number of recompressed objects.
+    """
+    storage = open_storage(path)
+
+    samples = {}
+    for filename in sorted(storage.filenames()):
+        data = storage.load_raw(filename)
+        if storage._is_compressed(data):
+            samples[filename] = storage._decompress(data)
+
+    try:
+        dictionary = zstd.train_dictionary(dictionary_size, list(samples.values()))
+    except zstd.ZstdError as e:
+        raise errors.OperationError("Not enough metadata to train a compression dictionary") from e
+
+    storage.add_dictionary(dictionary)
+    _store_raw_many(storage, [(filename, storage.zstd_compressor.compress(data)) for filename, data in samples.items()])
+
+    return len(samples)
+
+
+def get_reachable_objects(storage: Storage) -> Set[str]:
+    """Return filenames of all objects of a storage that can be reached from the root object.
+
+    Objects reference each other explicitly or by their ids since some objects (e.g. previous versions of a dataset)
+    are only loaded using ``Database.get_by_id``. Therefore, every string in an object's data whose hash is the name of
+    an existing object is treated as a reference too.
+
+    Args:
+        storage(Storage): The storage.
+
+    Returns:
+        Set[str]: Filenames of reachable objects.
+    """
+    filenames = set(storage.filenames())
+    reachable: Set[str] = set()
+
+    def get_references(data) -> Iterator[str]:
+        if isinstance(data, dict):
+            if data.get("@renku_reference"):
+                yield Database._get_filename_from_oid(data["@renku_oid"])
+                return
+            for value in data.values():
+                yield from get_references(value)
+        elif isinstance(data, list):
+            for value in data:
+                yield from get_references(value)
+        elif isinstance(data, str) and not data.startswith("@renku"):
+            filename = Database._get_filename_from_oid(Database.hash_id(data))
+            if filename in filenames:
+                yield filename
+
+    def load(filename: str):
+        try:
+            return storage.load(filename)
+        except errors.ObjectNotFoundError:
+            # NOTE: Dangling references are ignored
+            return None
+
+    pending = [Database.ROOT_OID] if Database.ROOT_OID in filenames else []
+    reachable.update(pending)
+
+    with ThreadPoolExecutor() as executor:
+        while pending:
+            batch, pending = pending[: Database.PREFETCH_BATCH_SIZE], pending[Database.PREFETCH_BATCH_SIZE :]
+            for data in executor.map(load, batch):
+                for filename in get_references(data):
+                    if filename not in reachable:
+                        reachable.add(filename)
+                        pending.append(filename)
+
+    return reachable
+
+
+def collect_garbage(path: Union[Path, str], dry_run: bool = False, repack: bool = False) -> List[str]:
+    """Remove objects of a storage that cannot be reached from the root object.
+
+    Args:
+        path(Union[Path, str]): Path of the storage.
+        dry_run(bool): Only return unreachable objects without removing them (Default value = False).
+        repack(bool): Rewrite the pack file of a packed storage with the remaining objects only to reclaim the space
+            of removed and overwritten objects (Default value = False).
+
+    Returns:
+        List[str]: Filenames of unreachable objects.
+    """
+    storage = open_storage(path)
+    unreachable = sorted(set(storage.filenames()) - get_reachable_objects(storage))
+
+    if dry_run:
+        return unreachable
+
+    for filename in unreachable:
+        storage.remove(filename)
+
+    if isinstance(storage, PackedStorage):
+        storage.close()
+        if repack:
+            repack_storage(path)
+
+    return unreachable
+
+
+def repack_storage(path: Union[Path, str]) -> int:
+    """Rewrite the pack file of a packed storage so that it only contains the current data of its objects.
+
+    Args:
+        path(Union[Path, str]): Path of the storage.
+
+    Returns:
+        int: Number of repacked objects.
+    """
+    if not PackedStorage.is_packed(path):
+        raise errors.OperationError(f"Metadata storage is not packed: '{path}'")
+
+    packed = PackedStorage(path)
+    try:
+        return packed.repack()
+    finally:
+        packed.close()
+
+
+def open_storage(path: Union[Path, str], codec: Optional[str] = None) -> Storage:
+    """Return a loose-file or a packed storage depending on the format of the storage at path.
+
+    Args:
+        path(Union[Path, str]): Path of the storage.
+        codec(Optional[str]): Name of the codec to use instead of the storage's codec (Default value = None).
+
+    Returns:
+        Storage: The storage.
+    """
+    return PackedStorage(path, codec=codec) if PackedStorage.is_packed(path) else Storage(path, codec=codec)
+
+
+def _store_raw_many(storage: Storage, objects: List[Tuple[str, bytes]]):
+    """Store encoded data of multiple objects at once if the storage supports it."""
+    if isinstance(storage, PackedStorage):
+        storage.store_raw_many(objects)
+        storage.close()
+    else:
+        for filename, data in objects:
+            storage.store_raw(filename, data)
+
 
 class ObjectWriter:
     """Serialize objects for storage in storage."""
@@ -797,7 +2061,8 @@ class ObjectWriter:
         self._serialization_cache: Dict[int, Any] = {}
         state = object.__getstate__()
         was_dict = isinstance(state, dict)
-        data = self._serialize_helper(state)
+        with self._database.statistics.measure("serialize_time"):
+            data = self._serialize_helper(state)
         is_dict = isinstance(data, dict)
 
         if not is_dict or (is_dict and not was_dict):
@@ -899,7 +2164,7 @@ class ObjectReader:
         self._database = database
 
         # a cache for normal (non-persistent objects with an id) to deduplicate them on load
-        self._normal_object_cache: Dict[str, Any] = {}
+        self._normal_object_cache: "weakref.WeakValueDictionary[str, Any]" = weakref.WeakValueDictionary()
         self._deserialization_cache: List[Any] = []
 
     def _get_class(self, type_name: str) -> Optional[type]:
@@ -925,8 +2190,9 @@ class ObjectReader:
         previous_cache = self._deserialization_cache
         self._deserialization_cache = []
 
-        state = self._deserialize_helper(data, create=False)
-        object.__setstate__(state)
+        with self._database.statistics.measure("deserialize_time"):
+            state = self._deserialize_helper(data, create=False)
+            object.__setstate__(state)
 
         self._deserialization_cache = previous_cache
 
@@ -943,7 +2209,8 @@ class ObjectReader:
 
         self._deserialization_cache = []
 
-        object = self._deserialize_helper(data)
+        with self._database.statistics.measure("deserialize_time"):
+            object = self._deserialize_helper(data)
 
         object._p_oid = oid
         object._p_jar = self._database
@@ -1035,8 +2302,10 @@ class ObjectReader:
                 data = self._deserialize_helper(data)
                 assert isinstance(data, dict)
 
-                if "id" in data and data["id"] in self._normal_object_cache:
-                    return self._normal_object_cache[data["id"]]
+                if "id" in data:
+                    existing_object = self._normal_object_cache.get(data["id"])
+                    if existing_object is not None:
+                        return existing_object
 
                 for name, value in data.items():
                     object.__setattr__(new_object, name, value)
@@ -1045,6 +2314,9 @@ class ObjectReader:
                     new_object = cls.make_instance(new_object)
 
                 if "id" in data and isinstance(data["id"], str) and data["id"].startswith("/"):
-                    self._normal_object_cache[data["id"]] = new_object
+                    try:
+                        self._normal_object_cache[data["id"]] = new_object
+                    except TypeError:  # NOTE: Object doesn't support weak references
+                        pass
 
             return new_object
@@ -17,20 +17,21 @@
 # limitations under the License.
 """Renku activity database gateway implementation."""
 
+from collections import deque
 from itertools import chain
-from pathlib import Path
-from typing import List, Optional, Set, Tuple, Union
+from pathlib import Path, PurePosixPath
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from persistent.list import PersistentList
 
 from renku.command.command_builder.command import inject
+from renku.core import errors
 from renku.core.interface.activity_gateway import IActivityGateway
 from renku.core.interface.database_dispatcher import IDatabaseDispatcher
 from renku.core.interface.plan_gateway import IPlanGateway
-from renku.core.util.os import are_paths_related
-from renku.core.workflow.activity import create_activity_graph
 from renku.domain_model.provenance.activity import Activity, ActivityCollection
 from renku.domain_model.workflow.plan import Plan
+from renku.infrastructure.database import RenkuOOBTree
 from renku.infrastructure.gateway.database_gateway import ActivityDownstreamRelation
 
 
@@ -69,6 +70,16 @@ class ActivityGateway(IActivityGateway):
 
         return result
 
+    def get_activities_by_usage(self, path: Union[Path, str]) -> List[Activity]:
+        """Return the list of all activities that use a path."""
+        by_usage = self.database_dispatcher.current_database["activities-by-usage"]
+        return list(by_usage.get(str(path), []))
+
+    def get_activities_by_related_generation(self, path: Union[Path, str]) -> Set[Activity]:
+        """Return all activities that generate a path, one of its parents, or one of its children."""
+        by_generation = self.database_dispatcher.current_database["activities-by-generation"]
+        return set(chain.from_iterable(_get_related_values(by_generation, str(path))))
+
     def get_downstream_activities(self, activity: Activity, max_depth=None) -> Set[Activity]:
         """Get downstream activities that depend on this activity."""
         # NOTE: since indices are populated one way when adding an activity, we need to query two indices
@@ -80,6 +91,16 @@ class ActivityGateway(IActivityGateway):
 
         return downstream
 
+    def get_upstream_activities(self, activity: Activity, max_depth=None) -> Set[Activity]:
+        """Get upstream activities that this activity depends on."""
+        database = self.database_dispatcher.current_database
+
+        activity_catalog = database["activity-catalog"]
+        tok = activity_catalog.tokenizeQuery
+        upstream = set(activity_catalog.findValues("upstream", tok(downstream=activity), maxDepth=max_depth))
+
+        return upstream
+
     def get_downstream_activity_chains(self, activity: Activity) -> List[Tuple[Activity, ...]]:
         """Get a list of tuples of all downstream paths of this activity."""
         database = self.database_dispatcher.current_database
@@ -102,9 +123,43 @@ class ActivityGateway(IActivityGateway):
 
         return upstream_chains
 
-    def get_all_activities(self) -> List[Activity]:
-        """Get all activities in the project."""
-        return list(self.database_dispatcher.current_database["activities"].values())
+    def get_all_activities(self, pin: bool = True) -> List[Activity]:
+        """Get all activities in the project.
+
+        Args:
+            pin(bool): Whether to keep loaded objects in memory as long as the returned list is referenced; otherwise,
+                they are unloaded once the database cache is full and reloaded when accessed (Default value = True).
+        """
+        database = self.database_dispatcher.current_database
+        return database.prefetch(database["activities"].values(), pin=pin)
+
+    def get_latest_activities_by_outputs(self) -> List[Activity]:
+        """Get the latest activity for each distinct set of outputs.
+
+        Loaded objects are kept in memory as long as the returned list is referenced.
+        """
+        database = self.database_dispatcher.current_database
+        return database.prefetch(database["latest-activities-by-outputs"].values(), pin=True)
+
+    def get_usage_checksums(self) -> Dict[str, Set[str]]:
+        """Get checksums of each usage path in the latest activities of each distinct set of outputs."""
+        database = self.database_dispatcher.current_database
+        return {path: set(counts) for path, counts in database["usage-checksums"].items()}
+
+    def rebuild_indexes(self) -> None:
+        """Recreate the latest activities and usage checksums indexes from all activities."""
+        database = self.database_dispatcher.current_database
+
+        for name in ("latest-activities-by-outputs", "usage-checksums"):
+            try:
+                database[name].clear()
+            except KeyError:
+                database.add_root_object(name=name, obj=RenkuOOBTree())
+
+        for activity in self.get_all_activities():
+            _update_latest_activities_by_outputs(
+                database["latest-activities-by-outputs"], database["usage-checksums"], activity
+            )
 
     def add(self, activity: Activity):
         """Add an ``Activity`` to storage."""
@@ -124,18 +179,20 @@ class ActivityGateway(IActivityGateway):
                 by_usage[usage.entity.path] = PersistentList()
             by_usage[usage.entity.path].append(activity)
 
-            for path, activities in by_generation.items():
-                if are_paths_related(path, usage.entity.path):
-                    upstreams.update(activities)
+            for activities in _get_related_values(by_generation, usage.entity.path):
+                upstreams.update(activities)
 
         for generation in activity.generations:
             if generation.entity.path not in by_generation:
                 by_generation[generation.entity.path] = PersistentList()
             by_generation[generation.entity.path].append(activity)
 
-            for path, activities in by_usage.items():
-                if are_paths_related(path, generation.entity.path):
-                    downstreams.update(activities)
+            for activities in _get_related_values(by_usage, generation.entity.path):
+                downstreams.update(activities)
+
+        _update_latest_activities_by_outputs(
+            database["latest-activities-by-outputs"], database["usage-checksums"], activity
+        )
 
         if upstreams:
             for s in upstreams:
@@ -150,18 +207,8 @@ class ActivityGateway(IActivityGateway):
         plan_gateway = inject.instance(IPlanGateway)
         plan_gateway.add(activity.association.plan)
 
-        # NOTE: Check for a cycle if this activity
-        upstream_chains = self.get_upstream_activity_chains(activity)
-        downstream_chains = self.get_downstream_activity_chains(activity)
-
-        all_activities = set()
-
-        for activity_chain in chain(upstream_chains, downstream_chains):
-            for current_activity in activity_chain:
-                all_activities.add(current_activity)
-
         # NOTE: This call raises an exception if there is a cycle
-        create_activity_graph(list(all_activities), with_inputs_outputs=True)
+        _check_for_cycles(activity, by_usage)
 
     def add_activity_collection(self, activity_collection: ActivityCollection):
         """Add an ``ActivityCollection`` to storage."""
@@ -170,5 +217,114 @@ class ActivityGateway(IActivityGateway):
         database["activity-collections"].add(activity_collection)
 
     def get_all_activity_collections(self) -> List[ActivityCollection]:
-        """Get all activity collections in the project."""
-        return list(self.database_dispatcher.current_database["activity-collections"].values())
+        """Get all activity collections in the project.
+
+        Loaded objects are kept in memory as long as the returned list is referenced.
+        """
+        database = self.database_dispatcher.current_database
+        return database.prefetch(database["activity-collections"].values(), pin=True)
+
+
+def _get_related_values(index: RenkuOOBTree, path: str) -> Iterator:
+    """Return values of a path-keyed index whose path is equal to, a parent of, or a child of ``path``.
+
+    Paths are related in the same way as in ``renku.core.util.os.are_paths_related``. Since the index is sorted by
+    path, parents are looked up directly and children are in a contiguous range of keys that start with ``path/``;
+    this avoids iterating over all keys of the index.
+    """
+    path = path.rstrip("/")
+
+    if path in ("", "."):
+        yield from index.values()
+        return
+
+    # NOTE: Paths may have been recorded with a trailing slash
+    for parent in chain([path], (str(p) for p in PurePosixPath(path).parents)):
+        for key in (parent, f"{parent}/"):
+            value = index.get(key)
+            if value is not None:
+                yield value
+
+    # NOTE: '0' is the character after '/', so this range contains all keys that start with 'path/' except 'path/'
+    yield from index.values(min=f"{path}/", max=f"{path}0", excludemin=True, excludemax=True)
+
+
+def _get_outputs_key(activity: Activity) -> str:
+    """Return a key that identifies the set of outputs of an activity."""
+    return "\0".join(sorted({g.entity.path for g in activity.generations}))
+
+
+def _update_latest_activities_by_outputs(by_outputs: RenkuOOBTree, usage_checksums: RenkuOOBTree, activity: Activity):
+    """Store an activity if it's the latest activity that generates its set of outputs.
+
+    Activities that generate the same set of outputs override each other, so only the latest one is needed to find
+    outdated outputs; this keeps status and update from loading all activities of a project. Checksums of usages of
+    indexed activities are reference-counted so that it's cheap to check whether any of them changed.
+    """
+    key = _get_outputs_key(activity)
+    latest = by_outputs.get(key)
+
+    if latest is not None and activity.ended_at_time < latest.ended_at_time:
+        return
+
+    by_outputs[key] = activity
+
+    if latest is not None:
+        _count_usage_checksums(usage_checksums, latest, -1)
+    _count_usage_checksums(usage_checksums, activity, 1)
+
+
+def _count_usage_checksums(index: RenkuOOBTree, activity: Activity, increment: int):
+    """Add ``increment`` to the count of each usage checksum of an activity."""
+    for usage in activity.usages:
+        path = usage.entity.path
+        # NOTE: Missing checksums are stored as an empty string which never matches a file's current checksum
+        checksum = usage.entity.checksum or ""
+
+        counts = dict(index.get(path, {}))
+        counts[checksum] = counts.get(checksum, 0) + increment
+        if counts[checksum] <= 0:
+            del counts[checksum]
+
+        if counts:
+            index[path] = counts
+        elif path in index:
+            del index[path]
+
+
+def _check_for_cycles(activity: Activity, by_usage: RenkuOOBTree):
+    """Raise an error if adding an activity created a cycle in the graph of activities and their inputs/outputs.
+
+    Only the newly added activity can close a cycle, so it's enough to search its downstream activities for one that
+    generates an input of the activity; this only visits the activity's downstream neighborhood.
+    """
+    usages = {u.entity.path for u in activity.usages}
+    # NOTE: Maps visited paths to the activity that generates them and the path that the activity uses
+    parents: Dict[str, Tuple[Activity, Optional[str]]] = {}
+    visited_activities = {activity.id}
+
+    queue = deque()
+    for generation in activity.generations:
+        parents.setdefault(generation.entity.path, (activity, None))
+        queue.append(generation.entity.path)
+
+    while queue:
+        path = queue.popleft()
+
+        if path in usages:
+            cycle: List[str] = []
+            while path is not None:
+                parent, previous = parents[path]
+                cycle[:0] = [parent.id, path]
+                path = previous
+            raise errors.GraphCycleError([cycle])
+
+        for downstream in by_usage.get(path, []):
+            if downstream.id in visited_activities:
+                continue
+            visited_activities.add(downstream.id)
+
+            for generation in downstream.generations:
+                if generation.entity.path not in parents:
+                    parents[generation.entity.path] = (downstream, path)
+                    queue.append(generation.entity.path)
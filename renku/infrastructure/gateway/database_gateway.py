@@ -18,7 +18,7 @@
 """Renku generic database gateway implementation."""
 
 from pathlib import Path
-from typing import Generator
+from typing import Dict, Generator, List, Optional, Tuple
 
 import BTrees
 from persistent import Persistent
@@ -34,7 +34,7 @@ from renku.core.interface.database_gateway import IDatabaseGateway
 from renku.domain_model.dataset import Dataset
 from renku.domain_model.provenance.activity import Activity, ActivityCollection
 from renku.domain_model.workflow.plan import AbstractPlan
-from renku.infrastructure.database import RenkuOOBTree
+from renku.infrastructure.database import PackedStorage, RenkuOOBTree, Storage
 
 
 class IActivityDownstreamRelation(Interface):
@@ -92,6 +92,8 @@ def initialize_database(database):
     database.add_index(name="activities", object_type=Activity, attribute="id")
     database.add_root_object(name="activities-by-usage", obj=RenkuOOBTree())
     database.add_root_object(name="activities-by-generation", obj=RenkuOOBTree())
+    database.add_root_object(name="latest-activities-by-outputs", obj=RenkuOOBTree())
+    database.add_root_object(name="usage-checksums", obj=RenkuOOBTree())
 
     database.add_index(name="activity-collections", object_type=ActivityCollection, attribute="id")
 
@@ -112,6 +114,7 @@ def initialize_database(database):
 
     database.add_index(name="plans", object_type=AbstractPlan, attribute="id")
     database.add_index(name="plans-by-name", object_type=AbstractPlan, attribute="name")
+    database.add_index(name="plans-by-derived-from", object_type=AbstractPlan, attribute="derived_from")
 
     database.add_index(name="datasets", object_type=Dataset, attribute="name")
     database.add_index(name="datasets-provenance-tails", object_type=Dataset, attribute="id")
@@ -145,15 +148,43 @@ class DatabaseGateway(IDatabaseGateway):
         client = client_dispatcher.current_client
 
         if ".." in revision_or_range:
-            commits = client.repository.iterate_commits(revision=revision_or_range)
+            changes = client.repository.iterate_changes(client.database_path, revision=revision_or_range)
         else:
-            commits = [client.repository.get_commit(revision_or_range)]
-
-        for commit in commits:
-            for file in commit.get_changes(paths=f"{client.database_path}/**"):
-                if file.deleted:
-                    continue
-
-                oid = Path(file.a_path).name
-
-                yield self.database_dispatcher.current_database.get(oid)
+            commit = client.repository.get_commit(revision_or_range)
+            changes = client.repository.iterate_changes(client.database_path, revision=commit.hexsha, no_walk=True)
+
+        # NOTE: Objects that changed in several commits are loaded only once
+        oids: Dict[str, None] = {}
+
+        for commit_sha, parent_sha, file in changes:
+            if file.deleted:
+                continue
+
+            if Path(file.a_path).name == PackedStorage.INDEX_FILENAME:
+                for oid in _get_modified_oids_from_packed_index(client.repository, commit_sha, parent_sha, file.a_path):
+                    oids.setdefault(oid)
+            elif Path(file.a_path).name in (
+                PackedStorage.PACK_FILENAME,
+                Storage.CODEC_FILENAME,
+                Storage.DICTIONARY_FILENAME,
+            ):
+                continue
+            elif Path(file.a_path).parent.name == Storage.DICTIONARIES_DIRECTORY:
+                continue
+            else:
+                oids.setdefault(Path(file.a_path).name)
+
+        yield from self.database_dispatcher.current_database.get_many(oids)
+
+
+def _get_modified_oids_from_packed_index(repository, revision: str, parent: Optional[str], path: str) -> List[str]:
+    """Return oids whose entry in a packed storage index changed in a commit."""
+    entries = PackedStorage.parse_index(repository.get_object_content(path, revision=revision) or b"")
+
+    previous_entries: Dict[str, Tuple[int, int]] = {}
+    if parent:
+        content = repository.get_object_content(path, revision=parent)
+        if content is not None:
+            previous_entries = PackedStorage.parse_index(content)
+
+    return [oid for oid, entry in entries.items() if previous_entries.get(oid) != entry]
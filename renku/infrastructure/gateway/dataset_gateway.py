@@ -44,11 +44,13 @@ class DatasetGateway(IDatasetGateway):
 
     def get_all_active_datasets(self) -> List[Dataset]:
         """Return all datasets."""
-        return list(self.database_dispatcher.current_database["datasets"].values())
+        database = self.database_dispatcher.current_database
+        return database.prefetch(database["datasets"].values(), pin=True)
 
     def get_provenance_tails(self) -> List[Dataset]:
         """Return the provenance for all datasets."""
-        return list(self.database_dispatcher.current_database["datasets-provenance-tails"].values())
+        database = self.database_dispatcher.current_database
+        return database.prefetch(database["datasets-provenance-tails"].values(), pin=True)
 
     def get_all_tags(self, dataset: Dataset) -> List[DatasetTag]:
         """Return the list of all tags for a dataset."""
@@ -49,9 +49,26 @@ class PlanGateway(IPlanGateway):
             return dict(database["plans-by-name"])
         return {k: v for k, v in database["plans-by-name"].items() if v.invalidated_at is None}
 
+    def get_derivative(self, id: str) -> Optional[AbstractPlan]:
+        """Get the plan that is directly derived from a plan."""
+        return self.database_dispatcher.current_database["plans-by-derived-from"].get(id)
+
+    def get_latest_descendant(self, plan: AbstractPlan) -> AbstractPlan:
+        """Get the last plan in the chain of plans that are derived from a plan or the plan itself."""
+        visited = {plan.id}
+
+        derivative = self.get_derivative(plan.id)
+        while derivative is not None and derivative.id not in visited:
+            plan = derivative
+            visited.add(plan.id)
+            derivative = self.get_derivative(plan.id)
+
+        return plan
+
     def get_all_plans(self) -> List[AbstractPlan]:
         """Get all plans in project."""
-        return list(self.database_dispatcher.current_database["plans"].values())
+        database = self.database_dispatcher.current_database
+        return database.prefetch(database["plans"].values(), pin=True)
 
     def add(self, plan: AbstractPlan) -> None:
         """Add a plan to the database."""
@@ -63,4 +80,22 @@ class PlanGateway(IPlanGateway):
 
             if derived_from is not None:
                 database["plans-by-name"].pop(derived_from.name, None)
+
+            database["plans-by-derived-from"].add(plan)
         database["plans-by-name"].add(plan)
+
+    def rebuild_indexes(self) -> None:
+        """Recreate the index of plans by the plan that they are derived from."""
+        database = self.database_dispatcher.current_database
+
+        try:
+            by_derived_from = database["plans-by-derived-from"]
+        except KeyError:
+            by_derived_from = database.add_index(
+                name="plans-by-derived-from", object_type=AbstractPlan, attribute="derived_from"
+            )
+
+        plans = sorted(self.get_all_plans(), key=lambda p: p.date_created)
+        for plan in plans:
+            if plan.derived_from is not None:
+                by_derived_from.add(plan)
@@ -18,10 +18,15 @@
 """An abstraction layer for the underlying VCS."""
 
 import configparser
+import hashlib
+import json
 import math
 import os
+import stat as stat_module
 import subprocess
 import tempfile
+import threading
+import time
 from collections import defaultdict
 from datetime import datetime
 from functools import lru_cache
@@ -51,6 +56,25 @@ from renku.core.util.os import delete_file, get_absolute_path
 
 NULL_TREE = git.NULL_TREE
 _MARKER = object()
+# NOTE: Git commands that don't change the index or the working tree and don't invalidate a status snapshot
+_READ_ONLY_COMMANDS = {
+    "cat-file",
+    "check-attr",
+    "check-ignore",
+    "config",
+    "diff",
+    "fetch",
+    "for-each-ref",
+    "hash-object",
+    "log",
+    "ls-files",
+    "ls-tree",
+    "merge-base",
+    "rev-list",
+    "rev-parse",
+    "show",
+    "status",
+}
 
 
 def git_unicode_unescape(s: Optional[str], encoding: str = "utf-8") -> str:
@@ -82,6 +106,9 @@ class BaseRepository:
 
         self._repository: Optional[git.Repo] = repository
         self._path = Path(path).resolve()
+        self._object_lock = threading.Lock()
+        self._checksum_cache: Optional[ChecksumCache] = None
+        self._status: Optional[Status] = None
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} {self.path}>"
@@ -91,6 +118,18 @@ class BaseRepository:
         """Absolute path to the repository's root."""
         return self._path
 
+    @property
+    def checksum_cache(self) -> Optional["ChecksumCache"]:
+        """Cache of hashes of files in the working tree that is stored in the repository's git directory."""
+        if self._checksum_cache is None and self._repository is not None:
+            self._checksum_cache = ChecksumCache(
+                path=Path(self._repository.git_dir) / "renku" / "checksums.json",
+                root=self.path,
+                repository=self._repository,
+            )
+
+        return self._checksum_cache
+
     @property
     def head(self) -> "SymbolicReference":
         """HEAD of the repository."""
@@ -304,6 +343,30 @@ class BaseRepository:
         """Return status of a repository."""
         return self.run_git_command("status")
 
+    def get_status(self) -> "Status":
+        """Return a snapshot of staged, unstaged and untracked changes from a single ``git status`` call.
+
+        The snapshot is reused until it's invalidated. Changes made through this class invalidate it; code that
+        changes the working tree by other means must call ``invalidate_status``.
+        """
+        status = self._status
+        if status is None:
+            output = self.run_git_command(
+                "status", porcelain="v2", z=True, untracked_files="all", ignore_submodules="all"
+            )
+            status = self._status = Status.from_porcelain(output)
+
+        return status
+
+    def invalidate_status(self) -> None:
+        """Discard the status snapshot so that the next ``get_status`` call reads the current status."""
+        self._status = None
+
+    def invalidate_checksum_cache(self) -> None:
+        """Re-read the checksum cache since attributes or filter configuration might have changed."""
+        if self._checksum_cache is not None:
+            self._checksum_cache.invalidate()
+
     def is_dirty(self, untracked_files: bool = False) -> bool:
         """Return True if the repository has modified or untracked files ignoring submodules."""
         if self._repository is None:
@@ -314,6 +377,8 @@ class BaseRepository:
         """Run a git command in this repository."""
         if self._repository is None:
             raise errors.ParameterError("Repository not set.")
+        if command.replace("_", "-") not in _READ_ONLY_COMMANDS:
+            self._status = None
         return _run_git_command(self._repository, command, *args, **kwargs)
 
     def get_attributes(self, *paths: Union[Path, str]) -> Dict[str, Dict[str, str]]:
@@ -381,6 +446,60 @@ class BaseRepository:
         except git.GitCommandError:
             return
 
+    def iterate_changes(
+        self, *paths: Union[Path, str], revision: Optional[str] = None, no_walk: bool = False
+    ) -> Generator[Tuple[str, Optional[str], "Diff"], None, None]:
+        """Return changes to paths in all non-merge commits of a revision or a range of revisions.
+
+        Unlike calling ``Commit.get_changes`` on each commit, changes of all commits are listed by a single ``git log``
+        call.
+
+        Args:
+            paths(Union[Path, str]): Paths to list changes for.
+            revision(Optional[str]): A revision or a range of revisions (Default value = None).
+            no_walk(bool): Only list changes of ``revision`` and not of its ancestors (Default value = False).
+
+        Returns:
+            Generator[Tuple[str, Optional[str], Diff], None, None]: Tuples of a commit's sha, the sha of its parent or
+                None for root commits, and a change in the commit; renames are listed as a deletion and an addition.
+        """
+        revision = revision or "HEAD"
+        relative_paths = [Path(os.path.relpath(get_absolute_path(p, self.path), self.path)).as_posix() for p in paths]
+        walk = "--no-walk" if no_walk else "--full-history"
+
+        try:
+            output = self.run_git_command(
+                "log",
+                revision,
+                walk,
+                "--no-merges",
+                "--root",
+                "--no-renames",
+                "--name-status",
+                "-z",
+                "--format=commit %H %P",
+                "--",
+                *relative_paths,
+            )
+        except errors.GitCommandError:
+            return
+
+        tokens = iter(output.split("\0"))
+        commit: Optional[str] = None
+        parent: Optional[str] = None
+
+        for token in tokens:
+            token = token.strip("\n")
+            if not token:
+                continue
+            elif token.startswith("commit "):
+                commit, *parents = token.split()[1:]
+                parent = parents[0] if parents else None
+                continue
+
+            path = next(tokens)
+            yield cast(str, commit), parent, Diff(a_path=path, b_path=path, change_type=token[0])
+
     def get_commit(self, revision: str) -> "Commit":
         """Return Commit with the provided sha."""
         if self._repository is None:
@@ -433,6 +552,33 @@ class BaseRepository:
 
         return Path(output).read_text()
 
+    def get_object_content(self, path: Union[Path, str], revision: Union["Reference", str]) -> Optional[bytes]:
+        """Get raw content of a file in a given revision from git's object database.
+
+        Unlike ``get_content``, this doesn't spawn a process for each call but uses a long-running ``git cat-file``
+        process and no filters are applied on the content.
+
+        Args:
+            path(Union[Path, str]): Path of the file.
+            revision(Union[Reference, str]): The revision to read the file from.
+
+        Returns:
+            Optional[bytes]: Content of the file or None if the file doesn't exist in the revision.
+        """
+        if self._repository is None:
+            raise errors.ParameterError("Repository not set.")
+
+        relative_path = Path(os.path.relpath(get_absolute_path(path, self.path), self.path)).as_posix()
+
+        # NOTE: GitPython's persistent cat-file process cannot be used concurrently
+        with self._object_lock:
+            try:
+                _, type, _, content = self._repository.git.get_object_data(f"{revision}:{relative_path}")
+            except ValueError:
+                return None
+
+        return content if type == b"blob" else None
+
     def copy_content_to_file(
         self,
         path: Union[Path, str],
@@ -487,9 +633,10 @@ class BaseRepository:
             with tempfile.NamedTemporaryFile(mode="w+b", delete=False) as temp_output_file:
                 if get_content_helper(output_file=temp_output_file):
                     return temp_output_file.name
-        else:
-            if get_content_helper(output_file):
-                return output_file.name
+        elif get_content_helper(output_file):
+            # NOTE: The output file might be in the working tree
+            self.invalidate_status()
+            return output_file.name
 
         from_submodules = get_content_from_submodules()
         if from_submodules:
@@ -508,24 +655,35 @@ class BaseRepository:
 
         def _get_uncommitted_file_hashes(paths: Set[Union[Path, str]]) -> Dict[str, str]:
             """Get hashes for all modified/uncommitted/staged files."""
-            staged_files = [d.a_path for d in self.staged_changes] if self.head.is_valid() else []
-            modified_files = [item.b_path for item in self.unstaged_changes if not item.deleted]
-            dirty_files = {os.path.join(self.path, p) for p in self.untracked_files + modified_files + staged_files}
+            status = self.get_status()
+            staged_files = [d.a_path for d in status.staged_changes] if self.head.is_valid() else []
+            modified_files = [item.b_path for item in status.unstaged_changes if not item.deleted]
+            dirty_files = {os.path.join(self.path, p) for p in status.untracked_files + modified_files + staged_files}
             dirty_files = {p for p in dirty_files if p in paths and not os.path.isdir(p)}
             dirty_files_list = list(dirty_files)
 
-            dirty_files_hashes = Repository.hash_objects(cast(List[Union[Path, str]], dirty_files_list))
+            dirty_files_hashes = self._hash_working_tree_objects(cast(List[Union[Path, str]], dirty_files_list))
             return dict(zip(dirty_files_list, dirty_files_hashes))
 
         def _get_hashes_from_revision(
             paths: Set[Union[Path, str]], revision: str, repository: BaseRepository
         ) -> Dict[Union[Path, str], Optional[str]]:
             """Get hashes for paths in a specific revision."""
-            existing_paths = repository.get_existing_paths_in_revision(paths, revision=revision)
             result: Dict[Union[Path, str], Optional[str]] = {}
-            for batch in split_paths(*existing_paths):
-                hashes = self.run_git_command("rev-parse", *[f"{revision}:{relative_path}" for relative_path in batch])
-                result.update(zip(batch, hashes.splitlines()))
+            remaining_paths = []
+            for path in paths:
+                header = repository._get_object_header(path, revision=revision)
+                if header is _MARKER:
+                    remaining_paths.append(path)
+                else:
+                    result[path] = header[0] if header else None
+
+            # NOTE: Fall back to ls-tree and rev-parse for paths that cannot be looked up by the cat-file process
+            if remaining_paths:
+                existing_paths = repository.get_existing_paths_in_revision(remaining_paths, revision=revision)
+                for batch in split_paths(*existing_paths):
+                    hashes = self.run_git_command("rev-parse", *[f"{revision}:{path}" for path in batch])
+                    result.update(zip(batch, hashes.splitlines()))
 
             for path in paths:
                 if path not in result:
@@ -598,7 +756,7 @@ class BaseRepository:
         # NOTE: If revision is not specified, we use hash-object to hash the (possibly) modified object
         if not revision:
             try:
-                return Repository.hash_object(absolute_path)
+                return self._hash_working_tree_objects([absolute_path])[0]
             except errors.GitCommandError:
                 # NOTE: If object does not exist anymore, hash-object doesn't work, fall back to rev-parse
                 revision = "HEAD"
@@ -629,17 +787,23 @@ class BaseRepository:
 
         relative_path = os.path.relpath(absolute_path, start=self.path)
 
-        try:
-            return self.run_git_command("rev-parse", f"{revision}:{relative_path}")
-        except errors.GitCommandError:
-            # NOTE: The file can be in a submodule or it can be a directory which is staged but not committed yet.
-            # It's also possible that the file was not there when the command ran but was there when workflows were
-            # migrated (this can happen only for Usage); the project might be broken too.
-            staged_directory_hash = get_staged_directory_hash()
-            if staged_directory_hash:
-                return staged_directory_hash
+        header = self._get_object_header(relative_path, revision=revision)
+        if header is not _MARKER and header is not None:
+            return header[0]
+        elif header is _MARKER:
+            try:
+                return self.run_git_command("rev-parse", f"{revision}:{relative_path}")
+            except errors.GitCommandError:
+                pass
 
-            return get_object_hash_from_submodules()
+        # NOTE: The file can be in a submodule or it can be a directory which is staged but not committed yet.
+        # It's also possible that the file was not there when the command ran but was there when workflows were
+        # migrated (this can happen only for Usage); the project might be broken too.
+        staged_directory_hash = get_staged_directory_hash()
+        if staged_directory_hash:
+            return staged_directory_hash
+
+        return get_object_hash_from_submodules()
 
     def get_user(self) -> "Actor":
         """Return the local/global git user."""
@@ -696,13 +860,19 @@ class BaseRepository:
             if paths:
                 dirs = []
                 files = []
+                result = []
 
                 for path in paths:
-                    if os.path.isdir(path):
+                    header = self._get_object_header(path, revision=revision)
+                    # NOTE: ls-tree lists content of directories that exist in the revision but not in the working tree
+                    if header is not _MARKER and (header is None or header[1] != "tree" or os.path.isdir(path)):
+                        if header:
+                            result.append(Path(os.path.normpath(path)).as_posix())
+                    elif os.path.isdir(path):
                         dirs.append(path)
                     else:
                         files.append(path)
-                result = []
+
                 if files:
                     # NOTE: check existing files
                     for batch in split_paths(*files):
@@ -731,6 +901,48 @@ class BaseRepository:
                 status=e.status,
             ) from e
 
+    def _get_object_header(self, path: Union[Path, str], revision: Union["Commit", str]) -> Any:
+        """Return hash and type of an object in a revision using a long-running ``git cat-file --batch-check``.
+
+        Looking objects up through a single process is much faster than spawning a git process for each path.
+
+        Args:
+            path(Union[Path, str]): Path of the object relative to the repository's root.
+            revision(Union[Commit, str]): The revision to look the object up in.
+
+        Returns:
+            A tuple of the object's hash and type, None if the object doesn't exist or ``_MARKER`` if the object cannot
+            be looked up this way and callers must fall back to running git commands.
+        """
+        name = f"{revision}:{Path(path).as_posix()}"
+        if self._repository is None or "\n" in name:
+            return _MARKER
+
+        # NOTE: GitPython's persistent cat-file process cannot be used concurrently
+        with self._object_lock:
+            try:
+                hexsha, type, _ = self._repository.git.get_object_header(name)
+            except ValueError:
+                # NOTE: Commits of submodules aren't in the repository's object database and are reported as missing
+                return _MARKER if len(self.submodules) > 0 else None  # type: ignore
+            except (OSError, git.GitCommandError):
+                # NOTE: Restart the process on the next call
+                self._repository.git.clear_cache()
+                return _MARKER
+
+        return hexsha.decode("ascii"), type.decode("ascii")
+
+    def _hash_working_tree_objects(self, paths: List[Union[Path, str]]) -> List[str]:
+        """Create git hashes for files in the working tree using the checksum cache if available."""
+        if not paths:
+            return []
+
+        checksum_cache = self.checksum_cache
+        if checksum_cache is None:
+            return Repository.hash_objects(paths)
+
+        return checksum_cache.hash_objects(paths)
+
     @staticmethod
     def hash_objects(paths: List[Union[Path, str]]) -> List[str]:
         """Create a git hash for a list of paths. The paths don't need to be in a repository."""
@@ -979,6 +1191,55 @@ class Diff(NamedTuple):
         return self.change_type == "A"
 
 
+class Status(NamedTuple):
+    """A snapshot of a repository's working tree status.
+
+    Changes have the same form as ``staged_changes``, ``unstaged_changes`` and ``untracked_files`` of a repository.
+    """
+
+    staged_changes: List[Diff]
+    unstaged_changes: List[Diff]
+    untracked_files: List[str]
+
+    @classmethod
+    def from_porcelain(cls, output: str) -> "Status":
+        """Create an instance from the output of ``git status --porcelain=v2 -z``."""
+        # NOTE: Staged changes are diffs from the index to HEAD, so additions and deletions are reversed
+        staged_change_types = {"A": "D", "C": "D", "D": "A"}
+
+        staged_changes: List[Diff] = []
+        unstaged_changes: List[Diff] = []
+        untracked_files: List[str] = []
+
+        entries = iter(output.split("\0"))
+        for entry in entries:
+            if entry.startswith("? "):
+                untracked_files.append(entry[2:])
+                continue
+            elif entry.startswith("1 "):
+                _, xy, *_, path = entry.split(" ", 8)
+                original_path = path
+            elif entry.startswith("2 "):
+                _, xy, *_, path = entry.split(" ", 9)
+                original_path = next(entries)
+            elif entry.startswith("u "):
+                _, xy, *_, path = entry.split(" ", 10)
+                staged_changes.append(Diff(a_path=path, b_path=path, change_type="U"))
+                unstaged_changes.append(Diff(a_path=path, b_path=path, change_type="U"))
+                continue
+            else:  # NOTE: Headers and ignored files
+                continue
+
+            staged, unstaged = xy[0], xy[1]
+            if staged != ".":
+                change_type = staged_change_types.get(staged, staged)
+                staged_changes.append(Diff(a_path=path, b_path=original_path, change_type=change_type))
+            if unstaged != ".":
+                unstaged_changes.append(Diff(a_path=path, b_path=path, change_type=unstaged))
+
+        return cls(staged_changes=staged_changes, unstaged_changes=unstaged_changes, untracked_files=untracked_files)
+
+
 class Commit:
     """A VCS commit."""
 
@@ -1464,6 +1725,173 @@ class Configuration:
         return self._configuration.has_section(section)
 
 
+class ChecksumCache:
+    """On-disk cache of git hashes of files in a repository's working tree.
+
+    Hashes are keyed by files' relative paths and are valid as long as the files' size, modification time and inode
+    don't change. Git applies filters (e.g. Git LFS) to files before hashing them, so all hashes are discarded when
+    attributes files or filter configuration change.
+    """
+
+    # NOTE: Files modified within this interval before they are hashed may be changed again without changing their
+    # modification time on file systems with coarse timestamps; their hashes are not cached.
+    RACY_INTERVAL_NS = 2_000_000_000
+
+    def __init__(self, path: Union[Path, str], root: Union[Path, str], repository: git.Repo):
+        self._path = Path(path)
+        self._root = Path(root)
+        self._repository = repository
+        self._entries: Optional[Dict[str, List]] = None
+        self._attributes_digest: Optional[str] = None
+        self._pruned = False
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        """Path of the cache file."""
+        return self._path
+
+    def hash_objects(self, paths: List[Union[Path, str]]) -> List[str]:
+        """Create git hashes for a list of paths reusing cached hashes of unmodified files.
+
+        Args:
+            paths(List[Union[Path, str]]): Paths to hash.
+
+        Returns:
+            List[str]: Hashes of paths in the same order.
+        """
+        hashes: Dict[str, str] = {}
+        missing: List[str] = []
+        stats: Dict[str, os.stat_result] = {}
+
+        with self._lock:
+            entries = self._get_entries()
+            if self._attributes_digest is None:
+                return BaseRepository.hash_objects(paths)
+
+            for path in paths:
+                key = self._get_key(path)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    missing.append(str(path))
+                    continue
+
+                entry = entries.get(key) if key else None
+                if entry and entry[:3] == [stat.st_size, stat.st_mtime_ns, stat.st_ino]:
+                    hashes[str(path)] = entry[3]
+                else:
+                    missing.append(str(path))
+                    stats[str(path)] = stat
+
+        if not missing:
+            return [hashes[str(p)] for p in paths]
+
+        start = time.time_ns()
+        calculated_hashes = BaseRepository.hash_objects(cast(List[Union[Path, str]], missing))
+
+        with self._lock:
+            entries = self._get_entries()
+            for path, hash in zip(missing, calculated_hashes):
+                hashes[path] = hash
+                key = self._get_key(path)
+                stat = stats.get(path)
+                if not key or not stat or not stat_module.S_ISREG(stat.st_mode):
+                    continue
+                elif stat.st_mtime_ns < start - self.RACY_INTERVAL_NS:
+                    entries[key] = [stat.st_size, stat.st_mtime_ns, stat.st_ino, hash]
+                else:
+                    entries.pop(key, None)
+
+            self._save()
+
+        return [hashes[str(p)] for p in paths]
+
+    def invalidate(self):
+        """Re-read cached hashes and discard them if attributes files or filter configuration changed."""
+        with self._lock:
+            self._entries = None
+
+    def clear(self):
+        """Remove all cached hashes."""
+        with self._lock:
+            self._entries = None
+            if self._path.exists():
+                self._path.unlink()
+
+    def _get_key(self, path: Union[Path, str]) -> Optional[str]:
+        """Return a cache key for a path or None if the path is not inside the repository."""
+        relative_path = os.path.relpath(os.path.abspath(path), self._root)
+        return None if relative_path.startswith("..") else Path(relative_path).as_posix()
+
+    def _get_entries(self) -> Dict[str, List]:
+        if self._entries is None:
+            self._attributes_digest = self._get_attributes_digest()
+            try:
+                data = json.loads(self._path.read_text())
+            except (OSError, ValueError):
+                data = {}
+
+            valid = isinstance(data, dict) and data.get("attributes") == self._attributes_digest
+            self._entries = data.get("entries", {}) if valid and self._attributes_digest else {}
+
+        return cast(Dict[str, List], self._entries)
+
+    def _get_attributes_digest(self) -> Optional[str]:
+        """Return a digest of attributes files and filter configuration or None if they cannot be read."""
+        try:
+            filenames = self._repository.git.ls_files(
+                "--cached", "--others", "--exclude-standard", "-z", "--", ".gitattributes", "*/.gitattributes"
+            ).split("\0")
+        except git.GitCommandError:
+            return None
+
+        try:
+            configuration = self._repository.git.config("-z", "--get-regexp", r"^(filter\.|core\.attributesfile)")
+        except git.GitCommandError:  # NOTE: git returns an error if nothing matches
+            configuration = ""
+
+        paths = [self._root / f for f in sorted(f for f in filenames if f)]
+        paths.append(Path(self._repository.git_dir) / "info" / "attributes")
+        for entry in configuration.split("\0"):
+            key, _, value = entry.partition("\n")
+            if key.lower() == "core.attributesfile":
+                paths.append(Path(value).expanduser())
+
+        digest = hashlib.sha256(configuration.encode("utf-8"))
+        for path in paths:
+            try:
+                content = path.read_bytes()
+            except OSError:
+                content = b""
+            digest.update(f"\0{path}\0{len(content)}\0".encode("utf-8"))
+            digest.update(content)
+
+        return digest.hexdigest()
+
+    def _prune(self):
+        """Remove entries of files that don't exist anymore."""
+        entries = self._get_entries()
+        for key in [k for k in entries if not os.path.lexists(self._root / k)]:
+            del entries[key]
+
+    def _save(self):
+        """Write the cache atomically so that concurrent renku commands never read a partially-written cache."""
+        # NOTE: Pruning checks all cached paths, so do it at most once per command
+        if not self._pruned:
+            self._prune()
+            self._pruned = True
+
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile("w", dir=self._path.parent, delete=False) as file:
+                json.dump({"attributes": self._attributes_digest, "entries": self._entries}, file)
+            os.replace(file.name, self._path)
+        except OSError:
+            # NOTE: The cache is an optimization only; hashes are calculated again next time
+            pass
+
+
 def _create_repository(path: Union[Path, str], search_parent_directories: bool = False) -> git.Repo:
     """Create a git Repository."""
     try:
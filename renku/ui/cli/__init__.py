@@ -59,6 +59,26 @@ Windows:
 If in doubt where to look for the configuration file, you can display its path
 by running ``renku --global-config-path``.
 
+Database statistics
+~~~~~~~~~~~~~~~~~~~
+
+To see how many metadata objects a command loads and stores, how many bytes it
+reads and writes and how much time it spends doing so, set the
+``RENKU_DATABASE_STATS`` environment variable to ``text`` or ``json`` (or pass
+``--stats text`` or ``--stats json`` to ``renku``). The statistics are printed
+to the standard error at the end of the command.
+
+Profiling
+~~~~~~~~~
+
+To find out where a command spends its time, set the ``RENKU_PROFILE``
+environment variable to a directory (or pass ``--profile <directory>`` to
+``renku``). For each executed command, a JSON file with the duration of the
+dependency injection setup, of each pre- and post-hook (e.g. migration checks,
+database loading and committing) and of the operation itself is written to
+this directory together with a ``cProfile`` profile that can be inspected with
+``python -m pstats`` or tools like ``snakeviz``.
+
 """
 import os
 import sys
@@ -133,13 +153,14 @@ def _is_renku_project(path: Path) -> bool:
     from renku.core.management import RENKU_HOME
     from renku.core.management.repository import RepositoryApiMixin
     from renku.core.migration.utils import OLD_METADATA_PATH
-    from renku.infrastructure.database import Database
+    from renku.infrastructure.database import Database, PackedStorage
 
     renku_path = Path(path) / RENKU_HOME
     old_metadata = renku_path / OLD_METADATA_PATH
     new_metadata = renku_path / RepositoryApiMixin.DATABASE_PATH / Database.ROOT_OID
+    packed_metadata = renku_path / RepositoryApiMixin.DATABASE_PATH
 
-    return old_metadata.exists() or new_metadata.exists()
+    return old_metadata.exists() or new_metadata.exists() or PackedStorage.is_packed(packed_metadata)
 
 
 yaml.add_representer(uuid.UUID, _uuid_representer)
@@ -155,6 +176,22 @@ def print_global_config_path(ctx, param, value):
     ctx.exit()
 
 
+def enable_database_statistics(ctx, param, value):
+    """Print database statistics at the end of a command."""
+    if value:
+        from renku.command.command_builder.database import DATABASE_STATISTICS_META_KEY
+
+        ctx.meta[DATABASE_STATISTICS_META_KEY] = value
+
+
+def enable_profiling(ctx, param, value):
+    """Write timings and a profile of commands to a directory."""
+    if value:
+        from renku.command.command_builder.profiler import PROFILE_META_KEY
+
+        ctx.meta[PROFILE_META_KEY] = value
+
+
 def is_allowed_subcommand(ctx):
     """Called from subcommands to check if their subsubcommand is allowed.
 
@@ -213,6 +250,22 @@ def is_allowed_command(ctx):
     expose_value=False,
     help="Do not periodically check PyPI for a new version of renku.",
 )
+@click.option(
+    "--stats",
+    type=click.Choice(["text", "json"]),
+    callback=enable_database_statistics,
+    expose_value=False,
+    hidden=True,
+    help=enable_database_statistics.__doc__,
+)
+@click.option(
+    "--profile",
+    type=click.Path(file_okay=False, writable=True),
+    callback=enable_profiling,
+    expose_value=False,
+    hidden=True,
+    help=enable_profiling.__doc__,
+)
 @click.pass_context
 def cli(ctx, path, external_storage_requested):
     """Check common Renku commands used in various situations."""
@@ -97,6 +97,11 @@ The following values are available for the ``renku config`` command:
 | ``lfs_threshold``              | Threshold file size below which     | ``100kb`` |
 |                                | files are not added to git LFS      |           |
 +--------------------------------+-------------------------------------+-----------+
+| ``workflow_cache``             | Whether to restore outputs of       | ``False`` |
+|                                | workflow steps that were executed   |           |
+|                                | before with the same parameters and |           |
+|                                | inputs instead of running them      |           |
++--------------------------------+-------------------------------------+-----------+
 | ``zenodo.access_token``        | Access token for Zenodo API         | ``None``  |
 +--------------------------------+-------------------------------------+-----------+
 | ``dataverse.access_token``     | Access token for Dataverse API      | ``None``  |
@@ -53,6 +53,9 @@ If you want the Knowledge Graph data for the whole project, you can use
 ``renku graph export --full``. Alternatively, you can get data for a single
 commit by using ``renku graph export --revision <git commit sha>`` or by
 specifying a range of commits like ``renku graph export --revision sha1..sha2``.
+Metadata is read as it was at the given commit (or at the end of the range)
+directly from git, so objects that were changed afterwards are exported with
+their state at that commit.
 
 ``renku graph export`` currently supports various formats for export, such as
 ``json-ld``, ``rdf``, ``nt`` (for triples) and ``dot`` (for GraphViz graphs),
@@ -68,6 +71,90 @@ To run validation on the generated output, you can pass the ``--strict``
 option, which will check that all the nodes and properties in the graph are
 correct and that there isn't anything missing.
 
+Packing metadata
+~~~~~~~~~~~~~~~~
+
+By default, Renku stores each metadata object in a separate file inside
+``.renku/metadata``. Projects with a long history end up with many thousands
+of small files, which makes cloning, checking out and loading the project
+slow. You can move all metadata objects into a single pack file (with a
+sidecar index) using:
+
+.. code-block:: console
+
+   $ renku graph pack
+   OK: Packed 12345 metadata objects.
+
+New metadata is appended to the pack file from then on. To convert the
+project back to one file per object, run ``renku graph pack --unpack``.
+
+Modified objects are appended as new versions instead of being overwritten,
+so the pack file accumulates outdated data. Renku rewrites it automatically
+once more than half of it is outdated.
+
+.. note:: Since the pack file is a single binary file, concurrent changes to
+   metadata in different branches can't be merged by git. Only pack projects
+   whose metadata is modified in one branch at a time.
+
+.. note:: Git stores a full copy of the pack and index files for every
+   command that modifies metadata, whereas unpacked metadata only adds the
+   modified objects. Packing makes loading faster but grows the repository
+   history faster, so keep the default unpacked format for projects with many
+   commands and a small metadata graph.
+
+Metadata encoding
+~~~~~~~~~~~~~~~~~
+
+Metadata objects are encoded as JSON by default. Encoding them in the compact
+binary MessagePack format makes reading and writing metadata considerably
+faster, at the cost of metadata files not being human-readable anymore. To
+re-encode all existing metadata and use the binary format for new metadata,
+run:
+
+.. code-block:: console
+
+   $ renku graph codec msgpack
+   OK: Converted 12345 metadata objects to 'msgpack'.
+
+Metadata in either format can always be read. Run ``renku graph codec json``
+to switch back to JSON.
+
+Compressing metadata
+~~~~~~~~~~~~~~~~~~~~
+
+Most metadata objects are small and very similar to each other, so they
+compress poorly on their own. Renku can train a compression dictionary on a
+project's existing metadata and recompress all objects with it, which
+considerably shrinks the size of the metadata:
+
+.. code-block:: console
+
+   $ renku graph compress
+   OK: Recompressed 12345 metadata objects.
+
+The dictionary is stored in ``.renku/metadata/dictionaries`` and is used for
+new metadata as well. Re-run the command once the project's metadata has grown
+significantly to train a new dictionary; previous dictionaries are kept so
+that all metadata can still be read. Use ``--dictionary-size`` to change the
+maximum size of the dictionary in bytes.
+
+Removing unreachable metadata
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Changing metadata can leave objects behind that are not used anymore, e.g.
+when internal index structures are rebalanced. Such objects can be removed
+with:
+
+.. code-block:: console
+
+   $ renku graph gc
+   OK: Removed 123 unreachable metadata objects.
+
+Use ``--dry-run`` to only list unreachable objects without removing them. For
+packed metadata, removed objects are only marked as deleted in the index; pass
+``--repack`` to rewrite the pack file with the remaining objects and reclaim
+the space used by removed and outdated objects.
+
 """
 
 import click
@@ -119,7 +206,7 @@ def export(format, revision, full, strict, no_indent):
 
     communicator = ClickCallback()
     result = (
-        export_graph_command()
+        export_graph_command(revision_or_range=revision)
         .with_communicator(communicator)
         .build()
         .execute(format=format, strict=strict, revision_or_range=revision)
@@ -142,3 +229,58 @@ def export(format, revision, full, strict, no_indent):
         raise NotImplementedError(f"Format {format} not supported for graph export.")
 
     click.echo(result)
+
+
+@graph.command()
+@click.option("--unpack", is_flag=True, help="Convert packed metadata back to one file per object.")
+def pack(unpack):
+    """Pack metadata objects into a single file."""
+    import renku.ui.cli.utils.color as color
+    from renku.command.graph import pack_graph_command
+
+    result = pack_graph_command().build().execute(unpack=unpack)
+    action = "Unpacked" if unpack else "Packed"
+
+    click.secho(f"OK: {action} {result.output} metadata objects.", fg=color.GREEN)
+
+
+@graph.command()
+@click.argument("codec", type=click.Choice(["json", "msgpack"]))
+def codec(codec):
+    """Change encoding of metadata objects."""
+    import renku.ui.cli.utils.color as color
+    from renku.command.graph import convert_graph_command
+
+    result = convert_graph_command().build().execute(codec=codec)
+
+    click.secho(f"OK: Converted {result.output} metadata objects to '{codec}'.", fg=color.GREEN)
+
+
+@graph.command()
+@click.option("--dictionary-size", type=int, default=None, help="Maximum size of the dictionary in bytes.")
+def compress(dictionary_size):
+    """Compress metadata objects with a trained dictionary."""
+    import renku.ui.cli.utils.color as color
+    from renku.command.graph import compress_graph_command
+
+    result = compress_graph_command().build().execute(dictionary_size=dictionary_size)
+
+    click.secho(f"OK: Recompressed {result.output} metadata objects.", fg=color.GREEN)
+
+
+@graph.command()
+@click.option("--dry-run", is_flag=True, help="Only list unreachable metadata objects without removing them.")
+@click.option("--repack", is_flag=True, help="Rewrite the pack file of packed metadata with the remaining objects.")
+def gc(dry_run, repack):
+    """Remove unreachable metadata objects."""
+    import renku.ui.cli.utils.color as color
+    from renku.command.graph import gc_graph_command
+
+    result = gc_graph_command().build().execute(dry_run=dry_run, repack=repack)
+
+    if dry_run:
+        for name in result.output:
+            click.echo(name)
+        return
+
+    click.secho(f"OK: Removed {len(result.output)} unreachable metadata objects.", fg=color.GREEN)
@@ -26,6 +26,9 @@ At the moment, it shows workflow executions and dataset changes.
     Activity /activities/be60896d8d984a0bb585e53f7a3146dc
     Start Time: 2022-02-03T13:56:27+01:00
     End Time: 2022-02-03T13:56:28+01:00
+    Exit Code: 0
+    CPU Time: 0.84s
+    Peak Memory: 41.2 MiB
     User: John Doe <John.Doe@example.com>
     Renku Version: renku 1.0.5
     Plan:
@@ -44,6 +47,12 @@ At the moment, it shows workflow executions and dataset changes.
     Creators modified:
             + John Doe <John.Doe@example.com>
 
+Exit code, CPU time and peak memory are recorded for commands executed with
+``renku run`` and for workflows executed with the ``local`` and ``toil``
+providers. The default ``cwltool`` provider doesn't report results of
+individual steps, so its activities share the start and end time of the whole
+workflow and don't show these values.
+
 To show only dataset entries, use ``-d``, to show only workflows, use ``-w``.
 
 You can select a format using the ``--format <format>`` argument.
@@ -87,6 +96,15 @@ def _print_activity_log(log_entry: ActivityLogViewModel) -> str:
         style_key("End Time: ") + log_entry.details.end_time,
     ]
 
+    if log_entry.details.exit_code is not None:
+        results.append(style_key("Exit Code: ") + str(log_entry.details.exit_code))
+    if log_entry.details.cpu_time is not None:
+        results.append(style_key("CPU Time: ") + f"{log_entry.details.cpu_time:.2f}s")
+    if log_entry.details.peak_memory is not None:
+        from humanize import naturalsize  # Slow import
+
+        results.append(style_key("Peak Memory: ") + naturalsize(log_entry.details.peak_memory, binary=True))
+
     if log_entry.details.user:
         results.append(style_key("User: ") + log_entry.details.user)
     if log_entry.details.renku_version:
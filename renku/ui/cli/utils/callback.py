@@ -34,10 +34,10 @@ class StandardOutput(CommunicationCallback):
         self._progress_bars = {}
         self._progress_types = ["download"]
 
-    def echo(self, msg, end="\n"):
+    def echo(self, msg, end="\n", err=False):
         """Write a message."""
         with CommunicationCallback.lock:
-            print(msg, end=end)
+            print(msg, end=end, file=sys.stderr if err else sys.stdout)
 
     def info(self, msg):
         """Write an info message."""
@@ -101,13 +101,13 @@ class ClickCallback(StandardOutput):
     WARNING = click.style("Warning: ", bold=True, fg=color.YELLOW)
     ERROR = click.style("Error: ", bold=True, fg=color.RED)
 
-    def echo(self, msg, end="\n"):
+    def echo(self, msg, end="\n", err=False):
         """Write a message."""
         new_line = True
         if end != "\n":
             msg = msg + end
             new_line = False
-        click.echo(msg, nl=new_line)
+        click.echo(msg, nl=new_line, err=err)
 
     def info(self, msg):
         """Write an info message."""
@@ -141,6 +141,13 @@ environment variables when executing the command, in the form of
 
 Provider specific settings can be passed as file using the ``--config`` parameter.
 
+When the ``workflow_cache`` configuration value is set (``renku config set
+workflow_cache true``), steps that were executed before with the same
+parameter values and the same input files are not run again; their outputs are
+restored from the project's history instead. Restored steps are not recorded
+as new activities; their outputs keep referring to the earlier execution that
+generated them. This applies to ``renku rerun`` and ``renku update`` as well.
+
 .. cheatsheet::
    :group: Workflows
    :command: $ renku workflow execute --provider <provider> [--set
@@ -212,6 +219,19 @@ This would execute ``my-run`` three times, where ``parameter-1`` values would be
 ``10``, `20`` and ``30`` and the producing output files ``output_0.txt``,
 ``output_1.txt`` and ``output_2.txt`` files in this order.
 
+By default all iterations are executed together as a single workflow. For large
+parameter sweeps, ``--batch-size <n>`` generates and executes only ``n``
+iterations at a time, which keeps memory usage bounded. Iterations in a batch
+are independent of each other, so a provider that runs steps concurrently,
+such as ``local``, executes them in parallel. Each batch is committed
+separately once it has finished; if a batch fails, the outputs and activities
+of earlier batches are kept.
+
+.. code-block:: console
+
+    $ renku workflow iterate --batch-size 32 --provider local \
+            --map parameter-1=[10,20,30] --map output=output_{iter_index}.txt my-run
+
 Exporting Plans
 ***************
 
@@ -1147,8 +1167,16 @@ def visualize(sources, columns, exclude_files, ascii, interactive, no_color, pag
 )
 @click.option("mappings", "-m", "--map", multiple=True, help="Mapping for a workflow parameter.")
 @click.option("config", "-c", "--config", metavar="<config file>", help="YAML file containing config for the provider.")
+@click.option(
+    "batch_size",
+    "-b",
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of iterations to generate and execute at a time. By default, all iterations are executed at once.",
+)
 @click.argument("name_or_id", required=True, shell_complete=_complete_workflows)
-def iterate(name_or_id, mappings, mapping_path, dry_run, provider, config):
+def iterate(name_or_id, mappings, mapping_path, dry_run, provider, config, batch_size):
     """Execute a workflow by iterating through a range of provided parameters."""
     from renku.command.view_model.plan import PlanViewModel
     from renku.command.workflow import iterate_workflow_command, show_workflow_command
@@ -1173,4 +1201,5 @@ def iterate(name_or_id, mappings, mapping_path, dry_run, provider, config):
         dry_run=dry_run,
         provider=provider,
         config=config,
+        batch_size=batch_size,
     )
@@ -65,7 +65,8 @@ class GraphExportCtrl(ServiceCtrl, RenkuOperationMixin):
         }
 
         try:
-            result = export_graph_command().build().execute(revision_or_range=self.context["revision"])
+            revision = self.context["revision"]
+            result = export_graph_command(revision_or_range=revision).build().execute(revision_or_range=revision)
 
             format = self.context["format"]
 
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2017-2022 - Swiss Data Science Center (SDSC)
+# A partnership between École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Renku fixtures for benchmarks."""
+
+import json
+import os
+import platform
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import pytest
+
+from tests.benchmarks.generator import ProjectSize, generate_project
+
+BASELINES_PATH = Path(__file__).parent.parent / "baselines.json"
+
+
+def _get_int_from_environment(name: str, default: int) -> int:
+    """Return a positive integer from an environment variable."""
+    value = int(os.environ.get(name, default))
+    if value < 1:
+        raise ValueError(f"{name} must be a positive integer: {value}")
+
+    return value
+
+
+@pytest.fixture(scope="session")
+def benchmark_results():
+    """Collect benchmark results and write them to ``RENKU_BENCHMARK_OUTPUT`` as JSON at the end of the session."""
+    from renku.version import __version__
+
+    results: Dict[str, Any] = {}
+
+    yield results
+
+    output = os.environ.get("RENKU_BENCHMARK_OUTPUT")
+    if not output or not results:
+        return
+
+    report = {
+        "renku_version": __version__,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "benchmarks": dict(sorted(results.items())),
+    }
+    Path(output).write_text(json.dumps(report, indent=2) + "\n")
+
+
+@pytest.fixture
+def benchmark_project(client, client_database_injection_manager):
+    """A project with synthetic metadata whose size is multiplied by ``RENKU_BENCHMARK_SCALE``."""
+    scale = _get_int_from_environment("RENKU_BENCHMARK_SCALE", 1)
+    size = ProjectSize().scaled(scale)
+
+    with client_database_injection_manager(client):
+        project = generate_project(client, size)
+
+    yield client, project, size, scale
+
+
+@pytest.fixture
+def benchmark(benchmark_project, benchmark_results, record_property):
+    """Time a scenario on the benchmark project and record its results.
+
+    The returned callable takes a scenario name, the function to time and an optional setup function that is called
+    untimed before each repetition. Both functions are called with the repetition number. The number of repetitions
+    is read from ``RENKU_BENCHMARK_REPEAT``. If ``RENKU_BENCHMARK_MAX_SLOWDOWN`` is set, the median is compared against
+    the recorded baselines of the same scale and the benchmark fails if it is slower by more than the given factor.
+    Timings are also recorded as test properties, e.g. for ``--junitxml`` reports.
+    """
+    _, _, size, scale = benchmark_project
+    repeat = _get_int_from_environment("RENKU_BENCHMARK_REPEAT", 3)
+    max_slowdown = os.environ.get("RENKU_BENCHMARK_MAX_SLOWDOWN")
+
+    def _benchmark(name: str, function: Callable[[int], Any], setup: Optional[Callable[[int], Any]] = None):
+        timings = []
+        for index in range(repeat):
+            if setup:
+                setup(index)
+
+            start = time.perf_counter()
+            function(index)
+            timings.append(time.perf_counter() - start)
+
+        median = statistics.median(timings)
+        benchmark_results[name] = {
+            "scale": scale,
+            "size": size._asdict(),
+            "timings": timings,
+            "min": min(timings),
+            "median": median,
+        }
+        record_property(f"{name}_median", median)
+        record_property(f"{name}_min", min(timings))
+
+        if max_slowdown:
+            baseline = json.loads(BASELINES_PATH.read_text()).get(str(scale), {}).get(name)
+            if baseline is not None and median > baseline * float(max_slowdown):
+                pytest.fail(f"Benchmark '{name}' took {median:.3f}s, baseline is {baseline:.3f}s", pytrace=False)
+
+        return timings
+
+    return _benchmark
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2017-2022 - Swiss Data Science Center (SDSC)
+# A partnership between École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Generate synthetic Renku projects for benchmarks."""
+
+from datetime import timedelta
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from renku.command.command_builder import inject
+from renku.core.dataset.datasets_provenance import DatasetsProvenance
+from renku.core.interface.activity_gateway import IActivityGateway
+from renku.core.interface.database_gateway import IDatabaseGateway
+from renku.core.interface.plan_gateway import IPlanGateway
+from renku.core.util.datetime8601 import local_now
+from renku.domain_model.dataset import Dataset, DatasetFile
+from renku.domain_model.entity import Entity
+from renku.domain_model.provenance.activity import Activity, Association, Generation, Usage
+from renku.domain_model.provenance.agent import Person, SoftwareAgent
+from renku.domain_model.provenance.parameter import ParameterValue
+from renku.domain_model.workflow.composite_plan import CompositePlan
+from renku.domain_model.workflow.parameter import CommandInput, CommandOutput
+from renku.domain_model.workflow.plan import Plan
+
+AGENT = SoftwareAgent(name="renku benchmarks", id="https://github.com/swissdatasciencecenter/renku-python/benchmarks")
+PERSON = Person(name="Renku Bot", email="renku@datascience.ch")
+
+
+class ProjectSize(NamedTuple):
+    """Size of a synthetic project."""
+
+    chains: int = 2
+    """Number of independent linear pipelines."""
+    chain_length: int = 5
+    """Number of activities in each pipeline."""
+    fans: int = 1
+    """Number of inputs that are used by several activities."""
+    fan_out: int = 5
+    """Number of activities that use each fan input."""
+    datasets: int = 2
+    """Number of datasets."""
+    files_per_dataset: int = 5
+    """Number of files in each dataset."""
+    composition_depth: int = 2
+    """Nesting depth of composite plans that are built from the plans of each pipeline."""
+
+    def scaled(self, factor: int) -> "ProjectSize":
+        """Return a size with all counts except the composition depth multiplied by ``factor``."""
+        return self._replace(
+            **{name: value * factor for name, value in self._asdict().items() if name != "composition_depth"}
+        )
+
+    @property
+    def activities(self) -> int:
+        """Number of generated activities."""
+        return self.chains * self.chain_length + self.fans * self.fan_out
+
+
+class SyntheticProject(NamedTuple):
+    """Paths of a generated project that benchmarks can modify or query."""
+
+    chain_inputs: List[str]
+    """First input of each pipeline."""
+    chain_outputs: List[str]
+    """Last output of each pipeline."""
+    fan_inputs: List[str]
+    """Inputs that are used by several activities."""
+    datasets: List[str]
+    """Names of generated datasets."""
+
+
+def generate_project(client, size: ProjectSize) -> SyntheticProject:
+    """Create files and metadata of a synthetic project and commit them.
+
+    Metadata is created directly through the gateways instead of executing workflows, so that large projects can be
+    generated in a reasonable time. Must be called with database injection in place.
+
+    Args:
+        client: The ``LocalClient`` of an initialized project.
+        size(ProjectSize): Size of the project to generate.
+
+    Returns:
+        SyntheticProject: Paths and names of the generated project.
+    """
+    chains = [[f"chains/{c}/{s}.txt" for s in range(size.chain_length + 1)] for c in range(size.chains)]
+    fans = [(f"fans/{f}/input.txt", [f"fans/{f}/{o}.txt" for o in range(size.fan_out)]) for f in range(size.fans)]
+    datasets = {
+        f"dataset-{d}": [f"data/dataset-{d}/{f}.txt" for f in range(size.files_per_dataset)]
+        for d in range(size.datasets)
+    }
+
+    paths = [p for chain in chains for p in chain]
+    paths += [p for source, outputs in fans for p in [source, *outputs]]
+    paths += [p for files in datasets.values() for p in files]
+
+    for path in paths:
+        absolute_path = client.path / path
+        absolute_path.parent.mkdir(parents=True, exist_ok=True)
+        absolute_path.write_text(f"{path}\n")
+
+    client.repository.add(all=True)
+    client.repository.commit("benchmarks: add files", no_verify=True)
+
+    checksums = client.repository.get_object_hashes(paths=paths, revision="HEAD")
+
+    _generate_metadata(client=client, size=size, chains=chains, fans=fans, datasets=datasets, checksums=checksums)
+
+    client.repository.add(all=True)
+    client.repository.commit("benchmarks: add metadata", no_verify=True)
+
+    return SyntheticProject(
+        chain_inputs=[chain[0] for chain in chains],
+        chain_outputs=[chain[-1] for chain in chains],
+        fan_inputs=[source for source, _ in fans],
+        datasets=list(datasets),
+    )
+
+
+@inject.autoparams("activity_gateway", "database_gateway", "plan_gateway")
+def _generate_metadata(
+    client,
+    size: ProjectSize,
+    chains: List[List[str]],
+    fans: List[Tuple[str, List[str]]],
+    datasets: Dict[str, List[str]],
+    checksums: Dict[str, Optional[str]],
+    activity_gateway: IActivityGateway,
+    database_gateway: IDatabaseGateway,
+    plan_gateway: IPlanGateway,
+):
+    """Add activities, plans and datasets to the database."""
+    project_id = client.project.id
+    ended_at_time = local_now() - timedelta(days=1)
+
+    for c, chain in enumerate(chains):
+        plans = []
+        for s, (input, output) in enumerate(zip(chain, chain[1:])):
+            plan = _create_plan(name=f"chain-{c}-step-{s}", project_id=project_id)
+            activity = _create_activity(plan, input, output, checksums, project_id, ended_at_time)
+            activity_gateway.add(activity)
+            plans.append(plan)
+
+        for depth in range(size.composition_depth):
+            composite_plan = CompositePlan(
+                id=CompositePlan.generate_id(), name=f"chain-{c}-level-{depth}", plans=plans, project_id=project_id
+            )
+            plan_gateway.add(composite_plan)
+            plans = [composite_plan]
+
+    for f, (input, outputs) in enumerate(fans):
+        for o, output in enumerate(outputs):
+            plan = _create_plan(name=f"fan-{f}-output-{o}", project_id=project_id)
+            activity = _create_activity(plan, input, output, checksums, project_id, ended_at_time)
+            activity_gateway.add(activity)
+
+    datasets_provenance = DatasetsProvenance()
+    for name, files in datasets.items():
+        dataset_files = [
+            DatasetFile(entity=Entity(checksum=checksums[path] or "", path=path), source=path) for path in files
+        ]
+        dataset = Dataset(name=name, creators=[PERSON], dataset_files=dataset_files, project_id=project_id)
+        datasets_provenance.add_or_update(dataset, creator=PERSON)
+
+    database_gateway.commit()
+
+
+def _create_plan(name: str, project_id: str) -> Plan:
+    """Create a plan that copies a file."""
+    id = Plan.generate_id()
+
+    return Plan(
+        id=id,
+        name=name,
+        command="cp",
+        inputs=[CommandInput(id=CommandInput.generate_id(id, 1), default_value="input", position=1)],
+        outputs=[CommandOutput(id=CommandOutput.generate_id(id, 2), default_value="output", position=2)],
+        project_id=project_id,
+    )
+
+
+def _create_activity(
+    plan: Plan, input: str, output: str, checksums: Dict[str, Optional[str]], project_id: str, ended_at_time
+) -> Activity:
+    """Create an activity that executed a plan."""
+    id = Activity.generate_id()
+
+    return Activity(
+        id=id,
+        association=Association(agent=AGENT, id=Association.generate_id(id), plan=plan),
+        agents=[AGENT, PERSON],
+        usages=[Usage(id=Usage.generate_id(id), entity=_create_entity(input, checksums))],
+        generations=[Generation(id=Generation.generate_id(id), entity=_create_entity(output, checksums))],
+        parameters=[
+            ParameterValue(id=ParameterValue.generate_id(id), parameter_id=plan.inputs[0].id, value=input),
+            ParameterValue(id=ParameterValue.generate_id(id), parameter_id=plan.outputs[0].id, value=output),
+        ],
+        project_id=project_id,
+        started_at_time=ended_at_time - timedelta(seconds=1),
+        ended_at_time=ended_at_time,
+    )
+
+
+def _create_entity(path: str, checksums: Dict[str, Optional[str]]) -> Entity:
+    """Create an entity for a committed file."""
+    return Entity(checksum=checksums[path] or "", path=Path(path))
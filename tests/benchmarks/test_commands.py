@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2017-2022 - Swiss Data Science Center (SDSC)
+# A partnership between École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmarks of Renku commands."""
+
+import pytest
+
+from renku.ui.cli import cli
+from tests.utils import format_result_exception
+
+
+def _invoke(runner, args, exit_code=0):
+    """Invoke a command and check its exit code."""
+    result = runner.invoke(cli, ["--no-external-storage", *args])
+    assert exit_code == result.exit_code, format_result_exception(result)
+
+    return result
+
+
+def _modify_chain_inputs(client, project):
+    """Modify the first input of all pipelines."""
+    for path in project.chain_inputs:
+        (client.path / path).write_text("modified\n")
+
+    client.repository.add(*project.chain_inputs)
+    client.repository.commit("benchmarks: modify inputs", no_verify=True)
+
+
+@pytest.mark.benchmark
+def test_status(runner, benchmark_project, benchmark):
+    """Benchmark ``renku status`` on an up-to-date project."""
+    benchmark("status", lambda _: _invoke(runner, ["status"]))
+
+
+@pytest.mark.benchmark
+def test_status_outdated(runner, benchmark_project, benchmark):
+    """Benchmark ``renku status`` when all pipelines are outdated."""
+    client, project, size, _ = benchmark_project
+    _modify_chain_inputs(client, project)
+
+    benchmark("status-outdated", lambda _: _invoke(runner, ["status"], exit_code=1))
+
+    result = _invoke(runner, ["status"], exit_code=1)
+    assert f"Outdated outputs({size.chains * size.chain_length}):" in result.output
+
+
+@pytest.mark.benchmark
+def test_update_dry_run(runner, benchmark_project, benchmark):
+    """Benchmark ``renku update --dry-run`` when all pipelines are outdated."""
+    client, project, _, _ = benchmark_project
+    _modify_chain_inputs(client, project)
+
+    benchmark("update-dry-run", lambda _: _invoke(runner, ["update", "--all", "--dry-run"]))
+
+
+@pytest.mark.benchmark
+def test_run(runner, benchmark_project, benchmark):
+    """Benchmark ``renku run`` of a workflow that uses outputs of existing pipelines."""
+    _, project, _, _ = benchmark_project
+    input = project.chain_outputs[0]
+
+    benchmark("run", lambda index: _invoke(runner, ["run", "--name", f"run-{index}", "cp", input, f"run-{index}.txt"]))
+
+
+@pytest.mark.benchmark
+def test_dataset_add(runner, benchmark_project, benchmark, tmp_path):
+    """Benchmark ``renku dataset add`` of a file to an existing dataset."""
+    _, project, _, _ = benchmark_project
+    dataset = project.datasets[0]
+
+    def create_file(index):
+        (tmp_path / f"file-{index}.txt").write_text(f"file-{index}\n")
+
+    benchmark(
+        "dataset-add",
+        lambda index: _invoke(runner, ["dataset", "add", dataset, str(tmp_path / f"file-{index}.txt")]),
+        setup=create_file,
+    )
+
+
+@pytest.mark.benchmark
+def test_log(runner, benchmark_project, benchmark):
+    """Benchmark ``renku log``."""
+    benchmark("log", lambda _: _invoke(runner, ["log"]))
+
+
+@pytest.mark.benchmark
+def test_graph_export(runner, benchmark_project, benchmark):
+    """Benchmark ``renku graph export`` of the whole project."""
+    benchmark("graph-export", lambda _: _invoke(runner, ["graph", "export", "--full"]))
@@ -17,12 +17,14 @@
 # limitations under the License.
 """Test ``graph`` command."""
 
+import json
 import os
 
 import pytest
 
 from renku.core.management.repository import DEFAULT_DATA_DIR as DATA_DIR
 from renku.domain_model.dataset import Url
+from renku.infrastructure.database import PackedStorage, Storage
 from renku.ui.cli import cli
 from tests.utils import format_result_exception, modified_environ, with_dataset
 
@@ -127,3 +129,138 @@ def test_graph_export_dataset_mutability(runner, client_with_datasets, client_da
 
     assert 1 == result.exit_code
     assert "Both prov:wasDerivedFrom and schema:sameAs are set." in result.output
+
+
+def test_graph_export_revision_state(runner, client):
+    """Test exporting a revision reads metadata as it was in that revision."""
+    assert 0 == runner.invoke(cli, ["project", "edit", "--description", "Old description"]).exit_code
+    revision = client.repository.head.commit.hexsha
+    assert 0 == runner.invoke(cli, ["project", "edit", "--description", "New description"]).exit_code
+
+    result = runner.invoke(cli, ["graph", "export", "--strict", "--revision", revision])
+
+    assert 0 == result.exit_code, format_result_exception(result)
+    assert "Old description" in result.output
+    assert "New description" not in result.output
+
+    result = runner.invoke(cli, ["graph", "export", "--strict", "--revision", f"{revision}..HEAD"])
+
+    assert 0 == result.exit_code, format_result_exception(result)
+    assert "New description" in result.output
+    assert not client.repository.is_dirty(untracked_files=True)
+
+
+def test_graph_pack_and_unpack(runner, client, run):
+    """Test converting metadata storage to packed format and back."""
+    assert 0 == run(["run", "touch", "output"])
+
+    result = runner.invoke(cli, ["graph", "pack"])
+
+    assert 0 == result.exit_code, format_result_exception(result)
+    assert "OK: Packed" in result.output
+    assert PackedStorage.is_packed(client.database_path)
+    assert not client.repository.is_dirty(untracked_files=True)
+
+    assert 0 == run(["run", "cp", "output", "output2"])
+
+    result = runner.invoke(cli, ["graph", "export", "--strict"])
+
+    assert 0 == result.exit_code, format_result_exception(result)
+    assert "output2" in result.output
+
+    result = runner.invoke(cli, ["status"])
+    assert 0 == result.exit_code, format_result_exception(result)
+
+    result = runner.invoke(cli, ["graph", "pack", "--unpack"])
+
+    assert 0 == result.exit_code, format_result_exception(result)
+    assert not PackedStorage.is_packed(client.database_path)
+    assert not client.repository.is_dirty(untracked_files=True)
+
+    result = runner.invoke(cli, ["graph", "export", "--full", "--strict"])
+
+    assert 0 == result.exit_code, format_result_exception(result)
+    assert "output2" in result.output
+
+
+def test_graph_codec(runner, client, run):
+    """Test changing encoding of metadata objects."""
+    assert 0 == run(["run", "touch", "output"])
+
+    result = runner.invoke(cli, ["graph", "codec", "msgpack"])
+
+    assert 0 == result.exit_code, format_result_exception(result)
+    assert "OK: Converted" in result.output
+    assert "msgpack" == Storage.get_codec_name(client.database_path)
+    assert not client.repository.is_dirty(untracked_files=True)
+
+    assert 0 == run(["run", "cp", "output", "output2"])
+
+    result = runner.invoke(cli, ["graph", "export", "--strict"])
+
+    assert 0 == result.exit_code, format_result_exception(result)
+    assert "output2" in result.output
+
+    result = runner.invoke(cli, ["graph", "codec", "json"])
+
+    assert 0 == result.exit_code, format_result_exception(result)
+    assert "json" == Storage.get_codec_name(client.database_path)
+    assert not client.repository.is_dirty(untracked_files=True)
+
+
+def test_graph_gc(runner, client):
+    """Test removing unreachable metadata objects."""
+    assert 0 == runner.invoke(cli, ["dataset", "create", "my-data"]).exit_code
+    assert 0 == runner.invoke(cli, ["dataset", "edit", "my-data", "-t", "new title"]).exit_code
+
+    result = runner.invoke(cli, ["graph", "gc", "--dry-run"])
+
+    assert 0 == result.exit_code, format_result_exception(result)
+    assert not client.repository.is_dirty(untracked_files=True)
+
+    result = runner.invoke(cli, ["graph", "gc"])
+
+    assert 0 == result.exit_code, format_result_exception(result)
+    assert "OK: Removed" in result.output
+    assert not client.repository.is_dirty(untracked_files=True)
+
+    result = runner.invoke(cli, ["dataset", "ls"])
+
+    assert 0 == result.exit_code, format_result_exception(result)
+    assert "new title" in result.output
+
+
+@pytest.mark.parametrize("report_format", ["json", "text"])
+def test_graph_export_database_statistics(split_runner, project, report_format):
+    """Test printing database statistics at the end of a command."""
+    result = split_runner.invoke(cli, ["--stats", report_format, "graph", "export", "--full"])
+
+    assert 0 == result.exit_code, format_result_exception(result)
+    assert "http://schema.org/Project" in result.stdout
+
+    if report_format == "json":
+        assert 0 < json.loads(result.stderr)["objects_loaded"]
+    else:
+        assert "Database statistics:" in result.stderr
+        assert "objects_loaded: " in result.stderr
+
+    # NOTE: The option only applies to the invocation it's passed to
+    result = split_runner.invoke(cli, ["graph", "export", "--full"])
+
+    assert 0 == result.exit_code, format_result_exception(result)
+    assert "" == result.stderr
+
+
+def test_graph_export_profiling(runner, project, tmp_path):
+    """Test writing a profile of a command that is only enabled for the invocation it's passed to."""
+    result = runner.invoke(cli, ["--profile", str(tmp_path), "graph", "export", "--full"])
+
+    assert 0 == result.exit_code, format_result_exception(result)
+    reports = list(tmp_path.glob("*.json"))
+    assert reports
+    assert all(r.with_suffix(".prof").exists() for r in reports)
+
+    result = runner.invoke(cli, ["graph", "export", "--full"])
+
+    assert 0 == result.exit_code, format_result_exception(result)
+    assert reports == list(tmp_path.glob("*.json"))
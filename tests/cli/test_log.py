@@ -32,6 +32,7 @@ def test_activity_log(runner, project):
     assert "Command: touch foo" in result.output
     assert "output-1: foo" in result.output
     assert "Start Time:" in result.output
+    assert "Exit Code: 0" in result.output
     assert "Renku Version:" in result.output
 
     result = runner.invoke(cli, ["run", "--name", "run2", "cp", "foo", "bar"])
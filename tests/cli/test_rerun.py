@@ -25,6 +25,7 @@ from pathlib import Path
 import pytest
 
 from renku.core.plugin.provider import available_workflow_providers
+from renku.infrastructure.gateway.activity_gateway import ActivityGateway
 from renku.infrastructure.repository import Repository
 from renku.ui.cli import cli
 from tests.utils import format_result_exception, write_and_commit_file
@@ -53,6 +54,30 @@ def test_rerun(project, renku_cli, provider):
     assert content != new_content, "Something is not random"
 
 
+def test_rerun_with_workflow_cache(project, client, renku_cli, runner, client_database_injection_manager):
+    """Test rerun restores outputs of unchanged steps instead of executing them."""
+    output = Path(project) / "output.txt"
+
+    assert 0 == renku_cli("run", "python", "-S", "-c", "import random; print(random.random())", stdout=output).exit_code
+    content = output.read_text()
+
+    assert 0 == renku_cli("config", "set", "workflow_cache", "true").exit_code
+
+    write_and_commit_file(Repository(project), output, "modified")
+
+    with client_database_injection_manager(client):
+        activities_before = len(ActivityGateway().get_all_activities())
+
+    result = runner.invoke(cli, ["rerun", str(output)])
+
+    assert 0 == result.exit_code, format_result_exception(result)
+    assert "Restored outputs of 1 unchanged step(s)" in result.output
+    assert content == output.read_text()
+
+    with client_database_injection_manager(client):
+        assert activities_before == len(ActivityGateway().get_all_activities())
+
+
 @pytest.mark.parametrize("provider", available_workflow_providers())
 @pytest.mark.parametrize(
     "source, output",
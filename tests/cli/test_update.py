@@ -140,6 +140,34 @@ def test_update_multiple_steps_with_path(runner, project, renku_cli, provider):
     assert "source.txt" not in result.output
 
 
+@pytest.mark.parametrize("provider", available_workflow_providers())
+def test_update_diamond_workflow(runner, project, renku_cli, provider):
+    """Test update of a workflow where a step depends on several steps that share a parent."""
+    repo = Repository(project)
+    source = os.path.join(project, "source.txt")
+    intermediate = os.path.join(project, "intermediate.txt")
+    left = os.path.join(project, "left.txt")
+    right = os.path.join(project, "right.txt")
+    output = os.path.join(project, "output.txt")
+
+    write_and_commit_file(repo, source, "content")
+
+    assert 0 == renku_cli("run", "cp", source, intermediate).exit_code
+    assert 0 == renku_cli("run", "cp", intermediate, left).exit_code
+    assert 0 == renku_cli("run", "cp", intermediate, right).exit_code
+    assert 0 == renku_cli("run", "cat", left, right, stdout=output).exit_code
+
+    write_and_commit_file(repo, source, "changed ")
+
+    result = runner.invoke(cli, ["update", "-p", provider, "--all"])
+
+    assert 0 == result.exit_code, format_result_exception(result)
+    assert "changed changed " == Path(output).read_text()
+
+    result = runner.invoke(cli, ["status"])
+    assert 0 == result.exit_code, format_result_exception(result)
+
+
 @pytest.mark.parametrize("provider", available_workflow_providers())
 def test_update_with_directory_paths(project, renku_cli, provider):
     """Test update when a directory path is specified."""
@@ -34,6 +34,7 @@ from cwl_utils.parser import cwl_v1_2 as cwlgen
 from renku.core.plugin.provider import available_workflow_providers
 from renku.core.util.yaml import write_yaml
 from renku.infrastructure.database import Database
+from renku.infrastructure.gateway.activity_gateway import ActivityGateway
 from renku.ui.cli import cli
 from tests.utils import format_result_exception, write_and_commit_file
 
@@ -1067,6 +1068,82 @@ def test_workflow_iterate(runner, run_shell, client, workflow, parameters, provi
     assert 0 == result.exit_code, format_result_exception(result)
 
 
+def test_workflow_iterate_in_batches(runner, client, run_shell, client_database_injection_manager):
+    """Test iterating a workflow in batches executes and records every iteration."""
+    run_shell("renku run --name run1 -- echo 1 > output")
+
+    result = runner.invoke(
+        cli,
+        [
+            "workflow",
+            "iterate",
+            "--batch-size",
+            "2",
+            "-p",
+            "local",
+            "--map",
+            "parameter-1=[1,2,3]",
+            "--map",
+            "output-2=output_{iter_index}",
+            "run1",
+        ],
+    )
+
+    assert 0 == result.exit_code, format_result_exception(result)
+    for index, value in enumerate(["1", "2", "3"]):
+        assert f"{value}\n" == (client.path / f"output_{index}").read_text()
+
+    with client_database_injection_manager(client):
+        activity_gateway = ActivityGateway()
+        generations = {g.entity.path for a in activity_gateway.get_all_activities() for g in a.generations}
+
+    assert {"output_0", "output_1", "output_2"} <= generations
+    # NOTE: Each batch is committed separately
+    changes = client.repository.head.commit.get_changes()
+    assert {"output_2"} == {c.b_path for c in changes if not c.b_path.startswith(".renku")}
+
+
+def test_workflow_iterate_in_batches_keeps_finished_batches(
+    runner, client, run_shell, client_database_injection_manager
+):
+    """Test a failing batch doesn't discard the outputs and activities of earlier batches."""
+    write_and_commit_file(
+        client.repository,
+        "write.py",
+        'import sys\nif sys.argv[1] == "fail":\n    sys.exit(1)\nopen(sys.argv[2], "w").write(sys.argv[1])\n',
+    )
+    run_shell("renku run --name run1 -- python write.py value output")
+
+    result = runner.invoke(
+        cli,
+        [
+            "workflow",
+            "iterate",
+            "--batch-size",
+            "2",
+            "-p",
+            "local",
+            "--map",
+            "parameter-2=['a','b','fail']",
+            "--map",
+            "output-3=output_{iter_index}",
+            "run1",
+        ],
+    )
+
+    assert 1 == result.exit_code
+    assert "a" == (client.path / "output_0").read_text()
+    assert "b" == (client.path / "output_1").read_text()
+    assert not client.repository.is_dirty()
+
+    with client_database_injection_manager(client):
+        activity_gateway = ActivityGateway()
+        generations = {g.entity.path for a in activity_gateway.get_all_activities() for g in a.generations}
+
+    assert {"output_0", "output_1"} <= generations
+    assert "output_2" not in generations
+
+
 def test_workflow_cycle_detection(run_shell, project, capsys, client):
     """Test creating a cycle is not possible with renku run or workflow execute."""
     input = client.path / "input"
@@ -1135,3 +1212,73 @@ def test_workflow_execute_docker_toil_stderr(runner, client, run_shell):
 
     assert 1 == result.exit_code, format_result_exception(result)
     assert "Cannot run workflows that have stdin or stderr redirection with Docker" in result.output
+
+
+def test_workflow_execute_local_parallel(runner, client, run_shell):
+    """Test updating a diamond-shaped workflow with the local provider and several workers."""
+    write_and_commit_file(client.repository, "input", "first line\nsecond line")
+
+    run_shell("renku run --name left -- head -n 1 input > left")
+    run_shell("renku run --name right -- tail -n 1 input > right")
+    run_shell("renku run --name merge -- cat left right > merged")
+
+    write_and_commit_file(client.repository, "input", "third line\nfourth line")
+    write_and_commit_file(client.repository, "local.yaml", "workers: 2")
+
+    result = runner.invoke(cli, ["update", "--all", "-p", "local", "-c", "local.yaml"])
+
+    assert 0 == result.exit_code, format_result_exception(result)
+    assert "third line\nfourth line" == (client.path / "merged").read_text()
+
+
+@pytest.mark.parametrize("workers", ["0", "-1", "many"])
+def test_workflow_execute_local_invalid_workers(runner, client, run_shell, workers):
+    """Test the local provider rejects a number of workers that isn't a positive integer."""
+    write_and_commit_file(client.repository, "input", "first line")
+    run_shell("renku run --name run-1 -- cat input > output")
+    write_and_commit_file(client.repository, "local.yaml", f"workers: {workers}")
+
+    result = runner.invoke(cli, ["workflow", "execute", "-p", "local", "-c", "local.yaml", "run-1"])
+
+    assert 0 != result.exit_code
+    assert "The number of 'workers' must be a positive integer" in result.output
+
+
+@pytest.mark.parametrize("provider", ["local", "toil"])
+def test_workflow_execute_records_each_step(runner, client, run_shell, client_database_injection_manager, provider):
+    """Test executing a two-step workflow records timing and resource usage of each step separately."""
+    write_and_commit_file(
+        client.repository, "step.py", "import shutil, sys, time\ntime.sleep(1)\nshutil.copy(sys.argv[1], sys.argv[2])\n"
+    )
+    write_and_commit_file(client.repository, "input", "content")
+
+    run_shell("renku run --name step-1 -- python step.py input intermediate")
+    run_shell("renku run --name step-2 -- python step.py intermediate output")
+
+    result = runner.invoke(cli, ["workflow", "compose", "composite", "step-1", "step-2"])
+    assert 0 == result.exit_code, format_result_exception(result)
+
+    with client_database_injection_manager(client):
+        previous_ids = {a.id for a in ActivityGateway().get_all_activities()}
+
+    result = runner.invoke(cli, ["workflow", "execute", "-p", provider, "composite"])
+    assert 0 == result.exit_code, format_result_exception(result)
+
+    with client_database_injection_manager(client):
+        activities = [a for a in ActivityGateway().get_all_activities() if a.id not in previous_ids]
+        activities = {g.entity.path: a for a in activities for g in a.generations}
+
+    first, second = activities["intermediate"], activities["output"]
+    assert first is not second
+    assert first.started_at_time < first.ended_at_time <= second.started_at_time < second.ended_at_time
+    for activity in (first, second):
+        assert 0 == activity.exit_code
+        assert activity.cpu_time is not None
+        assert activity.peak_memory is not None
+
+    result = runner.invoke(cli, ["graph", "export", "--format", "json-ld", "--strict"])
+
+    assert 0 == result.exit_code, format_result_exception(result)
+    assert "cpuTime" in result.output
+    assert "peakMemory" in result.output
+    assert "exitCode" in result.output
@@ -19,6 +19,7 @@
 
 import copy
 import datetime
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Iterator, Tuple, Union
 
@@ -61,6 +62,11 @@ class DummyStorage:
         """Return True if filename exists in the storage."""
         return filename in self._files
 
+    @contextmanager
+    def batch(self):
+        """Group writes of multiple objects."""
+        yield
+
 
 class DummyDatabaseDispatcher:
     """DatabaseDispatcher with DummyStorage.
@@ -17,11 +17,14 @@
 # limitations under the License.
 """Test command builder."""
 
+import json
 import threading
 
 import pytest
 
+from renku.command.command_builder import inject
 from renku.command.command_builder.command import Command
+from renku.core.interface.client_dispatcher import IClientDispatcher
 from renku.core.util import communication
 from renku.ui.cli.utils.callback import ClickCallback
 from renku.ui.service.utils.callback import ServiceCallback
@@ -93,3 +96,42 @@ def test_no_callback(capsys):
     command.build().execute()
 
     assert "Hello world!" not in capsys.readouterr().out
+
+
+def test_command_profiling(tmp_path, monkeypatch):
+    """Test timings and a profile are written when profiling is enabled."""
+    monkeypatch.setenv("RENKU_PROFILE", str(tmp_path))
+
+    def greet():
+        communication.echo("Hello world!")
+
+    communicator = ServiceCallback()
+    Command().command(greet).with_communicator(communicator).build().execute()
+
+    assert ["Hello world!"] == communicator.messages
+    [report_path] = tmp_path.glob("greet-*.json")
+    report = json.loads(report_path.read_text())
+    assert "greet" == report["command"]
+    assert {"injection", "pre-hooks", "operation", "post-hooks"} == set(report["phases"])
+    assert "test_command_profiling.<locals>.greet" in {s["name"] for s in report["steps"] if s["phase"] == "operation"}
+    assert report_path.with_suffix(".prof").exists()
+
+
+def test_command_status_includes_files_written_in_operation(project):
+    """Test files that an operation writes to the working tree appear in the repository's status."""
+
+    @inject.autoparams()
+    def restore(client_dispatcher: IClientDispatcher):
+        repository = client_dispatcher.current_client.repository
+        untracked_before = repository.get_status().untracked_files
+
+        checksum = repository.get_object_hash(".gitignore", revision="HEAD")
+        with open(repository.path / "restored", "wb") as output_file:
+            repository.copy_content_to_file(".gitignore", checksum=checksum, output_file=output_file)
+
+        return untracked_before, repository.get_status().untracked_files
+
+    untracked_before, untracked_after = Command().command(restore).require_clean().build().execute().output
+
+    assert "restored" not in untracked_before
+    assert "restored" in untracked_after
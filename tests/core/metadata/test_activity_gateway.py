@@ -17,7 +17,13 @@
 # limitations under the License.
 """Test activity database gateways."""
 
+from datetime import datetime, timedelta
 
+import pytest
+
+from renku.core import errors
+from renku.domain_model.entity import Entity
+from renku.domain_model.provenance.activity import Usage
 from renku.domain_model.workflow.plan import Plan
 from renku.infrastructure.gateway.activity_gateway import ActivityGateway
 from tests.utils import create_dummy_activity
@@ -117,3 +123,108 @@ def test_activity_gateway_upstream_activity_chains(dummy_database_injection_mana
         assert {(r3.id,), (r2.id,), (r2.id, r1.id)} == {tuple(a.id for a in chain) for chain in downstream_chains}
 
         assert [] == activity_gateway.get_upstream_activity_chains(r7)
+
+
+def test_activity_gateway_activities_by_path(dummy_database_injection_manager):
+    """Test getting activities by their usages, generations and upstream activities."""
+    r1 = create_dummy_activity(plan="r1", usages=["a"], generations=["data/"])
+    r2 = create_dummy_activity(plan="r2", usages=["data/b"], generations=["c"])
+    r3 = create_dummy_activity(plan="r3", usages=["c", "d"], generations=["e"])
+    r4 = create_dummy_activity(plan="r4", usages=["x"], generations=["data/y"])
+
+    with dummy_database_injection_manager(None):
+        activity_gateway = ActivityGateway()
+
+        for activity in (r1, r2, r3, r4):
+            activity_gateway.add(activity)
+
+        assert [r3] == activity_gateway.get_activities_by_usage("d")
+        assert [] == activity_gateway.get_activities_by_usage("data")
+        assert {r1, r4} == activity_gateway.get_activities_by_related_generation("data")
+        assert {r1} == activity_gateway.get_activities_by_related_generation("data/b")
+        assert {r1, r2} == activity_gateway.get_upstream_activities(r3)
+        assert {r2} == activity_gateway.get_upstream_activities(r3, max_depth=1)
+        assert set() == activity_gateway.get_upstream_activities(r4)
+
+
+def test_activity_gateway_related_paths(dummy_database_injection_manager):
+    """Test activities are connected only through equal, parent or child paths."""
+    producer = create_dummy_activity(plan="producer", generations=["data/"])
+    child = create_dummy_activity(plan="child", usages=["data/raw/file"])
+    parent = create_dummy_activity(plan="parent", usages=["."])
+    sibling = create_dummy_activity(plan="sibling", usages=["database", "data0", "dat"])
+    nested = create_dummy_activity(plan="nested", usages=["other"], generations=["data/raw"])
+
+    with dummy_database_injection_manager(None):
+        activity_gateway = ActivityGateway()
+
+        activity_gateway.add(child)
+        activity_gateway.add(parent)
+        activity_gateway.add(sibling)
+        activity_gateway.add(producer)
+        activity_gateway.add(nested)
+
+        downstream = activity_gateway.get_downstream_activities(producer)
+        assert {child.id, parent.id} == {a.id for a in downstream}
+
+        downstream = activity_gateway.get_downstream_activities(nested)
+        assert {child.id, parent.id} == {a.id for a in downstream}
+
+        assert not activity_gateway.get_downstream_activities(sibling)
+
+
+def test_activity_gateway_cycle_detection(dummy_database_injection_manager):
+    """Test adding an activity that creates a cycle raises an error."""
+    r1 = create_dummy_activity(plan="r1", usages=["a"], generations=["b"])
+    r2 = create_dummy_activity(plan="r2", usages=["b"], generations=["c", "d"])
+    r3 = create_dummy_activity(plan="r3", usages=["d", "x"], generations=["e"])
+    cyclic = create_dummy_activity(plan="cyclic", usages=["e"], generations=["a"])
+    in_place = create_dummy_activity(plan="in_place", usages=["f"], generations=["f"])
+
+    with dummy_database_injection_manager(None):
+        activity_gateway = ActivityGateway()
+
+        activity_gateway.add(r1)
+        activity_gateway.add(r2)
+        activity_gateway.add(r3)
+
+        with pytest.raises(errors.GraphCycleError) as e:
+            activity_gateway.add(cyclic)
+
+        assert f"({cyclic.id}, a, {r1.id}, b, {r2.id}, d, {r3.id}, e)" in str(e.value)
+
+        with pytest.raises(errors.GraphCycleError):
+            activity_gateway.add(in_place)
+
+
+def test_activity_gateway_latest_activities_and_usage_checksums(dummy_database_injection_manager):
+    """Test indexing the latest activity of each set of outputs and checksums of their usages."""
+    now = datetime.utcnow()
+    usage = Usage(
+        id=Usage.generate_id("r2"), entity=Entity(id=Entity.generate_id("def", "a"), checksum="def", path="a")
+    )
+
+    r1 = create_dummy_activity(plan="r1", usages=["a"], generations=["b", "c"], ended_at_time=now - timedelta(hours=3))
+    latest = create_dummy_activity(plan="r1", usages=["a"], generations=["c", "b"], ended_at_time=now)
+    older = create_dummy_activity(plan="r1", usages=[usage], generations=["b", "c"], ended_at_time=now - timedelta(1))
+    r2 = create_dummy_activity(plan="r2", usages=[usage], generations=["d"], ended_at_time=now - timedelta(hours=2))
+
+    with dummy_database_injection_manager(None):
+        activity_gateway = ActivityGateway()
+
+        for activity in (r1, latest, older, r2):
+            activity_gateway.add(activity)
+
+        assert {latest.id, r2.id} == {a.id for a in activity_gateway.get_latest_activities_by_outputs()}
+        assert {"a": {"abc123", "def"}} == activity_gateway.get_usage_checksums()
+
+        r3 = create_dummy_activity(plan="r2", usages=["a", "e"], generations=["d"], ended_at_time=now)
+        activity_gateway.add(r3)
+
+        assert {latest.id, r3.id} == {a.id for a in activity_gateway.get_latest_activities_by_outputs()}
+        assert {"a": {"abc123"}, "e": {"abc123"}} == activity_gateway.get_usage_checksums()
+
+        activity_gateway.rebuild_indexes()
+
+        assert {latest.id, r3.id} == {a.id for a in activity_gateway.get_latest_activities_by_outputs()}
+        assert {"a": {"abc123"}, "e": {"abc123"}} == activity_gateway.get_usage_checksums()
@@ -22,10 +22,25 @@ from persistent import GHOST, UPTODATE
 from persistent.list import PersistentList
 from persistent.mapping import PersistentMapping
 
+from renku.core import errors
 from renku.domain_model.entity import Entity
 from renku.domain_model.provenance.activity import Activity, Usage
 from renku.domain_model.workflow.plan import Plan
-from renku.infrastructure.database import PERSISTED, Database
+from renku.infrastructure.database import (
+    PERSISTED,
+    BinaryCodec,
+    Database,
+    PackedStorage,
+    RevisionStorage,
+    Storage,
+    collect_garbage,
+    convert_storage,
+    pack_storage,
+    train_storage_dictionary,
+    unpack_storage,
+)
+from renku.infrastructure.gateway.database_gateway import initialize_database
+from renku.infrastructure.repository import Repository
 from tests.utils import create_dummy_activity
 
 
@@ -415,3 +430,480 @@ def test_database_immutable_object(database):
 
     assert isinstance(usage_1, Usage)
     assert usage_1 is usage_2
+
+
+@pytest.mark.parametrize("storage_class", [Storage, PackedStorage])
+def test_database_on_disk_storage(tmp_path, storage_class):
+    """Test storing and loading objects using on-disk storages."""
+    storage = storage_class(tmp_path)
+    database = Database(storage=storage)
+    initialize_database(database)
+
+    id = "/activities/42"
+    activity = create_dummy_activity(plan="p1", usages=["a"], generations=["b"], id=id)
+    database.get("activities").add(activity)
+    database.commit()
+
+    assert storage.exists(Database.hash_id(id))
+    assert storage.exists("root")
+    assert (PackedStorage.is_packed(tmp_path)) is (storage_class is PackedStorage)
+
+    new_database = Database.from_path(tmp_path)
+    activity = new_database["activities"][id]
+
+    assert id == activity.id
+    assert "a" == activity.usages[0].entity.path
+
+
+def test_packed_storage_overwrite_and_remove(tmp_path):
+    """Test later entries in a packed storage override earlier ones and removed objects cannot be loaded."""
+    storage = PackedStorage(tmp_path)
+
+    storage.store("object", {"value": 1})
+    assert {"value": 1} == storage.load("object")
+
+    storage.store("object", {"value": 2}, compress=True)
+    storage.store("other", {"value": 3})
+    assert {"value": 2} == storage.load("object")
+
+    storage.remove("object")
+
+    new_storage = PackedStorage(tmp_path)
+    assert not new_storage.exists("object")
+    assert {"value": 3} == new_storage.load("other")
+    with pytest.raises(errors.ObjectNotFoundError):
+        new_storage.load("object")
+
+
+def test_packed_storage_batch(tmp_path):
+    """Test writes in a batch are visible right away and are appended to the pack file when the batch ends."""
+    storage = PackedStorage(tmp_path)
+    storage.store("removed", {"value": 0})
+    size = storage.pack_path.stat().st_size
+
+    with storage.batch():
+        storage.store("object", {"value": 1})
+        storage.store("object", {"value": 2})
+        storage.remove("removed")
+
+        assert {"value": 2} == storage.load("object")
+        assert not storage.exists("removed")
+        assert ["object"] == storage.filenames()
+        assert not PackedStorage(tmp_path).exists("object")
+
+    new_storage = PackedStorage(tmp_path)
+    assert {"value": 2} == new_storage.load("object")
+    assert not new_storage.exists("removed")
+    # NOTE: Only the last version of an object in a batch is written
+    assert size + len(new_storage.load_raw("object")) == new_storage.pack_path.stat().st_size
+
+
+def test_packed_storage_batch_failure(tmp_path):
+    """Test writes of a batch that raised are discarded."""
+    storage = PackedStorage(tmp_path)
+    storage.store("object", {"value": 1})
+
+    with pytest.raises(ValueError):
+        with storage.batch():
+            storage.store("object", {"value": 2})
+            storage.store("other", {"value": 3})
+            raise ValueError
+
+    new_storage = PackedStorage(tmp_path)
+    assert {"value": 1} == new_storage.load("object")
+    assert not new_storage.exists("other")
+    assert {"value": 1} == storage.load("object")
+
+
+def test_packed_storage_repack_ignores_leftovers(tmp_path):
+    """Test repacking discards files of an interrupted previous repack."""
+    storage = PackedStorage(tmp_path)
+    storage.store("object", {"value": 1})
+    storage.store("removed", {"value": 2})
+
+    leftover = PackedStorage(tmp_path / ".packing")
+    leftover.store_raw("removed", storage.load_raw("removed"))
+    storage.remove("removed")
+
+    assert 1 == storage.repack()
+
+    assert ["object"] == PackedStorage(tmp_path).filenames()
+    assert not (tmp_path / ".packing").exists()
+
+
+def test_packed_storage_repack_if_needed(tmp_path, monkeypatch):
+    """Test the pack file is rewritten at the end of a batch when most of its data is outdated."""
+    monkeypatch.setattr(PackedStorage, "REPACK_MIN_SIZE", 0)
+    storage = PackedStorage(tmp_path)
+
+    with storage.batch():
+        storage.store("object", {"value": "a" * 100})
+        storage.store("other", {"value": 1})
+    size = storage.pack_path.stat().st_size
+
+    assert not storage.repack_if_needed()
+
+    for _ in range(2):
+        with storage.batch():
+            storage.store("object", {"value": "b" * 100})
+
+    assert size == storage.pack_path.stat().st_size
+    assert {"other", "object"} == set(PackedStorage(tmp_path).filenames())
+    assert {"value": "b" * 100} == storage.load("object")
+    assert {"value": 1} == storage.load("other")
+
+
+def test_pack_and_unpack_storage(tmp_path):
+    """Test converting a storage to packed format and back."""
+    database = Database(storage=Storage(tmp_path))
+    initialize_database(database)
+    ids = [f"/activities/{i}" for i in range(10)]
+    for id in ids:
+        database.get("activities").add(create_dummy_activity(plan="p1", id=id))
+    database.commit()
+    filenames = set(Storage(tmp_path).filenames())
+
+    assert len(filenames) == pack_storage(tmp_path)
+
+    assert PackedStorage.is_packed(tmp_path)
+    assert set(PackedStorage.FILENAMES) == {f.name for f in tmp_path.iterdir()}
+    assert set(ids) == set(Database.from_path(tmp_path)["activities"].keys())
+
+    assert len(filenames) == unpack_storage(tmp_path)
+
+    assert not PackedStorage.is_packed(tmp_path)
+    assert filenames == set(Storage(tmp_path).filenames())
+    assert set(ids) == set(Database.from_path(tmp_path)["activities"].keys())
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_convert_storage_codec(tmp_path, packed):
+    """Test re-encoding a storage with a binary codec and back."""
+    database = Database(storage=Storage(tmp_path))
+    initialize_database(database)
+    ids = [f"/activities/{i}" for i in range(10)]
+    for id in ids:
+        database.get("activities").add(create_dummy_activity(plan="p1", id=id))
+    database.commit()
+    filenames = set(Storage(tmp_path).filenames())
+    if packed:
+        pack_storage(tmp_path)
+
+    assert len(filenames) == convert_storage(tmp_path, codec="msgpack")
+
+    database = Database.from_path(tmp_path)
+    storage = database._storage
+
+    assert isinstance(storage.codec, BinaryCodec)
+    assert filenames == set(storage.filenames())
+    assert all(storage._decode(storage.load_raw(f)) for f in filenames)
+    assert BinaryCodec.MAGIC == storage.load_raw("root")[: len(BinaryCodec.MAGIC)]
+    assert set(ids) == set(database["activities"].keys())
+
+    # NOTE: New objects are stored with the selected codec and can be read along with existing JSON objects
+    database.get("activities").add(create_dummy_activity(plan="p1", id="/activities/new"))
+    database.commit()
+    convert_storage(tmp_path, codec="json")
+
+    database = Database.from_path(tmp_path)
+
+    assert not (tmp_path / Storage.CODEC_FILENAME).exists()
+    assert b"{" == database._storage.load_raw("root")[:1]
+    assert {*ids, "/activities/new"} == set(database["activities"].keys())
+    assert "p1" == database.get_by_id("/activities/new").association.plan.name
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_train_storage_dictionary(tmp_path, packed):
+    """Test compressing objects with a trained zstd dictionary."""
+    database = Database(storage=Storage(tmp_path))
+    initialize_database(database)
+    ids = [f"/activities/{i}" for i in range(100)]
+    for id in ids:
+        database.get("activities").add(create_dummy_activity(plan="p1", id=id))
+    database.commit()
+    if packed:
+        pack_storage(tmp_path)
+
+    # NOTE: Keep an object that is compressed without a dictionary
+    storage = Database.from_path(tmp_path)._storage
+    old_object = next(f for f in storage.filenames() if storage._is_compressed(storage.load_raw(f)))
+    old_data = storage.load_raw(old_object)
+
+    assert 0 < train_storage_dictionary(tmp_path, dictionary_size=4096)
+
+    database = Database.from_path(tmp_path)
+    storage = database._storage
+    dictionary_id = Storage.get_dictionary_id(tmp_path)
+
+    assert 0 != dictionary_id
+    assert (tmp_path / Storage.DICTIONARIES_DIRECTORY / str(dictionary_id)).exists()
+    assert len(storage.load_raw(old_object)) < len(old_data)
+    assert set(ids) == set(database["activities"].keys())
+    assert {"p1"} == {database.get_by_id(id).association.plan.name for id in ids}
+
+    storage.store_raw(old_object, old_data)
+    database.get("activities").add(create_dummy_activity(plan="p2", id="/activities/new"))
+    database.commit()
+
+    database = Database.from_path(tmp_path)
+
+    assert storage._decode(old_data) == database._storage.load(old_object)
+    assert "p2" == database.get_by_id("/activities/new").association.plan.name
+
+
+def test_train_storage_dictionary_without_enough_data(tmp_path):
+    """Test training a dictionary fails when there are not enough objects."""
+    database = Database(storage=Storage(tmp_path))
+    initialize_database(database)
+    database.commit()
+
+    with pytest.raises(errors.OperationError):
+        train_storage_dictionary(tmp_path)
+
+    assert 0 == Storage.get_dictionary_id(tmp_path)
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_collect_garbage(tmp_path, packed):
+    """Test removing objects that cannot be reached from the root object."""
+    database = Database(storage=Storage(tmp_path))
+    initialize_database(database)
+    ids = [f"/activities/{i}" for i in range(10)]
+    for id in ids:
+        database.get("activities").add(create_dummy_activity(plan="p1", id=id))
+    # NOTE: Previous versions of a plan are only reachable through the new version's ``derived_from``
+    database.add(Plan(id="/plans/old", name="old", command="echo"))
+    database.get("plans").add(Plan(id="/plans/new", name="new", command="echo", derived_from="/plans/old"))
+    database.add(Plan(id="/plans/orphan", name="orphan", command="echo"))
+    database.commit()
+    orphan = Database.hash_id("/plans/orphan")
+    if packed:
+        pack_storage(tmp_path)
+    filenames = set(Database.from_path(tmp_path)._storage.filenames())
+
+    assert [orphan] == collect_garbage(tmp_path, dry_run=True)
+    assert filenames == set(Database.from_path(tmp_path)._storage.filenames())
+
+    assert [orphan] == collect_garbage(tmp_path, repack=packed)
+
+    database = Database.from_path(tmp_path)
+
+    assert filenames - {orphan} == set(database._storage.filenames())
+    assert set(ids) == set(database["activities"].keys())
+    assert "old" == database.get_by_id(database["plans"].get("/plans/new").derived_from).name
+    assert [] == collect_garbage(tmp_path)
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_database_from_revision(tmp_path, packed):
+    """Test opening a read-only database with the state of a git revision."""
+    repository = Repository.initialize(tmp_path)
+    path = tmp_path / "metadata"
+    database = Database(storage=Storage(path))
+    initialize_database(database)
+    database.get("activities").add(create_dummy_activity(plan="p1", id="/activities/old"))
+    database.commit()
+    if packed:
+        pack_storage(path)
+    repository.add(all=True)
+    repository.commit("old")
+
+    database = Database.from_path(path)
+    database.get("activities").add(create_dummy_activity(plan="p2", id="/activities/new"))
+    database.commit()
+    repository.add(all=True)
+    repository.commit("new")
+    # NOTE: Changes in the working tree don't affect a database that's opened from a revision
+    database.get("activities").add(create_dummy_activity(plan="p3", id="/activities/uncommitted"))
+    database.commit()
+
+    old_database = Database.from_revision(path, repository=repository, revision="HEAD~")
+    new_database = Database.from_revision(path, repository=repository, revision="HEAD")
+
+    assert isinstance(old_database._storage, RevisionStorage)
+    assert packed == old_database._storage.is_packed()
+    assert {"/activities/old"} == set(old_database["activities"].keys())
+    assert {"/activities/old", "/activities/new"} == set(new_database["activities"].keys())
+    assert "p2" == new_database.get_by_id("/activities/new").association.plan.name
+    assert set(Database.from_path(path)._storage.filenames()) > set(new_database._storage.filenames())
+
+    with pytest.raises(errors.OperationError):
+        new_database._storage.store(filename="root", data={})
+
+
+def test_database_statistics(tmp_path):
+    """Test database operations are counted."""
+    database = Database(storage=Storage(tmp_path))
+    initialize_database(database)
+    ids = [f"/activities/{i}" for i in range(10)]
+    for id in ids:
+        database.get("activities").add(create_dummy_activity(plan="p1", id=id))
+    database.commit()
+
+    statistics = database.statistics.as_dict()
+
+    assert 0 < statistics["objects_stored"]
+    assert 0 < statistics["bytes_written"]
+    assert 0 < statistics["commit_time"]
+    assert "objects_loaded" not in statistics
+
+    database = Database.from_path(tmp_path)
+    for id in ids:
+        database.get_by_id(id)
+    database.get_by_id(ids[0])
+
+    statistics = database.statistics.as_dict()
+
+    assert 0 < statistics["objects_loaded"]
+    assert 0 < statistics["bytes_read"]
+    assert statistics["bytes_read"] < statistics["bytes_decompressed"]
+    assert 1 <= statistics["cache_hits"]
+    assert 0 < statistics["deserialize_time"]
+    assert "objects_stored" not in statistics
+    assert "objects_loaded: " in database.statistics.format()
+
+
+def test_database_cache_eviction(database):
+    """Test least-recently used objects are turned into ghosts when the cache is full and reloaded on access."""
+    database, storage = database
+    ids = [f"/activities/{i}" for i in range(20)]
+    for id in ids:
+        database.get("activities").add(create_dummy_activity(plan="p1", id=id))
+    database.commit()
+
+    new_database = Database(storage=storage, cache_size=5)
+    activities = [new_database.get_by_id(id) for id in ids]
+
+    assert 5 >= sum(1 for a in activities if a._p_state == UPTODATE)
+    assert GHOST == activities[0]._p_state
+    assert UPTODATE == activities[-1]._p_state
+
+    # NOTE: Evicted objects are reactivated on access and keep their identity
+    assert ids[0] == activities[0].id
+    assert activities[0] is new_database.get_by_id(ids[0])
+    assert activities[0].immutable
+
+
+def test_database_cache_does_not_evict_modified_objects(database):
+    """Test modified objects are not evicted from the cache."""
+    database, storage = database
+    ids = [f"/activities/{i}" for i in range(20)]
+    for id in ids:
+        database.get("activities").add(create_dummy_activity(plan="p1", id=id))
+    database.commit()
+
+    new_database = Database(storage=storage, cache_size=5)
+    activity = new_database.get_by_id(ids[0])
+    activity.unfreeze()
+    activity.ended_at_time = activity.started_at_time
+
+    for id in ids[1:]:
+        new_database.get_by_id(id)
+
+    assert activity._p_changed
+    assert activity.started_at_time == activity.ended_at_time
+
+
+def test_database_prefetch(database):
+    """Test loading multiple ghost objects at once."""
+    database, storage = database
+    ids = [f"/activities/{i}" for i in range(2 * Database.PREFETCH_BATCH_SIZE + 1)]
+    for id in ids:
+        database.get("activities").add(create_dummy_activity(plan="p1", id=id))
+    database.commit()
+
+    new_database = Database(storage=storage)
+    activities = list(new_database["activities"].values())
+
+    assert {GHOST} == {a._p_state for a in activities}
+
+    prefetched = new_database.prefetch(activities)
+
+    assert activities == prefetched
+    assert {UPTODATE} == {a._p_state for a in activities}
+    assert set(ids) == {a.id for a in activities}
+    assert not new_database._prefetched
+
+
+def test_database_prefetch_more_than_cache_size(database):
+    """Test prefetched objects aren't evicted while they are used even if there are more of them than the cache size."""
+    database, storage = database
+    ids = [f"/activities/{i}" for i in range(2 * Database.PREFETCH_BATCH_SIZE + 1)]
+    for id in ids:
+        database.get("activities").add(create_dummy_activity(plan="p1", id=id))
+    database.commit()
+
+    new_database = Database(storage=storage, cache_size=10)
+    activities = list(new_database["activities"].values())
+    loaded_before = new_database.statistics.as_dict().get("objects_loaded", 0)
+
+    prefetched = new_database.prefetch(activities, pin=True)
+
+    assert len(ids) == new_database.statistics.as_dict()["objects_loaded"] - loaded_before
+
+    # NOTE: Loading other objects trims the cache
+    _ = [a.association.plan.name for a in prefetched]
+    loaded_before = new_database.statistics.as_dict()["objects_loaded"]
+
+    assert {UPTODATE} == {a._p_state for a in activities}
+    assert set(ids) == {a.id for a in prefetched}
+    assert loaded_before == new_database.statistics.as_dict()["objects_loaded"]
+
+    del prefetched
+    new_database.get_by_id(ids[0])
+    new_database.commit()
+
+    assert 10 >= sum(1 for a in activities if a._p_state == UPTODATE)
+
+
+def test_database_prefetch_without_pinning(database):
+    """Test objects prefetched without pinning are evicted once the cache is full."""
+    database, storage = database
+    ids = [f"/activities/{i}" for i in range(2 * Database.PREFETCH_BATCH_SIZE + 1)]
+    for id in ids:
+        database.get("activities").add(create_dummy_activity(plan="p1", id=id))
+    database.commit()
+
+    new_database = Database(storage=storage, cache_size=10)
+    activities = list(new_database["activities"].values())
+
+    prefetched = new_database.prefetch(activities)
+
+    assert Database.PREFETCH_BATCH_SIZE + 10 >= sum(1 for a in activities if a._p_state == UPTODATE)
+    assert set(ids) == {a.id for a in prefetched}
+
+
+def test_database_get_many(database):
+    """Test loading multiple objects by their oids at once."""
+    database, storage = database
+    ids = [f"/activities/{i}" for i in range(2 * Database.PREFETCH_BATCH_SIZE + 1)]
+    for id in ids:
+        database.get("activities").add(create_dummy_activity(plan="p1", id=id))
+    database.commit()
+
+    new_database = Database(storage=storage)
+    oids = [Database.hash_id(id) for id in ids]
+
+    objects = new_database.get_many(oids + oids[:2])
+
+    assert ids + ids[:2] == [o.id for o in objects]
+    assert objects[0] is new_database.get(oids[0])
+    assert not new_database._prefetched
+
+
+def test_database_get_many_more_than_cache_size(database):
+    """Test objects loaded by get_many aren't evicted before they are returned."""
+    database, storage = database
+    ids = [f"/activities/{i}" for i in range(2 * Database.PREFETCH_BATCH_SIZE + 1)]
+    for id in ids:
+        database.get("activities").add(create_dummy_activity(plan="p1", id=id))
+    database.commit()
+
+    new_database = Database(storage=storage, cache_size=10)
+    loaded_before = new_database.statistics.as_dict().get("objects_loaded", 0)
+    objects = new_database.get_many((Database.hash_id(id) for id in ids), pin=True)
+
+    assert {UPTODATE} == {o._p_state for o in objects}
+    assert ids == [o.id for o in objects]
+    assert len(ids) == new_database.statistics.as_dict()["objects_loaded"] - loaded_before
@@ -77,3 +77,24 @@ def test_plan_gateway_newest_plans(dummy_database_injection_manager, database):
         }
 
         assert {plan2.id, invalidated_plan2.id} == newest_plans_by_names_with_invalidated
+
+
+def test_plan_gateway_derived_plans(dummy_database_injection_manager):
+    """Test getting plans that are derived from a plan."""
+    plan = Plan(id=Plan.generate_id(), name="plan", command="")
+    derived = plan.derive()
+    latest = derived.derive()
+    other = Plan(id=Plan.generate_id(), name="other", command="")
+
+    with dummy_database_injection_manager(None):
+        plan_gateway = PlanGateway()
+
+        for p in (plan, derived, latest, other):
+            plan_gateway.add(p)
+
+        assert derived == plan_gateway.get_derivative(plan.id)
+        assert plan_gateway.get_derivative(latest.id) is None
+
+        assert latest == plan_gateway.get_latest_descendant(plan)
+        assert latest == plan_gateway.get_latest_descendant(latest)
+        assert other == plan_gateway.get_latest_descendant(other)
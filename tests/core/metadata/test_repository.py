@@ -16,12 +16,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Test Repository."""
+import json
+import os
+import time
 from pathlib import Path
 
 import pytest
 
+import renku.infrastructure.repository as repository_module
 from renku.core import errors
-from renku.infrastructure.repository import Repository
+from renku.infrastructure.repository import Diff, Repository
 
 FIRST_COMMIT_SHA = "d44be0700e7ad1d062544763fd55c6ccb6f456e1"
 LAST_COMMIT_SHA = "8853e0c1112e512c36db9cc76faff560b655e5d5"  # HEAD
@@ -229,6 +233,161 @@ def test_hash_directories(git_repository):
         Repository.hash_object("X")
 
 
+@pytest.mark.parametrize("revision", ["HEAD", "HEAD~"])
+def test_get_object_hashes_in_revision(git_repository, monkeypatch, revision):
+    """Test getting hashes of objects in a revision with and without the long-running cat-file process."""
+    monkeypatch.chdir(git_repository.path)
+    paths = ["A", "B", "data/X", "missing"]
+
+    def rev_parse(path):
+        try:
+            return git_repository.run_git_command("rev-parse", f"{revision}:{path}")
+        except errors.GitCommandError:
+            return None
+
+    expected = {path: rev_parse(path) for path in paths}
+
+    assert expected == git_repository.get_object_hashes(paths, revision=revision)
+    assert expected == {path: git_repository.get_object_hash(path, revision=revision) for path in paths}
+    assert {p for p, h in expected.items() if h} == set(git_repository.get_existing_paths_in_revision(paths, revision))
+
+    monkeypatch.setattr(Repository, "_get_object_header", lambda *_, **__: repository_module._MARKER)
+
+    assert expected == git_repository.get_object_hashes(paths, revision=revision)
+    assert expected == {path: git_repository.get_object_hash(path, revision=revision) for path in paths}
+
+
+def test_hash_objects_with_checksum_cache(git_repository):
+    """Test hashes of unmodified files in the working tree are cached."""
+    path = git_repository.path / "A"
+    path.write_text("modified")
+    # NOTE: Hashes of recently-modified files are not cached
+    os.utime(path, ns=(time.time_ns() - 10**10, time.time_ns() - 10**10))
+
+    modified_object_hash = "d84012fbd8415354de6b29158b6e5e17c4fda70b"
+
+    assert modified_object_hash == git_repository.get_object_hash("A")
+
+    cache_path = git_repository.checksum_cache.path
+    cache = json.loads(cache_path.read_text())
+
+    assert modified_object_hash == cache["entries"]["A"][-1]
+
+    cache["entries"]["A"][-1] = "cached-hash"
+    cache_path.write_text(json.dumps(cache))
+    git_repository._checksum_cache = None
+
+    assert "cached-hash" == git_repository.get_object_hash("A")
+    assert {"A": "cached-hash"} == git_repository.get_object_hashes(["A"])
+
+    path.write_text("changed")
+
+    assert Repository.hash_object(path) == git_repository.get_object_hash("A")
+    assert "A" not in json.loads(cache_path.read_text())["entries"]
+
+
+def test_checksum_cache_with_lfs(git_repository):
+    """Test cached hashes are discarded when files are tracked in Git LFS."""
+    path = git_repository.path / "A"
+    path.write_text("modified")
+    os.utime(path, ns=(time.time_ns() - 10**10, time.time_ns() - 10**10))
+
+    object_hash = git_repository.get_object_hash("A")
+
+    git_repository.run_git_command("lfs", "install", "--local")
+    git_repository.run_git_command("lfs", "track", "A")
+    git_repository.invalidate_checksum_cache()
+
+    lfs_object_hash = git_repository.get_object_hash("A")
+
+    assert object_hash != lfs_object_hash
+    assert Repository.hash_object(path) == lfs_object_hash
+
+    # NOTE: A new cache for the same repository sees the change as well
+    git_repository._checksum_cache = None
+
+    assert lfs_object_hash == git_repository.get_object_hash("A")
+
+
+def test_checksum_cache_prunes_deleted_files(git_repository):
+    """Test hashes of deleted files are removed from the checksum cache."""
+    for name in ("A", "C"):
+        path = git_repository.path / name
+        path.write_text(f"modified {name}")
+        os.utime(path, ns=(time.time_ns() - 10**10, time.time_ns() - 10**10))
+
+    git_repository.get_object_hashes(["A", "C"])
+    cache_path = git_repository.checksum_cache.path
+
+    assert {"A", "C"} <= set(json.loads(cache_path.read_text())["entries"])
+
+    (git_repository.path / "C").unlink()
+    git_repository._checksum_cache = None
+    (git_repository.path / "A").write_text("changed")
+    os.utime(git_repository.path / "A", ns=(time.time_ns() - 10**10, time.time_ns() - 10**10))
+    git_repository.get_object_hash("A")
+
+    entries = json.loads(cache_path.read_text())["entries"]
+    assert "A" in entries
+    assert "C" not in entries
+
+
+def test_get_status(git_repository):
+    """Test a status snapshot has the same changes as the repository and is invalidated by repository changes."""
+    (git_repository.path / "A").write_text("modified")
+    (git_repository.path / "G").unlink()
+    (git_repository.path / "new").write_text("new")
+    (git_repository.path / "staged").write_text("staged")
+    git_repository.add("staged")
+    git_repository.move("data/X", destination="data/Y")
+
+    status = git_repository.get_status()
+
+    assert set(git_repository.staged_changes) == set(status.staged_changes)
+    assert set(git_repository.unstaged_changes) == set(status.unstaged_changes)
+    assert set(git_repository.untracked_files) == set(status.untracked_files)
+    assert status is git_repository.get_status()
+
+    git_repository.add("new")
+
+    assert status is not git_repository.get_status()
+    assert set(git_repository.staged_changes) == set(git_repository.get_status().staged_changes)
+    assert [] == git_repository.get_status().untracked_files
+
+
+def test_iterate_changes(git_repository):
+    """Test listing changes of a range of commits with a single call."""
+    expected = set()
+    for commit in git_repository.iterate_commits(revision="HEAD"):
+        parent = commit.parents[0].hexsha if commit.parents else None
+        for change in commit.get_changes():
+            if change.change_type == "R":
+                expected.add((commit.hexsha, parent, Diff(a_path=change.a_path, b_path=change.a_path, change_type="D")))
+                expected.add((commit.hexsha, parent, Diff(a_path=change.b_path, b_path=change.b_path, change_type="A")))
+            else:
+                expected.add((commit.hexsha, parent, change))
+
+    assert expected == set(git_repository.iterate_changes(revision="HEAD"))
+
+    head = git_repository.head.commit.hexsha
+    assert {c for c in expected if c[0] == head and c[2].a_path.startswith("data")} == set(
+        git_repository.iterate_changes("data", revision="HEAD", no_walk=True)
+    )
+    assert [] == list(git_repository.iterate_changes(revision="HEAD..HEAD~"))
+
+
+def test_get_status_after_copying_content(git_repository):
+    """Test files that are restored from the object database appear in the status."""
+    status = git_repository.get_status()
+    checksum = git_repository.get_object_hash("A", revision="HEAD")
+
+    with open(git_repository.path / "restored", "wb") as output_file:
+        git_repository.copy_content_to_file("A", checksum=checksum, output_file=output_file)
+
+    assert "restored" not in status.untracked_files
+    assert "restored" in git_repository.get_status().untracked_files
+
+
 def test_get_user_with_quotation_mark(git_repository):
     """Test quotation marks wrapping user/email are ignored."""
     config = git_repository.get_configuration(writable=True)
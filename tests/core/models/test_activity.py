@@ -17,15 +17,17 @@
 # limitations under the License.
 """Test Activity."""
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import MagicMock
 from uuid import uuid4
 
+from renku.core.util.metadata import add_activity_if_recent
 from renku.domain_model.entity import Entity
 from renku.domain_model.provenance.activity import Activity
 from renku.domain_model.provenance.agent import Person
 from renku.domain_model.workflow.parameter import CommandInput, CommandOutput, CommandParameter
 from renku.domain_model.workflow.plan import Plan
+from tests.utils import create_dummy_activity
 
 
 def test_activity_parameter_values(mocker):
@@ -143,3 +145,24 @@ def test_activity_parameter_values(mocker):
     assert applied_plan.outputs[3].actual_value == po4.value
     assert applied_plan.parameters[0].actual_value == pp1.value
     assert applied_plan.parameters[3].actual_value == pp4.value
+
+
+def test_add_activity_if_recent():
+    """Test only the latest activity of a plan with the same inputs and outputs is kept."""
+    plan = Plan(id=Plan.generate_id(), name="plan", command="")
+    now = datetime.utcnow()
+
+    old = create_dummy_activity(plan=plan, usages=["a", "b"], generations=["c"], ended_at_time=now - timedelta(1))
+    latest = create_dummy_activity(plan=plan, usages=["b", "a"], generations=["c"], ended_at_time=now)
+    other = create_dummy_activity(plan=plan, usages=["a"], generations=["c"], ended_at_time=now - timedelta(2))
+    other_plan = create_dummy_activity(plan="other", usages=["a", "b"], generations=["c"], ended_at_time=now)
+
+    assert latest.signature == (("a", "b"), ("c",))
+    assert latest.has_identical_inputs_and_outputs_as(old)
+    assert not latest.has_identical_inputs_and_outputs_as(other)
+
+    activities = {}
+    for activity in (latest, old, other, other_plan, latest):
+        add_activity_if_recent(activity=activity, activities=activities)
+
+    assert {latest, other, other_plan} == set(activities.values())
@@ -18,8 +18,12 @@
 """Test various utilities."""
 
 import os
+import sys
+
+import pytest
 
 from renku.core.errors import ParameterError
+from renku.core.util.os import call_with_resource_usage
 from renku.core.util.scm import shorten_message
 from renku.core.util.urls import get_host
 from tests.utils import raises
@@ -85,3 +89,16 @@ def test_shorten_message():
         shorten_message(short_message, -1)
     with raises(ParameterError):
         shorten_message(short_message, max_line, -1)
+
+
+@pytest.mark.skipif(not hasattr(os, "wait4"), reason="Resource usage isn't reported on this platform")
+def test_call_with_resource_usage():
+    """Test exit code, CPU time and peak memory of a command are reported."""
+    script = "data = bytearray(64 * 1024 * 1024); sum(range(10 ** 6)); raise SystemExit(3)"
+    command = [sys.executable, "-S", "-c", script]
+
+    exit_code, cpu_time, peak_memory = call_with_resource_usage(command)
+
+    assert 3 == exit_code
+    assert cpu_time > 0
+    assert peak_memory >= 64 * 1024 * 1024